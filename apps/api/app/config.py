@@ -12,10 +12,42 @@ class Settings(BaseSettings):
     supabase_key: str
     supabase_service_key: str
 
+    # DB connection pool (PostgREST over HTTP/2)
+    db_http2: bool = True
+    db_pool_max_connections: int = 100
+    db_pool_max_keepalive: int = 20
+
     # JWT
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    password_hash_workers: int = 4  # bcrypt 전용 스레드 수 (동시 로그인 처리량 상한)
+
+    # Identity cache (인증 사용자/기업 멤버/프로필 ID 조회)
+    identity_cache_ttl_seconds: int = 60
+    identity_cache_max_entries: int = 10000
+
+    # Real-time (pub/sub backend: "memory" 또는 "postgres" — 여러 워커가 공유하려면 postgres)
+    pubsub_backend: str = "memory"
+    pubsub_database_url: str = ""
+
+    # Test catalog cache
+    test_catalog_ttl_seconds: int = 600
+
+    # 검사 응답 버퍼 (완료 시 응답을 DB에서 다시 읽지 않고 채점)
+    answer_buffer_ttl_seconds: int = 7200
+    answer_buffer_max_sessions: int = 20000
+
+    # Admin (운영용 엔드포인트 키 — 비어 있으면 비활성화)
+    admin_api_key: str = ""
+
+    # Matching
+    seeker_store_ttl_seconds: int = 300
+    job_store_ttl_seconds: int = 300  # 구직자별 추천 공고용 활성 공고 행렬
+    fit_cache_max_jobs: int = 128  # 구직자 전체 점수를 보관할 공고 수 (공고당 구직자 수 × 8바이트)
+    # 매칭 점수 입력 캐시 (기업 culture_tags, 공고 요구 능력치/조건)
+    fit_input_cache_ttl_seconds: int = 300
+    fit_input_cache_max_entries: int = 10000
 
     # AI
     openai_api_key: str = ""
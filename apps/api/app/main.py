@@ -1,18 +1,32 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.services.pubsub import start_pubsub, close_pubsub
+from app.services.supabase_client import close_supabase
 from app.routers import (
     auth, tests, results, abilities, reports, payments,
     company_auth, companies, seekers, jobs, matching, applications, messages,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_pubsub()
+    yield
+    await close_pubsub()
+    await close_supabase()
+
+
 app = FastAPI(
     title=settings.app_name,
     description="14가지 성격/심리 검사를 통합하여 30개 능력치 스탯을 산출하는 종합 인재 평가 플랫폼 API",
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS
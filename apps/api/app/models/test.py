@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Any
 from datetime import datetime
 from uuid import UUID
@@ -82,6 +82,18 @@ class TestSubmit(BaseModel):
     answers: list[Response]
 
 
+class AnswerBatch(BaseModel):
+    """검사 진행 중 한 개 또는 소수의 답변 제출"""
+    answers: list[Response] = Field(min_length=1, max_length=50)
+
+
+class SessionProgress(BaseModel):
+    session_id: UUID
+    answered: int
+    total_questions: int
+    provisional_scores: dict[str, Any]
+
+
 class TestResult(BaseModel):
     id: UUID
     session_id: UUID
@@ -3,7 +3,11 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from app.models.ability import AllAbilitiesResponse
-from app.services.ability_service import get_user_abilities, calculate_abilities
+from app.services.ability_service import (
+    get_user_abilities,
+    calculate_abilities,
+    get_abilities_summary,
+)
 from app.routers.auth import get_current_user
 
 router = APIRouter()
@@ -23,7 +27,7 @@ async def get_radar_data(
     current_user: Annotated[dict, Depends(get_current_user)],
 ) -> AllAbilitiesResponse:
     """레이더 차트 데이터 조회"""
-    return await calculate_abilities(current_user["id"])
+    return await get_abilities_summary(current_user["id"])
 
 
 @router.post("/calculate")
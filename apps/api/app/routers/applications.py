@@ -3,7 +3,7 @@ from typing import Annotated, Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_seeker_profile_id
 from app.routers.company_auth import get_current_company_member
 from app.services.supabase_client import get_supabase
 
@@ -60,25 +60,18 @@ class NoteCreate(BaseModel):
 @router.post("/")
 async def create_application(
     data: ApplicationCreate,
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         raise HTTPException(status_code=400, detail="Seeker profile required")
 
     match = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("*")
         .eq("id", data.match_id)
-        .eq("seeker_profile_id", profile.data["id"])
+        .eq("seeker_profile_id", seeker_profile_id)
         .single()
         .execute()
     )
@@ -87,7 +80,7 @@ async def create_application(
 
     # 중복 지원 방지
     existing = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select("id")
         .eq("match_id", data.match_id)
         .eq("job_posting_id", data.job_posting_id)
@@ -98,13 +91,13 @@ async def create_application(
 
     insert_data = {
         "match_id": data.match_id,
-        "seeker_profile_id": profile.data["id"],
+        "seeker_profile_id": seeker_profile_id,
         "job_posting_id": data.job_posting_id,
         "company_id": match.data["company_id"],
         "stage": "applied",
     }
 
-    result = supabase.table("applications").insert(insert_data).execute()
+    result = await supabase.table("applications").insert(insert_data).execute()
 
     if not result.data:
         raise HTTPException(status_code=500, detail="Failed to create application")
@@ -114,24 +107,17 @@ async def create_application(
 
 @router.get("/seeker")
 async def list_seeker_applications(
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         return []
 
     result = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select("*, job_postings(title, companies(name, logo_url)), matches(fit_score)")
-        .eq("seeker_profile_id", profile.data["id"])
+        .eq("seeker_profile_id", seeker_profile_id)
         .order("applied_at", desc=True)
         .execute()
     )
@@ -158,7 +144,7 @@ async def list_company_applications(
     if stage:
         query = query.eq("stage", stage)
 
-    result = query.order("applied_at", desc=True).execute()
+    result = await query.order("applied_at", desc=True).execute()
     return result.data or []
 
 
@@ -167,7 +153,7 @@ async def get_application(app_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select(
             "*, seeker_profiles(*, users(name, email)), "
             "job_postings(*, companies(name)), "
@@ -196,7 +182,7 @@ async def update_application_stage(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select("id")
         .eq("id", app_id)
         .eq("company_id", current_member["company_id"])
@@ -206,7 +192,7 @@ async def update_application_stage(
         raise HTTPException(status_code=404, detail="Application not found")
 
     result = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .update({"stage": data.stage})
         .eq("id", app_id)
         .execute()
@@ -226,7 +212,7 @@ async def create_interview(
     supabase = get_supabase()
 
     app = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select("id")
         .eq("id", app_id)
         .eq("company_id", current_member["company_id"])
@@ -246,10 +232,10 @@ async def create_interview(
         "notes": data.notes,
     }
 
-    result = supabase.table("interviews").insert(insert_data).execute()
+    result = await supabase.table("interviews").insert(insert_data).execute()
 
     # 자동으로 stage 업데이트
-    supabase.table("applications").update({"stage": "interview_scheduled"}).eq("id", app_id).execute()
+    await supabase.table("applications").update({"stage": "interview_scheduled"}).eq("id", app_id).execute()
 
     return result.data[0] if result.data else {}
 
@@ -259,7 +245,7 @@ async def list_interviews(app_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("interviews")
+        await supabase.table("interviews")
         .select("*, evaluations(*)")
         .eq("application_id", app_id)
         .order("round")
@@ -282,7 +268,7 @@ async def update_interview(
         raise HTTPException(status_code=400, detail="No data to update")
 
     result = (
-        supabase.table("interviews")
+        await supabase.table("interviews")
         .update(update_data)
         .eq("id", interview_id)
         .execute()
@@ -311,7 +297,7 @@ async def create_evaluation(
         "recommendation": data.recommendation,
     }
 
-    result = supabase.table("evaluations").insert(insert_data).execute()
+    result = await supabase.table("evaluations").insert(insert_data).execute()
 
     return result.data[0] if result.data else {}
 
@@ -332,7 +318,7 @@ async def create_application_note(
         "content": data.content,
     }
 
-    result = supabase.table("application_notes").insert(insert_data).execute()
+    result = await supabase.table("application_notes").insert(insert_data).execute()
 
     return result.data[0] if result.data else {}
 
@@ -345,7 +331,7 @@ async def list_application_notes(
     supabase = get_supabase()
 
     result = (
-        supabase.table("application_notes")
+        await supabase.table("application_notes")
         .select("*, company_members(name)")
         .eq("application_id", app_id)
         .order("created_at", desc=True)
@@ -365,7 +351,7 @@ async def send_offer(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select("id")
         .eq("id", app_id)
         .eq("company_id", current_member["company_id"])
@@ -375,7 +361,7 @@ async def send_offer(
         raise HTTPException(status_code=404, detail="Application not found")
 
     result = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .update({"stage": "offer"})
         .eq("id", app_id)
         .execute()
@@ -392,7 +378,7 @@ async def confirm_hire(
     supabase = get_supabase()
 
     app = (
-        supabase.table("applications")
+        await supabase.table("applications")
         .select("*, matches(id)")
         .eq("id", app_id)
         .eq("company_id", current_member["company_id"])
@@ -403,15 +389,15 @@ async def confirm_hire(
         raise HTTPException(status_code=404, detail="Application not found")
 
     # 지원 상태 업데이트
-    supabase.table("applications").update({"stage": "hired"}).eq("id", app_id).execute()
+    await supabase.table("applications").update({"stage": "hired"}).eq("id", app_id).execute()
 
     # 매칭 상태 업데이트
     if app.data.get("matches"):
         match_id = app.data["matches"]["id"] if isinstance(app.data["matches"], dict) else app.data.get("match_id")
         if match_id:
-            supabase.table("matches").update({"status": "hired"}).eq("id", match_id).execute()
+            await supabase.table("matches").update({"status": "hired"}).eq("id", match_id).execute()
 
     # 공고 상태 업데이트
-    supabase.table("job_postings").update({"status": "filled"}).eq("id", app.data["job_posting_id"]).execute()
+    await supabase.table("job_postings").update({"status": "filled"}).eq("id", app.data["job_posting_id"]).execute()
 
     return {"message": "Hire confirmed", "application_id": app_id}
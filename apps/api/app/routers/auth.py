@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -11,8 +11,8 @@ from app.services.auth_service import (
     authenticate_user,
     create_access_token,
     decode_token,
-    get_user_by_id,
 )
+from app.services.identity_cache import get_user, get_seeker_profile_id
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -29,13 +29,23 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> dic
     if token_data is None or token_data.user_id is None:
         raise credentials_exception
 
-    user = await get_user_by_id(token_data.user_id)
+    user = await get_user(token_data.user_id)
     if user is None:
         raise credentials_exception
 
     return user
 
 
+async def get_current_seeker_profile_id(
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> Optional[str]:
+    """
+    현재 사용자의 구직자 프로필 ID (없으면 None).
+    의존성으로 주입되므로 한 요청 안에서는 한 번만 조회됩니다.
+    """
+    return await get_seeker_profile_id(current_user["id"])
+
+
 @router.post("/signup", response_model=Token)
 async def signup(user_data: UserCreate):
     """회원가입"""
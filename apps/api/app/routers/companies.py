@@ -4,6 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from app.routers.company_auth import get_current_company_member
+from app.services.fit_inputs import invalidate_company_fit_input
+from app.services.identity_cache import invalidate_company
+from app.services.pagination import fetch_page
 from app.services.supabase_client import get_supabase
 
 router = APIRouter()
@@ -44,7 +47,7 @@ async def get_company(company_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("companies")
+        await supabase.table("companies")
         .select("*")
         .eq("id", company_id)
         .single()
@@ -72,12 +75,15 @@ async def update_company(
         return current_member.get("companies", {})
 
     result = (
-        supabase.table("companies")
+        await supabase.table("companies")
         .update(update_data)
         .eq("id", company_id)
         .execute()
     )
 
+    # 멤버 캐시에 조인된 기업 정보, 매칭 점수 입력 캐시 갱신
+    invalidate_company(company_id)
+    invalidate_company_fit_input(company_id)
     return result.data[0] if result.data else {}
 
 
@@ -86,21 +92,20 @@ async def list_companies(
     industry: Optional[str] = Query(None),
     size_range: Optional[str] = Query(None),
     limit: int = Query(20, le=50),
-    offset: int = Query(0),
+    cursor: Optional[str] = Query(None),
 ):
-    supabase = get_supabase()
-
-    query = supabase.table("companies").select("*")
-
-    if industry:
-        query = query.eq("industry", industry)
-    if size_range:
-        query = query.eq("size_range", size_range)
-
-    query = query.range(offset, offset + limit - 1).order("created_at", desc=True)
-    result = query.execute()
+    def apply_filters(query):
+        if industry:
+            query = query.eq("industry", industry)
+        if size_range:
+            query = query.eq("size_range", size_range)
+        return query
+
+    companies, next_cursor, total = await fetch_page(
+        "companies", "*", apply_filters, "created_at", cursor, limit
+    )
 
-    return {"companies": result.data or [], "total": len(result.data or [])}
+    return {"companies": companies, "total": total, "next_cursor": next_cursor}
 
 
 @router.post("/teams")
@@ -120,7 +125,7 @@ async def create_team_profile(
         "description": data.description,
     }
 
-    result = supabase.table("company_team_profiles").insert(insert_data).execute()
+    result = await supabase.table("company_team_profiles").insert(insert_data).execute()
 
     if not result.data:
         raise HTTPException(status_code=500, detail="Failed to create team profile")
@@ -135,7 +140,7 @@ async def list_team_profiles(
     supabase = get_supabase()
 
     result = (
-        supabase.table("company_team_profiles")
+        await supabase.table("company_team_profiles")
         .select("*")
         .eq("company_id", current_member["company_id"])
         .order("created_at", desc=True)
@@ -154,7 +159,7 @@ async def update_team_profile(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("company_team_profiles")
+        await supabase.table("company_team_profiles")
         .select("*")
         .eq("id", team_id)
         .eq("company_id", current_member["company_id"])
@@ -169,7 +174,7 @@ async def update_team_profile(
         return existing.data
 
     result = (
-        supabase.table("company_team_profiles")
+        await supabase.table("company_team_profiles")
         .update(update_data)
         .eq("id", team_id)
         .execute()
@@ -186,7 +191,7 @@ async def delete_team_profile(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("company_team_profiles")
+        await supabase.table("company_team_profiles")
         .select("id")
         .eq("id", team_id)
         .eq("company_id", current_member["company_id"])
@@ -195,5 +200,5 @@ async def delete_team_profile(
     if not existing.data:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    supabase.table("company_team_profiles").delete().eq("id", team_id).execute()
+    await supabase.table("company_team_profiles").delete().eq("id", team_id).execute()
     return {"message": "Team deleted"}
@@ -9,10 +9,10 @@ from app.config import settings
 from app.services.company_auth_service import (
     create_company_and_member,
     authenticate_company_member,
-    get_company_member_by_id,
     create_company_token,
     decode_company_token,
 )
+from app.services.identity_cache import get_company_member
 
 router = APIRouter()
 company_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/company/auth/login")
@@ -61,7 +61,7 @@ async def get_current_company_member(
     if token_data is None or token_data.user_id is None:
         raise credentials_exception
 
-    member = await get_company_member_by_id(token_data.user_id)
+    member = await get_company_member(token_data.user_id)
     if member is None:
         raise credentials_exception
 
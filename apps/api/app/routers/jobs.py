@@ -4,6 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from app.routers.company_auth import get_current_company_member
+from app.services.fit_cache import refresh_job_scores
+from app.services.fit_inputs import invalidate_job_fit_input
+from app.services.job_store import sync_job_posting
+from app.services.pagination import decode_score_cursor, encode_cursor, fetch_page
+from app.services.ranking_service import rank_candidates
+from app.services.seeker_store import get_seeker_store
 from app.services.supabase_client import get_supabase
 
 router = APIRouter()
@@ -50,11 +56,12 @@ async def create_job_posting(
         "status": data.status,
     }
 
-    result = supabase.table("job_postings").insert(insert_data).execute()
+    result = await supabase.table("job_postings").insert(insert_data).execute()
 
     if not result.data:
         raise HTTPException(status_code=500, detail="Failed to create job posting")
 
+    sync_job_posting(result.data[0])
     return result.data[0]
 
 
@@ -63,24 +70,28 @@ async def list_job_postings(
     company_id: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(20, le=50),
-    offset: int = Query(0),
+    cursor: Optional[str] = Query(None),
 ):
-    supabase = get_supabase()
-
-    query = supabase.table("job_postings").select("*, companies(name, logo_url, industry, location)")
-
-    if company_id:
-        query = query.eq("company_id", company_id)
-    else:
-        query = query.eq("status", "active")
-
-    if status_filter:
-        query = query.eq("status", status_filter)
-
-    query = query.range(offset, offset + limit - 1).order("created_at", desc=True)
-    result = query.execute()
+    def apply_filters(query):
+        if company_id:
+            query = query.eq("company_id", company_id)
+        else:
+            query = query.eq("status", "active")
+
+        if status_filter:
+            query = query.eq("status", status_filter)
+        return query
+
+    jobs, next_cursor, total = await fetch_page(
+        "job_postings",
+        "*, companies(name, logo_url, industry, location)",
+        apply_filters,
+        "created_at",
+        cursor,
+        limit,
+    )
 
-    return {"jobs": result.data or [], "total": len(result.data or [])}
+    return {"jobs": jobs, "total": total, "next_cursor": next_cursor}
 
 
 @router.get("/{job_id}")
@@ -88,7 +99,7 @@ async def get_job_posting(job_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("job_postings")
+        await supabase.table("job_postings")
         .select("*, companies(name, logo_url, industry, location, culture_tags, description)")
         .eq("id", job_id)
         .single()
@@ -110,7 +121,7 @@ async def update_job_posting(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("job_postings")
+        await supabase.table("job_postings")
         .select("*")
         .eq("id", job_id)
         .eq("company_id", current_member["company_id"])
@@ -125,12 +136,16 @@ async def update_job_posting(
         return existing.data
 
     result = (
-        supabase.table("job_postings")
+        await supabase.table("job_postings")
         .update(update_data)
         .eq("id", job_id)
         .execute()
     )
 
+    invalidate_job_fit_input(job_id)
+    if result.data:
+        sync_job_posting(result.data[0])
+        refresh_job_scores(result.data[0])
     return result.data[0] if result.data else existing.data
 
 
@@ -142,7 +157,7 @@ async def close_job_posting(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("job_postings")
+        await supabase.table("job_postings")
         .select("id")
         .eq("id", job_id)
         .eq("company_id", current_member["company_id"])
@@ -151,7 +166,9 @@ async def close_job_posting(
     if not existing.data:
         raise HTTPException(status_code=404, detail="Job posting not found")
 
-    supabase.table("job_postings").update({"status": "closed"}).eq("id", job_id).execute()
+    await supabase.table("job_postings").update({"status": "closed"}).eq("id", job_id).execute()
+    sync_job_posting({"id": job_id, "status": "closed"})
+    refresh_job_scores({"id": job_id, "status": "closed"})
     return {"message": "Job posting closed"}
 
 
@@ -160,13 +177,13 @@ async def get_job_candidates(
     job_id: str,
     current_member: Annotated[dict, Depends(get_current_company_member)],
     limit: int = Query(20, le=50),
-    offset: int = Query(0),
+    cursor: Optional[str] = Query(None),
 ):
     supabase = get_supabase()
 
     # 공고 확인
     job = (
-        supabase.table("job_postings")
+        await supabase.table("job_postings")
         .select("*")
         .eq("id", job_id)
         .eq("company_id", current_member["company_id"])
@@ -176,30 +193,38 @@ async def get_job_candidates(
     if not job.data:
         raise HTTPException(status_code=404, detail="Job posting not found")
 
-    # 활성 구직자 조회
-    seekers_result = (
-        supabase.table("seeker_profiles")
-        .select("*")
-        .eq("is_active", True)
-        .neq("visibility", "hidden")
-        .range(offset, offset + limit - 1)
-        .execute()
-    )
-
-    seekers = seekers_result.data or []
-
-    # 매칭 점수 계산
-    from app.services.matching_service import calculate_fit_score
+    # 활성 구직자 전체를 점수화하여 전역 순위 산출
+    store = await get_seeker_store()
+    after = None
+    if cursor:
+        after = decode_score_cursor(cursor)
+    # 다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+    ranked = rank_candidates(store, job.data, limit + 1, after)
+    next_cursor = None
+    if len(ranked) > limit:
+        ranked = ranked[:limit]
+        last_id, last_score = ranked[-1]
+        next_cursor = encode_cursor({"total": last_score["total"], "id": last_id}, "total")
+
+    seekers_by_id = {}
+    if ranked:
+        seekers_result = (
+            await supabase.table("seeker_profiles")
+            .select("*")
+            .in_("id", [seeker_id for seeker_id, _ in ranked])
+            .execute()
+        )
+        seekers_by_id = {s["id"]: s for s in (seekers_result.data or [])}
 
     candidates = []
-    for seeker in seekers:
-        fit_score = calculate_fit_score(seeker, job.data, None, None)
+    for seeker_id, fit_score in ranked:
+        seeker = seekers_by_id.get(seeker_id)
+        if not seeker:
+            continue
         seeker.pop("user_id", None)
         candidates.append({
             "seeker": seeker,
             "fit_score": fit_score,
         })
 
-    candidates.sort(key=lambda x: x["fit_score"]["total"], reverse=True)
-
-    return {"candidates": candidates, "total": len(candidates)}
+    return {"candidates": candidates, "total": len(store), "next_cursor": next_cursor}
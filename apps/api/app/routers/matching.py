@@ -3,9 +3,9 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_seeker_profile_id
 from app.routers.company_auth import get_current_company_member
-from app.services.matching_service import calculate_fit_score
+from app.services.fit_inputs import compute_fit_score
 from app.services.supabase_client import get_supabase
 
 router = APIRouter()
@@ -27,67 +27,13 @@ class InterestRespond(BaseModel):
 @router.post("/interests/seeker")
 async def create_seeker_interest(
     data: InterestCreate,
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
-    supabase = get_supabase()
-
     # 구직자 프로필 확인
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         raise HTTPException(status_code=400, detail="Seeker profile required")
 
-    seeker_id = profile.data["id"]
-
-    # 중복 확인
-    existing = (
-        supabase.table("interests")
-        .select("id")
-        .eq("from_type", "seeker")
-        .eq("from_id", seeker_id)
-        .eq("to_id", data.to_id)
-        .execute()
-    )
-    if existing.data:
-        raise HTTPException(status_code=400, detail="Interest already sent")
-
-    insert_data = {
-        "from_type": "seeker",
-        "from_id": seeker_id,
-        "to_type": "company",
-        "to_id": data.to_id,
-        "job_posting_id": data.job_posting_id,
-        "message": data.message,
-    }
-
-    result = supabase.table("interests").insert(insert_data).execute()
-
-    # 양방향 매칭 확인
-    reverse = (
-        supabase.table("interests")
-        .select("id")
-        .eq("from_type", "company")
-        .eq("from_id", data.to_id)
-        .eq("to_id", seeker_id)
-        .eq("status", "pending")
-        .execute()
-    )
-
-    match_created = None
-    if reverse.data:
-        match_created = await _create_match(seeker_id, data.to_id, data.job_posting_id, supabase)
-        supabase.table("interests").update({"status": "accepted"}).eq("id", reverse.data[0]["id"]).execute()
-        supabase.table("interests").update({"status": "accepted"}).eq("id", result.data[0]["id"]).execute()
-
-    return {
-        "interest": result.data[0] if result.data else None,
-        "match": match_created,
-    }
+    return await _create_interest("seeker", seeker_profile_id, "company", data)
 
 
 # ---- 기업 관심 표시 ----
@@ -97,71 +43,42 @@ async def create_company_interest(
     data: InterestCreate,
     current_member: Annotated[dict, Depends(get_current_company_member)],
 ):
-    supabase = get_supabase()
-    company_id = current_member["company_id"]
-
-    # 중복 확인
-    existing = (
-        supabase.table("interests")
-        .select("id")
-        .eq("from_type", "company")
-        .eq("from_id", company_id)
-        .eq("to_id", data.to_id)
-        .execute()
-    )
-    if existing.data:
-        raise HTTPException(status_code=400, detail="Interest already sent")
+    return await _create_interest("company", current_member["company_id"], "seeker", data)
 
-    insert_data = {
-        "from_type": "company",
-        "from_id": company_id,
-        "to_type": "seeker",
-        "to_id": data.to_id,
-        "job_posting_id": data.job_posting_id,
-        "message": data.message,
-    }
 
-    result = supabase.table("interests").insert(insert_data).execute()
+async def _create_interest(from_type: str, from_id: str, to_type: str, data: InterestCreate) -> dict:
+    """
+    관심 저장과 양방향 매칭 성사를 create_interest RPC 한 번으로 처리합니다.
+    (중복 관심/매칭은 DB 유니크 제약과 쌍 단위 잠금으로 막으므로 동시 요청에도 매칭은 하나)
+    매칭 점수는 캐시된 구직자/기업/공고 데이터로 미리 계산해 함께 넘깁니다.
+    """
+    seeker_profile_id, company_id = (from_id, data.to_id) if from_type == "seeker" else (data.to_id, from_id)
+    fit_score = await compute_fit_score(seeker_profile_id, company_id, data.job_posting_id)
 
-    # 양방향 매칭 확인
-    reverse = (
-        supabase.table("interests")
-        .select("id")
-        .eq("from_type", "seeker")
-        .eq("from_id", data.to_id)
-        .eq("to_id", company_id)
-        .eq("status", "pending")
-        .execute()
-    )
-
-    match_created = None
-    if reverse.data:
-        match_created = await _create_match(data.to_id, company_id, data.job_posting_id, supabase)
-        supabase.table("interests").update({"status": "accepted"}).eq("id", reverse.data[0]["id"]).execute()
-        supabase.table("interests").update({"status": "accepted"}).eq("id", result.data[0]["id"]).execute()
+    supabase = get_supabase()
+    result = await supabase.rpc("create_interest", {
+        "p_from_type": from_type,
+        "p_from_id": from_id,
+        "p_to_type": to_type,
+        "p_to_id": data.to_id,
+        "p_job_posting_id": data.job_posting_id,
+        "p_message": data.message,
+        "p_fit_score": fit_score,
+    }).execute()
+
+    outcome = result.data or {}
+    if outcome.get("duplicate"):
+        raise HTTPException(status_code=400, detail="Interest already sent")
 
     return {
-        "interest": result.data[0] if result.data else None,
-        "match": match_created,
+        "interest": outcome.get("interest"),
+        "match": outcome.get("match"),
     }
 
 
 async def _create_match(seeker_profile_id: str, company_id: str, job_posting_id: Optional[str], supabase):
-    # 매칭 점수 계산
-    seeker = supabase.table("seeker_profiles").select("*").eq("id", seeker_profile_id).single().execute()
-    company = supabase.table("companies").select("*").eq("id", company_id).single().execute()
-
-    job = None
-    if job_posting_id:
-        job_result = supabase.table("job_postings").select("*").eq("id", job_posting_id).single().execute()
-        job = job_result.data
-
-    fit_score = calculate_fit_score(
-        seeker.data or {},
-        job or {},
-        company.data,
-        None,
-    )
+    # 매칭 점수 계산 (캐시된 구직자/기업/공고 데이터)
+    fit_score = await compute_fit_score(seeker_profile_id, company_id, job_posting_id)
 
     match_data = {
         "seeker_profile_id": seeker_profile_id,
@@ -170,8 +87,22 @@ async def _create_match(seeker_profile_id: str, company_id: str, job_posting_id:
         "fit_score": fit_score,
     }
 
-    result = supabase.table("matches").insert(match_data).execute()
-    return result.data[0] if result.data else None
+    # 이미 성사된 매칭이면 새로 만들지 않고 기존 매칭 반환
+    result = await supabase.table("matches").upsert(
+        match_data, on_conflict="seeker_profile_id,company_id,job_posting_id", ignore_duplicates=True
+    ).execute()
+    if result.data:
+        return result.data[0]
+
+    query = (
+        supabase.table("matches")
+        .select("*")
+        .eq("seeker_profile_id", seeker_profile_id)
+        .eq("company_id", company_id)
+    )
+    query = query.eq("job_posting_id", job_posting_id) if job_posting_id else query.is_("job_posting_id", "null")
+    existing = await query.execute()
+    return existing.data[0] if existing.data else None
 
 
 # ---- 관심 응답 ----
@@ -180,12 +111,12 @@ async def _create_match(seeker_profile_id: str, company_id: str, job_posting_id:
 async def respond_to_interest(
     interest_id: str,
     data: InterestRespond,
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
     interest = (
-        supabase.table("interests")
+        await supabase.table("interests")
         .select("*")
         .eq("id", interest_id)
         .single()
@@ -194,16 +125,15 @@ async def respond_to_interest(
     if not interest.data:
         raise HTTPException(status_code=404, detail="Interest not found")
 
-    supabase.table("interests").update({"status": data.status}).eq("id", interest_id).execute()
+    await supabase.table("interests").update({"status": data.status}).eq("id", interest_id).execute()
 
     match_created = None
     if data.status == "accepted":
         i = interest.data
         if i["to_type"] == "seeker":
-            profile = supabase.table("seeker_profiles").select("id").eq("user_id", current_user["id"]).single().execute()
-            if profile.data:
+            if seeker_profile_id:
                 match_created = await _create_match(
-                    profile.data["id"], i["from_id"], i.get("job_posting_id"), supabase
+                    seeker_profile_id, i["from_id"], i.get("job_posting_id"), supabase
                 )
         elif i["from_type"] == "seeker":
             match_created = await _create_match(
@@ -217,25 +147,18 @@ async def respond_to_interest(
 
 @router.get("/interests/sent/seeker")
 async def get_seeker_sent_interests(
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         return []
 
     result = (
-        supabase.table("interests")
+        await supabase.table("interests")
         .select("*, job_postings(title, companies(name))")
         .eq("from_type", "seeker")
-        .eq("from_id", profile.data["id"])
+        .eq("from_id", seeker_profile_id)
         .order("created_at", desc=True)
         .execute()
     )
@@ -245,25 +168,18 @@ async def get_seeker_sent_interests(
 
 @router.get("/interests/received/seeker")
 async def get_seeker_received_interests(
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         return []
 
     result = (
-        supabase.table("interests")
+        await supabase.table("interests")
         .select("*, job_postings(title, companies(name))")
         .eq("to_type", "seeker")
-        .eq("to_id", profile.data["id"])
+        .eq("to_id", seeker_profile_id)
         .order("created_at", desc=True)
         .execute()
     )
@@ -278,7 +194,7 @@ async def get_company_sent_interests(
     supabase = get_supabase()
 
     result = (
-        supabase.table("interests")
+        await supabase.table("interests")
         .select("*, seeker_profiles(display_name, headline)")
         .eq("from_type", "company")
         .eq("from_id", current_member["company_id"])
@@ -296,7 +212,7 @@ async def get_company_received_interests(
     supabase = get_supabase()
 
     result = (
-        supabase.table("interests")
+        await supabase.table("interests")
         .select("*, seeker_profiles(display_name, headline)")
         .eq("to_type", "company")
         .eq("to_id", current_member["company_id"])
@@ -311,24 +227,17 @@ async def get_company_received_interests(
 
 @router.get("/matches/seeker")
 async def get_seeker_matches(
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         return []
 
     result = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("*, companies(name, logo_url, industry, location), job_postings(title)")
-        .eq("seeker_profile_id", profile.data["id"])
+        .eq("seeker_profile_id", seeker_profile_id)
         .eq("status", "active")
         .order("matched_at", desc=True)
         .execute()
@@ -344,7 +253,7 @@ async def get_company_matches(
     supabase = get_supabase()
 
     result = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("*, seeker_profiles(display_name, headline, abilities_snapshot), job_postings(title)")
         .eq("company_id", current_member["company_id"])
         .eq("status", "active")
@@ -360,7 +269,7 @@ async def get_match_detail(match_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("*, seeker_profiles(*, users(name, email)), companies(*), job_postings(*)")
         .eq("id", match_id)
         .single()
@@ -378,7 +287,7 @@ async def get_match_fit_detail(match_id: str):
     supabase = get_supabase()
 
     match = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("*")
         .eq("id", match_id)
         .single()
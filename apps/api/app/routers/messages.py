@@ -1,13 +1,28 @@
+import asyncio
+import logging
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
 from pydantic import BaseModel
 
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_user, get_current_seeker_profile_id
 from app.routers.company_auth import get_current_company_member
+from app.services.identity_cache import get_seeker_profile_id
+from app.services.pagination import fetch_page, keyset, paginate
+from app.services.pubsub import get_pubsub
 from app.services.supabase_client import get_supabase
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# WebSocket 연결 후 인증 메시지를 기다리는 시간
+SOCKET_AUTH_TIMEOUT_SECONDS = 10
+
+# 대화 목록용 매칭 컬럼 (마지막 메시지/안 읽은 수는 messages 트리거가 matches에 유지)
+CONVERSATION_COLUMNS = (
+    "id, matched_at, job_postings(title), "
+    "last_message, seeker_unread_count, company_unread_count"
+)
 
 
 class MessageSend(BaseModel):
@@ -18,129 +33,94 @@ class MessageSend(BaseModel):
 
 @router.get("/conversations/seeker")
 async def get_seeker_conversations(
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
+    limit: int = Query(50, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
-        return []
+    if not seeker_profile_id:
+        return {"conversations": [], "next_cursor": None}
 
-    matches = (
+    query = (
         supabase.table("matches")
-        .select("id, company_id, companies(name, logo_url), job_postings(title), matched_at")
-        .eq("seeker_profile_id", profile.data["id"])
+        .select(f"{CONVERSATION_COLUMNS}, company_id, companies(name, logo_url)")
+        .eq("seeker_profile_id", seeker_profile_id)
         .eq("status", "active")
-        .order("matched_at", desc=True)
-        .execute()
     )
+    matches = await keyset(query, "matched_at", cursor, limit).execute()
+    rows, next_cursor = paginate(matches.data or [], "matched_at", limit)
 
-    conversations = []
-    for match in (matches.data or []):
-        last_msg = (
-            supabase.table("messages")
-            .select("content, sender_type, created_at, read_at")
-            .eq("match_id", match["id"])
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
-        )
-
-        unread = (
-            supabase.table("messages")
-            .select("id", count="exact")
-            .eq("match_id", match["id"])
-            .eq("sender_type", "company")
-            .is_("read_at", "null")
-            .execute()
-        )
-
-        conversations.append({
+    conversations = [
+        {
             "match_id": match["id"],
             "company": match.get("companies"),
             "job_title": match.get("job_postings", {}).get("title") if match.get("job_postings") else None,
-            "last_message": last_msg.data[0] if last_msg.data else None,
-            "unread_count": unread.count if hasattr(unread, 'count') else 0,
-        })
+            "last_message": match.get("last_message"),
+            "unread_count": match.get("seeker_unread_count") or 0,
+        }
+        for match in rows
+    ]
 
-    return conversations
+    return {"conversations": conversations, "next_cursor": next_cursor}
 
 
 @router.get("/conversations/seeker/{match_id}")
 async def get_seeker_conversation_messages(
     match_id: str,
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
     limit: int = Query(50, le=100),
-    offset: int = Query(0),
+    cursor: Optional[str] = Query(None),
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         raise HTTPException(status_code=400, detail="Profile required")
 
     # 매칭 확인
     match = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("id")
         .eq("id", match_id)
-        .eq("seeker_profile_id", profile.data["id"])
+        .eq("seeker_profile_id", seeker_profile_id)
         .execute()
     )
     if not match.data:
         raise HTTPException(status_code=404, detail="Match not found")
 
     # 읽음 처리
-    supabase.table("messages").update({"read_at": "now()"}).eq("match_id", match_id).eq("sender_type", "company").is_("read_at", "null").execute()
-
-    # 메시지 조회
-    result = (
-        supabase.table("messages")
-        .select("*")
-        .eq("match_id", match_id)
-        .order("created_at")
-        .range(offset, offset + limit - 1)
-        .execute()
+    await supabase.table("messages").update({"read_at": "now()"}).eq("match_id", match_id).eq("sender_type", "company").is_("read_at", "null").execute()
+
+    # 메시지 조회 (오래된 순, 커서 이후)
+    messages, next_cursor, total = await fetch_page(
+        "messages",
+        "*",
+        lambda query: query.eq("match_id", match_id),
+        "created_at",
+        cursor,
+        limit,
+        desc=False,
     )
 
-    return result.data or []
+    return {"messages": messages, "total": total, "next_cursor": next_cursor}
 
 
 @router.post("/conversations/seeker/{match_id}")
 async def send_seeker_message(
     match_id: str,
     data: MessageSend,
-    current_user: Annotated[dict, Depends(get_current_user)],
+    seeker_profile_id: Annotated[Optional[str], Depends(get_current_seeker_profile_id)],
 ):
     supabase = get_supabase()
 
-    profile = (
-        supabase.table("seeker_profiles")
-        .select("id")
-        .eq("user_id", current_user["id"])
-        .single()
-        .execute()
-    )
-    if not profile.data:
+    if not seeker_profile_id:
         raise HTTPException(status_code=400, detail="Profile required")
 
     match = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("id")
         .eq("id", match_id)
-        .eq("seeker_profile_id", profile.data["id"])
+        .eq("seeker_profile_id", seeker_profile_id)
         .execute()
     )
     if not match.data:
@@ -149,12 +129,16 @@ async def send_seeker_message(
     insert_data = {
         "match_id": match_id,
         "sender_type": "seeker",
-        "sender_id": profile.data["id"],
+        "sender_id": seeker_profile_id,
         "content": data.content,
     }
 
-    result = supabase.table("messages").insert(insert_data).execute()
-    return result.data[0] if result.data else {}
+    result = await supabase.table("messages").insert(insert_data).execute()
+    if not result.data:
+        return {}
+
+    await _publish_message(result.data[0])
+    return result.data[0]
 
 
 # ---- 기업 메시지 ----
@@ -162,48 +146,33 @@ async def send_seeker_message(
 @router.get("/conversations/company")
 async def get_company_conversations(
     current_member: Annotated[dict, Depends(get_current_company_member)],
+    limit: int = Query(50, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     supabase = get_supabase()
     company_id = current_member["company_id"]
 
-    matches = (
+    query = (
         supabase.table("matches")
-        .select("id, seeker_profile_id, seeker_profiles(display_name, headline), job_postings(title), matched_at")
+        .select(f"{CONVERSATION_COLUMNS}, seeker_profile_id, seeker_profiles(display_name, headline)")
         .eq("company_id", company_id)
         .eq("status", "active")
-        .order("matched_at", desc=True)
-        .execute()
     )
+    matches = await keyset(query, "matched_at", cursor, limit).execute()
+    rows, next_cursor = paginate(matches.data or [], "matched_at", limit)
 
-    conversations = []
-    for match in (matches.data or []):
-        last_msg = (
-            supabase.table("messages")
-            .select("content, sender_type, created_at, read_at")
-            .eq("match_id", match["id"])
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
-        )
-
-        unread = (
-            supabase.table("messages")
-            .select("id", count="exact")
-            .eq("match_id", match["id"])
-            .eq("sender_type", "seeker")
-            .is_("read_at", "null")
-            .execute()
-        )
-
-        conversations.append({
+    conversations = [
+        {
             "match_id": match["id"],
             "seeker": match.get("seeker_profiles"),
             "job_title": match.get("job_postings", {}).get("title") if match.get("job_postings") else None,
-            "last_message": last_msg.data[0] if last_msg.data else None,
-            "unread_count": unread.count if hasattr(unread, 'count') else 0,
-        })
+            "last_message": match.get("last_message"),
+            "unread_count": match.get("company_unread_count") or 0,
+        }
+        for match in rows
+    ]
 
-    return conversations
+    return {"conversations": conversations, "next_cursor": next_cursor}
 
 
 @router.get("/conversations/company/{match_id}")
@@ -211,12 +180,12 @@ async def get_company_conversation_messages(
     match_id: str,
     current_member: Annotated[dict, Depends(get_current_company_member)],
     limit: int = Query(50, le=100),
-    offset: int = Query(0),
+    cursor: Optional[str] = Query(None),
 ):
     supabase = get_supabase()
 
     match = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("id")
         .eq("id", match_id)
         .eq("company_id", current_member["company_id"])
@@ -226,18 +195,20 @@ async def get_company_conversation_messages(
         raise HTTPException(status_code=404, detail="Match not found")
 
     # 읽음 처리
-    supabase.table("messages").update({"read_at": "now()"}).eq("match_id", match_id).eq("sender_type", "seeker").is_("read_at", "null").execute()
-
-    result = (
-        supabase.table("messages")
-        .select("*")
-        .eq("match_id", match_id)
-        .order("created_at")
-        .range(offset, offset + limit - 1)
-        .execute()
+    await supabase.table("messages").update({"read_at": "now()"}).eq("match_id", match_id).eq("sender_type", "seeker").is_("read_at", "null").execute()
+
+    # 메시지 조회 (오래된 순, 커서 이후)
+    messages, next_cursor, total = await fetch_page(
+        "messages",
+        "*",
+        lambda query: query.eq("match_id", match_id),
+        "created_at",
+        cursor,
+        limit,
+        desc=False,
     )
 
-    return result.data or []
+    return {"messages": messages, "total": total, "next_cursor": next_cursor}
 
 
 @router.post("/conversations/company/{match_id}")
@@ -249,7 +220,7 @@ async def send_company_message(
     supabase = get_supabase()
 
     match = (
-        supabase.table("matches")
+        await supabase.table("matches")
         .select("id")
         .eq("id", match_id)
         .eq("company_id", current_member["company_id"])
@@ -265,8 +236,139 @@ async def send_company_message(
         "content": data.content,
     }
 
-    result = supabase.table("messages").insert(insert_data).execute()
-    return result.data[0] if result.data else {}
+    result = await supabase.table("messages").insert(insert_data).execute()
+    if not result.data:
+        return {}
+
+    await _publish_message(result.data[0])
+    return result.data[0]
+
+
+# ---- 실시간 전송 (WebSocket) ----
+
+def _match_channel(match_id: str) -> str:
+    return f"match:{match_id}"
+
+
+async def _publish_message(message: dict) -> None:
+    """
+    새 메시지를 해당 매칭 채널 구독자(양측 참여자)에게 팬아웃.
+    메시지는 이미 저장되었으므로 전송 실패는 기록만 하고 요청은 성공으로 처리합니다.
+    (실패를 500으로 돌려주면 클라이언트 재시도가 같은 메시지를 한 번 더 저장함 — 수신 측은 대화 조회로 보충)
+    """
+    pubsub = get_pubsub()
+    channel = _match_channel(message["match_id"])
+    try:
+        try:
+            await pubsub.publish(channel, {"type": "message", "message": message})
+        except ValueError:
+            # 백엔드 페이로드 제한 초과 — id만 보내고 수신 측에서 조회
+            await pubsub.publish(channel, {"type": "message_ref", "id": message["id"]})
+    except Exception:
+        logger.warning("Failed to publish message %s", message.get("id"), exc_info=True)
+
+
+async def _authorize_socket(side: str, match_id: str, token: str) -> bool:
+    supabase = get_supabase()
+
+    if side == "seeker":
+        user = await get_current_user(token)
+        seeker_profile_id = await get_seeker_profile_id(user["id"])
+        if not seeker_profile_id:
+            return False
+        owner_column, owner_id = "seeker_profile_id", seeker_profile_id
+    elif side == "company":
+        member = await get_current_company_member(token)
+        owner_column, owner_id = "company_id", member["company_id"]
+    else:
+        return False
+
+    match = (
+        await supabase.table("matches")
+        .select("id")
+        .eq("id", match_id)
+        .eq(owner_column, owner_id)
+        .execute()
+    )
+    return bool(match.data)
+
+
+async def _wait_disconnect(websocket: WebSocket) -> None:
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+async def _receive_token(websocket: WebSocket) -> Optional[str]:
+    """연결 후 첫 메시지 {"type": "auth", "token": ...}에서 토큰을 받음 (시간 초과/형식 오류면 None)"""
+    try:
+        data = await asyncio.wait_for(websocket.receive_json(), SOCKET_AUTH_TIMEOUT_SECONDS)
+    except (asyncio.TimeoutError, ValueError, WebSocketDisconnect):
+        return None
+    if not isinstance(data, dict) or data.get("type") != "auth" or not isinstance(data.get("token"), str):
+        return None
+    return data["token"]
+
+
+@router.websocket("/conversations/{side}/{match_id}/ws")
+async def conversation_socket(websocket: WebSocket, side: str, match_id: str):
+    """
+    매칭 대화의 새 메시지를 실시간으로 받는 채널 (side: seeker | company).
+    브라우저 WebSocket은 헤더를 붙일 수 없고, 쿼리 파라미터의 토큰은 접근 로그에 남으므로
+    연결 직후 첫 메시지 {"type": "auth", "token": "..."}로 토큰을 받습니다.
+    상대방 메시지는 전달 시 해당 메시지만 읽음 처리합니다.
+    """
+    await websocket.accept()
+    token = await _receive_token(websocket)
+    try:
+        authorized = token is not None and await _authorize_socket(side, match_id, token)
+    except HTTPException:
+        authorized = False
+    if not authorized:
+        try:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        except RuntimeError:
+            pass  # 인증 메시지 전에 이미 끊긴 연결
+        return
+
+    supabase = get_supabase()
+    other_side = "company" if side == "seeker" else "seeker"
+
+    async with get_pubsub().subscribe(_match_channel(match_id)) as queue:
+        disconnected = asyncio.create_task(_wait_disconnect(websocket))
+        try:
+            while True:
+                next_event = asyncio.create_task(queue.get())
+                done, _ = await asyncio.wait(
+                    {next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if disconnected in done:
+                    next_event.cancel()
+                    break
+
+                event = next_event.result()
+                if event["type"] == "message_ref":
+                    row = (
+                        await supabase.table("messages")
+                        .select("*")
+                        .eq("id", event["id"])
+                        .execute()
+                    )
+                    if not row.data:
+                        continue
+                    event = {"type": "message", "message": row.data[0]}
+
+                message = event["message"]
+                if message["sender_type"] == other_side and not message.get("read_at"):
+                    await supabase.table("messages").update({"read_at": "now()"}).eq("id", message["id"]).is_("read_at", "null").execute()
+
+                await websocket.send_json(event)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            disconnected.cancel()
 
 
 @router.put("/{message_id}/read")
@@ -274,7 +376,7 @@ async def mark_message_read(message_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("messages")
+        await supabase.table("messages")
         .update({"read_at": "now()"})
         .eq("id", message_id)
         .execute()
@@ -61,7 +61,7 @@ async def confirm(
     # 결제 성공 시 리포트 자동 생성
     supabase = get_supabase()
     payment = (
-        supabase.table("payments")
+        await supabase.table("payments")
         .select("*")
         .eq("order_id", request.order_id)
         .single()
@@ -75,7 +75,7 @@ async def confirm(
 
         # 리포트 생성
         report_result = (
-            supabase.table("reports")
+            await supabase.table("reports")
             .insert({
                 "user_id": current_user["id"],
                 "report_type": report_type,
@@ -86,7 +86,7 @@ async def confirm(
 
         # 결제에 리포트 ID 연결
         if report_result.data:
-            supabase.table("payments").update(
+            await supabase.table("payments").update(
                 {"report_id": report_result.data[0]["id"]}
             ).eq("id", payment.data["id"]).execute()
 
@@ -102,7 +102,7 @@ async def get_my_payment_status(
 
     # 완료된 결제가 있는지 확인
     payments = (
-        supabase.table("payments")
+        await supabase.table("payments")
         .select("*, reports(*)")
         .eq("user_id", current_user["id"])
         .eq("status", "completed")
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
 from app.services.supabase_client import get_supabase
-from app.services.ability_service import calculate_abilities
+from app.services.ability_service import get_abilities_summary
 from app.routers.auth import get_current_user
 
 router = APIRouter()
@@ -19,7 +19,7 @@ async def preview_report(
     current_user: Annotated[dict, Depends(get_current_user)],
 ):
     """무료 미리보기 (블러 처리된 결과)"""
-    abilities = await calculate_abilities(current_user["id"])
+    abilities = await get_abilities_summary(current_user["id"])
 
     # 미리보기에서는 일부 데이터만 보여줌
     preview_data = {
@@ -60,7 +60,7 @@ async def generate_report(
 
     # Check if user has paid for this report type
     payment = (
-        supabase.table("payments")
+        await supabase.table("payments")
         .select("*")
         .eq("user_id", current_user["id"])
         .eq("status", "completed")
@@ -70,7 +70,7 @@ async def generate_report(
     )
 
     # For now, allow generation (payment check can be stricter in production)
-    abilities = await calculate_abilities(current_user["id"])
+    abilities = await get_abilities_summary(current_user["id"])
 
     report_data = {
         "type": request.type,
@@ -91,7 +91,7 @@ async def generate_report(
 
     # Save report
     result = (
-        supabase.table("reports")
+        await supabase.table("reports")
         .insert(
             {
                 "user_id": current_user["id"],
@@ -117,7 +117,7 @@ async def get_report(
     supabase = get_supabase()
 
     result = (
-        supabase.table("reports")
+        await supabase.table("reports")
         .select("*")
         .eq("id", report_id)
         .eq("user_id", current_user["id"])
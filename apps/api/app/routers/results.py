@@ -34,7 +34,7 @@ async def get_comprehensive_result(
     supabase = get_supabase()
 
     result = (
-        supabase.table("comprehensive_results")
+        await supabase.table("comprehensive_results")
         .select("*")
         .eq("user_id", current_user["id"])
         .order("created_at", desc=True)
@@ -61,7 +61,7 @@ async def save_comprehensive_result(
 
     # Upsert: 기존 결과가 있으면 업데이트, 없으면 생성
     existing = (
-        supabase.table("comprehensive_results")
+        await supabase.table("comprehensive_results")
         .select("id")
         .eq("user_id", current_user["id"])
         .execute()
@@ -77,14 +77,14 @@ async def save_comprehensive_result(
 
     if existing.data:
         result = (
-            supabase.table("comprehensive_results")
+            await supabase.table("comprehensive_results")
             .update(row)
             .eq("id", existing.data[0]["id"])
             .execute()
         )
     else:
         result = (
-            supabase.table("comprehensive_results")
+            await supabase.table("comprehensive_results")
             .insert(row)
             .execute()
         )
@@ -1,9 +1,18 @@
+import asyncio
 from typing import Annotated, Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from app.routers.auth import get_current_user
+from app.services.fit_cache import schedule_fit_refresh
+from app.services.fit_inputs import get_seeker_fit_input
+from app.services.identity_cache import get_seeker_profile_id, invalidate_seeker_profile
+from app.services.job_store import get_job_store
+from app.services.matching_service import SeekerColumns
+from app.services.pagination import decode_score_cursor, encode_cursor, fetch_page
+from app.services.ranking_service import rank_jobs
+from app.services.seeker_store import sync_seeker_profile
 from app.services.supabase_client import get_supabase
 
 router = APIRouter()
@@ -47,7 +56,7 @@ async def create_seeker_profile(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("seeker_profiles")
+        await supabase.table("seeker_profiles")
         .select("id")
         .eq("user_id", current_user["id"])
         .execute()
@@ -74,11 +83,14 @@ async def create_seeker_profile(
         "abilities_snapshot": data.abilities_snapshot,
     }
 
-    result = supabase.table("seeker_profiles").insert(insert_data).execute()
+    result = await supabase.table("seeker_profiles").insert(insert_data).execute()
 
     if not result.data:
         raise HTTPException(status_code=500, detail="Failed to create profile")
 
+    invalidate_seeker_profile(current_user["id"])
+    sync_seeker_profile(result.data[0])
+    schedule_fit_refresh()
     return result.data[0]
 
 
@@ -89,7 +101,7 @@ async def get_my_seeker_profile(
     supabase = get_supabase()
 
     result = (
-        supabase.table("seeker_profiles")
+        await supabase.table("seeker_profiles")
         .select("*")
         .eq("user_id", current_user["id"])
         .single()
@@ -110,7 +122,7 @@ async def update_my_seeker_profile(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("seeker_profiles")
+        await supabase.table("seeker_profiles")
         .select("id")
         .eq("user_id", current_user["id"])
         .single()
@@ -124,21 +136,75 @@ async def update_my_seeker_profile(
         return existing.data
 
     result = (
-        supabase.table("seeker_profiles")
+        await supabase.table("seeker_profiles")
         .update(update_data)
         .eq("user_id", current_user["id"])
         .execute()
     )
 
+    if result.data:
+        sync_seeker_profile(result.data[0])
+        schedule_fit_refresh()
     return result.data[0] if result.data else existing.data
 
 
+@router.get("/profile/me/recommended-jobs")
+async def get_recommended_jobs(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    limit: int = Query(20, le=50),
+    cursor: Optional[str] = Query(None),
+):
+    seeker_id = await get_seeker_profile_id(current_user["id"])
+    if not seeker_id:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    # 활성 공고 전체를 점수화하여 전역 순위 산출
+    (seeker, abilities), store = await asyncio.gather(get_seeker_fit_input(seeker_id), get_job_store())
+    seeker_columns = SeekerColumns.from_profiles(
+        [seeker], None if abilities is None else abilities.reshape(1, -1)
+    )
+    after = None
+    if cursor:
+        after = decode_score_cursor(cursor)
+    # 다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+    ranked = rank_jobs(store, seeker_columns, limit + 1, after)
+    next_cursor = None
+    if len(ranked) > limit:
+        ranked = ranked[:limit]
+        last_id, last_score = ranked[-1]
+        next_cursor = encode_cursor({"total": last_score["total"], "id": last_id}, "total")
+
+    jobs_by_id = {}
+    if ranked:
+        supabase = get_supabase()
+        jobs_result = (
+            await supabase.table("job_postings")
+            .select("*, companies(name, logo_url, industry, location)")
+            .in_("id", [job_id for job_id, _ in ranked])
+            .eq("status", "active")
+            .execute()
+        )
+        jobs_by_id = {j["id"]: j for j in (jobs_result.data or [])}
+
+    jobs = []
+    for job_id, fit_score in ranked:
+        job = jobs_by_id.get(job_id)
+        if not job:
+            continue
+        jobs.append({
+            "job": job,
+            "fit_score": fit_score,
+        })
+
+    return {"jobs": jobs, "total": len(store), "next_cursor": next_cursor}
+
+
 @router.get("/{seeker_id}")
 async def get_seeker_profile(seeker_id: str):
     supabase = get_supabase()
 
     result = (
-        supabase.table("seeker_profiles")
+        await supabase.table("seeker_profiles")
         .select("*")
         .eq("id", seeker_id)
         .eq("is_active", True)
@@ -165,30 +231,25 @@ async def search_seekers(
     max_experience: Optional[int] = Query(None),
     remote_pref: Optional[str] = Query(None),
     limit: int = Query(20, le=50),
-    offset: int = Query(0),
+    cursor: Optional[str] = Query(None),
 ):
-    supabase = get_supabase()
-
-    query = (
-        supabase.table("seeker_profiles")
-        .select("*")
-        .eq("is_active", True)
-        .eq("visibility", "public")
+    def apply_filters(query):
+        query = query.eq("is_active", True).eq("visibility", "public")
+
+        if min_experience is not None:
+            query = query.gte("experience_years", min_experience)
+        if max_experience is not None:
+            query = query.lte("experience_years", max_experience)
+        if remote_pref:
+            query = query.eq("remote_pref", remote_pref)
+        return query
+
+    seekers, next_cursor, total = await fetch_page(
+        "seeker_profiles", "*", apply_filters, "created_at", cursor, limit
     )
 
-    if min_experience is not None:
-        query = query.gte("experience_years", min_experience)
-    if max_experience is not None:
-        query = query.lte("experience_years", max_experience)
-    if remote_pref:
-        query = query.eq("remote_pref", remote_pref)
-
-    query = query.range(offset, offset + limit - 1).order("created_at", desc=True)
-    result = query.execute()
-
     # 공개 목록에서 user_id 제거
-    seekers = result.data or []
     for s in seekers:
         s.pop("user_id", None)
 
-    return {"seekers": seekers, "total": len(seekers)}
+    return {"seekers": seekers, "total": total, "next_cursor": next_cursor}
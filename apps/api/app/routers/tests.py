@@ -1,8 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 
-from app.models.test import TestResponse, TestSubmit, TestResult
+from app.config import settings
+from app.models.test import AnswerBatch, SessionProgress, TestResponse, TestSubmit, TestResult
+from app.services.test_catalog import get_catalog, invalidate_catalog
 from app.services.test_service import (
     get_all_tests,
     get_test_by_code,
@@ -10,9 +12,13 @@ from app.services.test_service import (
     start_test_session,
     submit_responses,
     complete_test_session,
+    record_fraud_detections,
 )
+from app.services.ability_service import record_test_result
+from app.services import answer_buffer
 from app.routers.auth import get_current_user
 from app.tests_engine.base import get_test_engine
+from app.tests_engine.interpretation import dumps
 
 router = APIRouter()
 
@@ -24,23 +30,39 @@ async def list_tests():
     return {"tests": tests}
 
 
-@router.get("/{code}")
-async def get_test(code: str):
-    """검사 상세 조회"""
-    test = await get_test_by_code(code)
+@router.post("/catalog/invalidate")
+async def invalidate_test_catalog(
+    x_admin_key: Annotated[Optional[str], Header()] = None,
+):
+    """검사/문항 캐시 무효화 (운영용, 다른 워커는 TTL 내에 반영)"""
+    if not settings.admin_api_key or x_admin_key != settings.admin_api_key:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    if not test:
+    invalidate_catalog()
+    return {"message": "Test catalog invalidated"}
+
+
+@router.get("/{code}", response_model=TestResponse)
+async def get_test(
+    code: str,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    """검사 상세 조회 (미리 직렬화된 응답 + ETag)"""
+    catalog = await get_catalog()
+    detail = catalog.detail(code)
+
+    if not detail:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Test '{code}' not found",
         )
 
-    questions = await get_test_questions(test["id"])
+    body, etag = detail
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return TestResponse(
-        test=test,
-        questions=questions,
-    )
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/{code}/start")
@@ -59,6 +81,8 @@ async def start_test(
 
     session = await start_test_session(current_user["id"], test["id"])
     questions = await get_test_questions(test["id"])
+    if session:
+        answer_buffer.open_session(session)
 
     return {
         "session": session,
@@ -86,6 +110,68 @@ async def submit_test(
     return {"submitted": len(responses)}
 
 
+async def _get_session_engine(code: str, session_id: str, user_id: str):
+    """세션이 현재 사용자의 해당 검사 세션인지 확인하고 (검사, 엔진)을 반환"""
+    test = await get_test_by_code(code)
+    engine = get_test_engine(code)
+    owner = await answer_buffer.get_session_owner(session_id)
+
+    if not test or not owner or owner != (user_id, test["id"]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Test session not found",
+        )
+    if not engine:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"Test engine for '{code}' not implemented",
+        )
+    return test, engine
+
+
+async def _session_progress(session_id: str, test: dict, engine) -> SessionProgress:
+    running = await answer_buffer.running_score(session_id, engine)
+    if running is None:
+        # 이 워커에 버퍼가 없으면 한 번만 DB의 응답 전체로 채우고 이후로는 누적
+        responses = await engine.get_responses(session_id)
+        answer_buffer.seed_responses(
+            session_id, [{k: v for k, v in r.items() if k != "questions"} for r in responses]
+        )
+        running = await answer_buffer.running_score(session_id, engine)
+
+    return SessionProgress(
+        session_id=session_id,
+        answered=running.responses,
+        total_questions=len(await get_test_questions(test["id"])),
+        provisional_scores={str(k): v for k, v in running.scores().items()},
+    )
+
+
+@router.post("/{code}/sessions/{session_id}/answers", response_model=SessionProgress)
+async def submit_answers(
+    code: str,
+    session_id: str,
+    data: AnswerBatch,
+    current_user: Annotated[dict, Depends(get_current_user)],
+):
+    """검사 진행 중 답변 제출 (한 개 또는 소수) — 제출 후 잠정 점수 반환"""
+    test, engine = await _get_session_engine(code, session_id, current_user["id"])
+
+    await submit_responses(session_id, data.answers)
+    return await _session_progress(session_id, test, engine)
+
+
+@router.get("/{code}/sessions/{session_id}/progress", response_model=SessionProgress)
+async def get_session_progress(
+    code: str,
+    session_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+):
+    """진행률 표시용 잠정 점수 (누적 합계 — 다시 채점하지 않음)"""
+    test, engine = await _get_session_engine(code, session_id, current_user["id"])
+    return await _session_progress(session_id, test, engine)
+
+
 @router.post("/{code}/complete")
 async def complete_test(
     code: str,
@@ -110,11 +196,19 @@ async def complete_test(
             detail=f"Test engine for '{code}' not implemented",
         )
 
-    # Calculate scores (engine fetches responses from DB)
-    raw_scores, result_type = await engine.calculate_result(session_id)
+    # 제출 때 누적한 점수로 결과 구성 (버퍼가 불완전하면 DB에서 응답을 읽어 채점)
+    buffered = await answer_buffer.completed_session(session_id, engine, test["id"])
+    if buffered is not None:
+        scores, responses = buffered
+    else:
+        responses = await engine.get_responses(session_id)
+        scores = await engine.score_responses(responses)
+    raw_scores, result_type = engine.build_result(scores)
+    fraud = engine.detect_fraud(responses)
 
     # Save result
-    result = await complete_test_session(session_id, raw_scores, result_type)
+    result = await complete_test_session(session_id, raw_scores, result_type, fraud["score"])
+    answer_buffer.discard(session_id)
 
     if not result:
         raise HTTPException(
@@ -122,7 +216,16 @@ async def complete_test(
             detail="Failed to complete test session",
         )
 
-    return {
-        "result": result,
-        "interpretation": engine.interpret_result(raw_scores, result_type),
-    }
+    # 새 결과의 기여분만 능력치 상태에 반영 (전체 재계산 없음)
+    await record_test_result(result["user_id"], result["id"], code, raw_scores)
+    await record_fraud_detections(session_id, fraud["detections"])
+
+    # 해석의 정적 부분은 미리 직렬화된 바이트 — 사용자별 점수만 직렬화해 이어 붙임
+    body = b"".join((
+        b'{"result":',
+        dumps(result),
+        b',"interpretation":',
+        engine.interpret_result_json(raw_scores, result_type),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
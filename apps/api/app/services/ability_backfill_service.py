@@ -0,0 +1,177 @@
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+
+from app.services.ability_mapping import compute_ability_states
+from app.services.ability_service import replace_ability_states
+from app.services.rescoring_service import fetch_rows_in
+from app.services.supabase_client import get_supabase
+
+# 사용자 ID를 찾을 때 한 번에 읽는 test_results 행 수
+_USER_SCAN_ROWS = 1000
+# 재계산하는 동안 새 결과가 반영된 사용자를 다시 읽어 교체를 시도하는 횟수
+_REPLACE_ATTEMPTS = 3
+
+
+class BackfillStats:
+    """능력치 백필 진행 상황 (청크마다 누적)"""
+
+    def __init__(self):
+        self.users = 0
+        self.results = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.skipped = 0
+        self.started_at = time.perf_counter()
+
+    def add(self, chunk: "BackfillStats") -> None:
+        self.users += chunk.users
+        self.results += chunk.results
+        self.updated += chunk.updated
+        self.unchanged += chunk.unchanged
+        self.skipped += chunk.skipped
+
+    @property
+    def users_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started_at
+        return self.users / elapsed if elapsed > 0 else 0.0
+
+
+async def iter_result_users(
+    chunk_size: int, after: Optional[str] = None, since: Optional[str] = None
+) -> AsyncIterator[list[str]]:
+    """
+    검사 결과가 있는 사용자 ID를 id 순서로 chunk_size명씩 (after 이후부터).
+    since가 있으면 그 시각 이후에 결과가 생긴 사용자만.
+    user_id 기준 keyset 조회이므로 결과가 많은 사용자의 나머지 행은 건너뜁니다.
+    """
+    supabase = get_supabase()
+
+    users: list[str] = []
+    while True:
+        query = supabase.table("test_results").select("user_id")
+        if since:
+            query = query.gte("created_at", since)
+        if after:
+            query = query.gt("user_id", after)
+        result = await query.order("user_id").limit(_USER_SCAN_ROWS).execute()
+
+        rows = result.data or []
+        for row in rows:
+            user_id = row["user_id"]
+            if user_id is not None and (not users or users[-1] != user_id):
+                users.append(user_id)
+        while len(users) >= chunk_size:
+            yield users[:chunk_size]
+            users = users[chunk_size:]
+
+        if len(rows) < _USER_SCAN_ROWS or rows[-1]["user_id"] is None:
+            break
+        after = rows[-1]["user_id"]
+
+    if users:
+        yield users
+
+
+async def backfill_chunk(user_ids: list[str], stats: BackfillStats, dry_run: bool = False) -> None:
+    """
+    사용자 묶음의 검사 결과 전체로 능력치를 한 번에 다시 계산하고,
+    저장된 상태와 달라진 사용자만 replace_ability_states로 한 번에 교체합니다.
+    읽은 뒤 새 결과가 반영된 사용자는 교체하지 않고 다시 읽어 계산합니다 (최대 _REPLACE_ATTEMPTS번).
+    """
+    stats.users += len(user_ids)
+    pending = user_ids
+    for attempt in range(_REPLACE_ATTEMPTS):
+        changed, expected, n_results = await _recompute(pending)
+        if attempt == 0:
+            stats.results += n_results
+        stats.unchanged += len(pending) - len(changed)
+
+        conflicts = [] if dry_run else await replace_ability_states(changed, expected)
+        stats.updated += len(changed) - len(conflicts)
+        if not conflicts:
+            return
+        pending = conflicts
+
+    # 계속 결과가 반영되는 사용자는 apply_ability_result가 누적한 상태를 그대로 둠
+    stats.skipped += len(pending)
+
+
+async def _recompute(
+    user_ids: list[str],
+) -> tuple[dict[str, dict], dict[str, Optional[list[str]]], int]:
+    """(저장된 상태와 달라진 사용자별 새 상태, 사용자별 저장된 applied_results 스냅샷, 읽은 결과 수)"""
+    # 상태 스냅샷을 검사 결과보다 먼저 읽어야 그 사이 반영된 결과를 교체 시 알아챔
+    stored = await fetch_rows_in(
+        "user_ability_states",
+        "user_id, score_sums, score_counts, source_tests, completed_tests, applied_results",
+        "user_id", user_ids, ["user_id"],
+    )
+    results = await fetch_rows_in(
+        "test_results", "id, user_id, raw_scores, tests(code)", "user_id", user_ids,
+        ["user_id", "created_at", "id"],
+    )
+
+    by_user: dict[str, list[tuple[str, Optional[dict]]]] = {user_id: [] for user_id in user_ids}
+    applied: dict[str, list[str]] = {user_id: [] for user_id in user_ids}
+    for result in results:
+        applied[result["user_id"]].append(result["id"])
+        test_code = (result.get("tests") or {}).get("code")
+        if test_code:
+            by_user[result["user_id"]].append((test_code, result.get("raw_scores", {})))
+
+    states = compute_ability_states(list(by_user.values()))
+    for user_id, state in zip(by_user, states):
+        state["applied_results"] = sorted(applied[user_id])
+    # 반영한 결과 ID는 RPC가 완료 순서대로 덧붙이므로 정렬해서 비교
+    stored_by_user = {
+        row.pop("user_id"): {**row, "applied_results": sorted(row.get("applied_results") or [])}
+        for row in stored
+    }
+    changed = {
+        user_id: state
+        for user_id, state in zip(by_user, states)
+        if stored_by_user.get(user_id) != state
+    }
+    expected = {
+        user_id: stored_by_user[user_id]["applied_results"] if user_id in stored_by_user else None
+        for user_id in changed
+    }
+    return changed, expected, len(results)
+
+
+async def backfill_abilities(
+    chunk_size: int = 200,
+    concurrency: int = 4,
+    since: Optional[str] = None,
+    after: Optional[str] = None,
+    dry_run: bool = False,
+    stats: Optional[BackfillStats] = None,
+) -> AsyncIterator[tuple[str, BackfillStats]]:
+    """
+    검사 결과가 있는 사용자 전체(또는 since 이후 결과가 생긴 사용자)의 능력치를 청크 단위로 재계산합니다.
+    최대 concurrency개 청크를 동시에 조회·저장하고, 앞선 청크가 모두 끝난 순서대로
+    (마지막 사용자 ID, 누적 통계)를 내보내므로 호출자는 이를 체크포인트로 기록할 수 있습니다.
+    """
+    stats = stats or BackfillStats()
+    # (마지막 사용자 ID, 청크 통계, 작업) — 청크 통계는 순서대로 끝날 때 누적
+    pending: list[tuple[str, BackfillStats, asyncio.Task]] = []
+    try:
+        async for user_ids in iter_result_users(chunk_size, after, since):
+            chunk = BackfillStats()
+            task = asyncio.create_task(backfill_chunk(user_ids, chunk, dry_run=dry_run))
+            pending.append((user_ids[-1], chunk, task))
+            while len(pending) >= concurrency or (pending and pending[0][2].done()):
+                last_user_id, chunk, task = pending.pop(0)
+                await task
+                stats.add(chunk)
+                yield last_user_id, stats
+
+        while pending:
+            last_user_id, chunk, task = pending.pop(0)
+            await task
+            stats.add(chunk)
+            yield last_user_id, stats
+    finally:
+        for _, _, task in pending:
+            task.cancel()
@@ -0,0 +1,270 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.models.ability import ABILITY_DEFINITIONS
+
+# 검사별 능력치 매핑 (어떤 검사가 어떤 능력치에 기여하는지)
+TEST_ABILITY_MAPPING = {
+    "mbti": [
+        "determination",
+        "composure",
+        "creativity",
+        "analytical",
+        "communication",
+        "teamwork",
+        "leadership",
+        "empathy",
+        "planning",
+        "adaptability",
+    ],
+    "disc": [
+        "determination",
+        "communication",
+        "leadership",
+        "influence",
+        "execution",
+        "teamwork",
+        "adaptability",
+    ],
+    "enneagram": [
+        "composure",
+        "empathy",
+        "ambition",
+        "integrity",
+        "creativity",
+        "analytical",
+        "resilience",
+    ],
+    "tci": [
+        "composure",
+        "stress_resistance",
+        "resilience",
+        "integrity",
+        "adaptability",
+        "endurance",
+    ],
+    "gallup": [
+        "leadership",
+        "communication",
+        "execution",
+        "influence",
+        "networking",
+        "growth_potential",
+    ],
+    "holland": [
+        "creativity",
+        "analytical",
+        "execution",
+        "planning",
+        "aesthetic",
+        "spatial",
+    ],
+    "iq": [
+        "analytical",
+        "concentration",
+        "problem_solving",
+        "learning_speed",
+        "spatial",
+        "verbal",
+    ],
+    "mmpi": [
+        "stress_resistance",
+        "composure",
+        "resilience",
+        "empathy",
+        "adaptability",
+    ],
+    "tarot": ["intuition", "creativity", "growth_potential"],
+    "htp": [
+        "creativity",
+        "aesthetic",
+        "spatial",
+        "intuition",
+        "stress_resistance",
+    ],
+    "saju": ["growth_potential", "ambition", "resilience", "adaptability"],
+    "sasang": ["endurance", "stress_resistance", "adaptability", "composure"],
+    "face": ["intuition", "influence", "leadership", "communication"],
+    "blood": ["teamwork", "communication", "adaptability"],
+}
+
+# MBTI 유형 글자별 능력치 점수 (유형에 포함된 글자 점수의 평균)
+MBTI_LETTER_SCORES = {
+    "determination": {"E": 12, "I": 8, "T": 14, "F": 10, "J": 14, "P": 10},
+    "composure": {"I": 14, "E": 10, "T": 14, "F": 10, "J": 12, "P": 10},
+    "creativity": {"N": 16, "S": 10, "P": 14, "J": 10},
+    "analytical": {"T": 16, "F": 10, "N": 12, "S": 12},
+    "communication": {"E": 16, "I": 10, "F": 14, "T": 10},
+    "teamwork": {"F": 14, "T": 10, "S": 12, "N": 12},
+    "leadership": {"E": 14, "I": 10, "T": 12, "F": 12, "J": 14, "P": 10},
+    "empathy": {"F": 16, "T": 10, "E": 12, "I": 12},
+    "planning": {"J": 16, "P": 10, "S": 12, "N": 12},
+    "adaptability": {"P": 16, "J": 10, "N": 12, "S": 12},
+}
+
+# DISC 점수 → 능력치: (더할 점수들) × 계수
+DISC_COEFFICIENTS = {
+    "determination": (("D",), 0.8),
+    "communication": (("I",), 0.8),
+    "leadership": (("D", "I"), 0.4),
+    "influence": (("I",), 0.8),
+    "execution": (("D", "C"), 0.4),
+    "teamwork": (("S",), 0.8),
+    "adaptability": (("I", "S"), 0.4),
+}
+
+ABILITY_CODES = [ability["code"] for ability in ABILITY_DEFINITIONS]
+_ABILITY_INDEX = {code: i for i, code in enumerate(ABILITY_CODES)}
+
+MAX_SCORE = 20
+DEFAULT_SCORE = 10.0
+_NUMBER_TYPES = {int, float, bool}
+
+
+def _clip(value: float) -> float:
+    return float(min(MAX_SCORE, max(0.0, value)))
+
+
+def _to_float(value) -> float:
+    # 값이 null이면 nan, 숫자 문자열은 허용
+    return float("nan") if value is None else float(value)
+
+
+class AbilityTable(ABC):
+    """검사 하나의 결과 → 능력치 기여분 변환표"""
+
+    def __init__(self, test_code: str):
+        self.test_code = test_code
+        self.abilities = [code for code in TEST_ABILITY_MAPPING[test_code] if code in _ABILITY_INDEX]
+
+    @abstractmethod
+    def score(self, raw_scores: Optional[dict]) -> list[tuple[str, float]]:
+        """결과 하나 → [(능력치 코드, 점수)] (유효한 능력치만, 매핑 순서)"""
+
+
+class LetterTable(AbilityTable):
+    """유형 코드 글자(MBTI) → 포함된 글자 점수의 평균 (글자가 없으면 기본 10점)"""
+
+    def __init__(self, test_code: str, letter_scores: dict[str, dict[str, int]], code_length: int):
+        super().__init__(test_code)
+        self.code_length = code_length
+        # 능력치별 (글자, 점수) 목록 (매핑이 없는 능력치는 None)
+        self.letter_values = [
+            list(letter_scores[code].items()) if code in letter_scores else None
+            for code in self.abilities
+        ]
+
+    def score(self, raw_scores: Optional[dict]) -> list[tuple[str, float]]:
+        if not raw_scores:
+            return []
+        type_code = raw_scores.get("type")
+        if not isinstance(type_code, str) or len(type_code) != self.code_length:
+            # 유형이 없거나 형식이 맞지 않으면 기본 10점
+            return [(code, DEFAULT_SCORE) for code in self.abilities]
+
+        scores = []
+        for code, values in zip(self.abilities, self.letter_values):
+            present = [value for letter, value in values or () if letter in type_code]
+            scores.append((code, sum(present) / len(present) if present else DEFAULT_SCORE))
+        return scores
+
+
+class LinearTable(AbilityTable):
+    """점수 입력의 선형 결합 → ((선택한 입력 합) + offset) × factor / divisor, 0~20으로 제한"""
+
+    def __init__(
+        self,
+        test_code: str,
+        inputs: list[tuple[str, float]],
+        coefficients: dict[str, tuple[tuple[str, ...], float, float, float]],
+    ):
+        super().__init__(test_code)
+        self.inputs = inputs
+        names = [name for name, _ in inputs]
+        # 능력치별 (선택한 입력 위치, offset, factor, divisor) (매핑이 없는 능력치는 None → 기본 10점)
+        terms = [
+            (tuple(names.index(name) for name in coefficients[code][0]), *coefficients[code][1:])
+            if code in coefficients else None
+            for code in self.abilities
+        ]
+        # IQ처럼 여러 능력치가 같은 식이면 한 번만 계산
+        self.linear_terms = list(dict.fromkeys(term for term in terms if term is not None))
+        self.term_of = [-1 if term is None else self.linear_terms.index(term) for term in terms]
+
+    def score(self, raw_scores: Optional[dict]) -> list[tuple[str, float]]:
+        if not raw_scores:
+            return []
+        features = [_to_float(raw_scores.get(name, default)) for name, default in self.inputs]
+        values = [
+            _clip((sum([features[i] for i in selected]) + offset) * factor / divisor)
+            for selected, offset, factor, divisor in self.linear_terms
+        ]
+        return [
+            (code, values[k] if k >= 0 else DEFAULT_SCORE) for code, k in zip(self.abilities, self.term_of)
+        ]
+
+
+class DirectTable(AbilityTable):
+    """원점수에 능력치 코드와 같은 키가 있으면 그 값을 0~20으로 제한해 사용"""
+
+    def score(self, raw_scores: Optional[dict]) -> list[tuple[str, float]]:
+        if not raw_scores:
+            return []
+        return [
+            (code, _clip(value))
+            for code, value in zip(self.abilities, map(raw_scores.get, self.abilities))
+            if value.__class__ in _NUMBER_TYPES and value == value
+        ]
+
+
+def _build_tables() -> dict[str, AbilityTable]:
+    tables: dict[str, AbilityTable] = {}
+    for test_code in TEST_ABILITY_MAPPING:
+        if test_code == "mbti":
+            tables[test_code] = LetterTable(test_code, MBTI_LETTER_SCORES, code_length=4)
+        elif test_code == "disc":
+            tables[test_code] = LinearTable(
+                test_code,
+                [("D", 0), ("I", 0), ("S", 0), ("C", 0)],
+                {code: (selected, 0, factor, 1) for code, (selected, factor) in DISC_COEFFICIENTS.items()},
+            )
+        elif test_code == "iq":
+            # IQ 70~230 → 0~20
+            tables[test_code] = LinearTable(
+                test_code,
+                [("score", 100)],
+                {code: (("score",), -70, 1, 8) for code in TEST_ABILITY_MAPPING[test_code]},
+            )
+        else:
+            tables[test_code] = DirectTable(test_code)
+    return tables
+
+
+ABILITY_TABLES = _build_tables()
+
+
+def compute_ability_states(results_by_user: list[list[tuple[str, Optional[dict]]]]) -> list[dict]:
+    """
+    여러 사용자의 검사 결과 목록 → 사용자별 능력치 상태 (백필/전체 재계산용).
+    결과 순서대로 누적하므로 apply_test_result를 결과마다 호출한 것과 같은 상태입니다.
+    """
+    states = []
+    for results in results_by_user:
+        sums: dict[str, float] = {}
+        counts: dict[str, int] = {}
+        sources: dict[str, list[str]] = {}
+        for test_code, raw_scores in results:
+            table = ABILITY_TABLES.get(test_code)
+            if table is None:
+                continue
+            for ability_code, score in table.score(raw_scores):
+                sums[ability_code] = sums.get(ability_code, 0) + score
+                counts[ability_code] = counts.get(ability_code, 0) + 1
+                sources.setdefault(ability_code, []).append(test_code)
+        states.append({
+            "score_sums": sums,
+            "score_counts": counts,
+            "source_tests": sources,
+            "completed_tests": [test_code for test_code, _ in results],
+        })
+    return states
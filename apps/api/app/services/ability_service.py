@@ -1,6 +1,7 @@
 from typing import Optional
 from uuid import UUID
 
+from app.services.ability_mapping import ABILITY_TABLES, TEST_ABILITY_MAPPING, compute_ability_states
 from app.services.supabase_client import get_supabase
 from app.models.ability import (
     AbilityScore,
@@ -9,98 +10,15 @@ from app.models.ability import (
     ABILITY_DEFINITIONS,
 )
 
-
-# 검사별 능력치 매핑 (어떤 검사가 어떤 능력치에 기여하는지)
-TEST_ABILITY_MAPPING = {
-    "mbti": [
-        "determination",
-        "composure",
-        "creativity",
-        "analytical",
-        "communication",
-        "teamwork",
-        "leadership",
-        "empathy",
-        "planning",
-        "adaptability",
-    ],
-    "disc": [
-        "determination",
-        "communication",
-        "leadership",
-        "influence",
-        "execution",
-        "teamwork",
-        "adaptability",
-    ],
-    "enneagram": [
-        "composure",
-        "empathy",
-        "ambition",
-        "integrity",
-        "creativity",
-        "analytical",
-        "resilience",
-    ],
-    "tci": [
-        "composure",
-        "stress_resistance",
-        "resilience",
-        "integrity",
-        "adaptability",
-        "endurance",
-    ],
-    "gallup": [
-        "leadership",
-        "communication",
-        "execution",
-        "influence",
-        "networking",
-        "growth_potential",
-    ],
-    "holland": [
-        "creativity",
-        "analytical",
-        "execution",
-        "planning",
-        "aesthetic",
-        "spatial",
-    ],
-    "iq": [
-        "analytical",
-        "concentration",
-        "problem_solving",
-        "learning_speed",
-        "spatial",
-        "verbal",
-    ],
-    "mmpi": [
-        "stress_resistance",
-        "composure",
-        "resilience",
-        "empathy",
-        "adaptability",
-    ],
-    "tarot": ["intuition", "creativity", "growth_potential"],
-    "htp": [
-        "creativity",
-        "aesthetic",
-        "spatial",
-        "intuition",
-        "stress_resistance",
-    ],
-    "saju": ["growth_potential", "ambition", "resilience", "adaptability"],
-    "sasang": ["endurance", "stress_resistance", "adaptability", "composure"],
-    "face": ["intuition", "influence", "leadership", "communication"],
-    "blood": ["teamwork", "communication", "adaptability"],
-}
+# 재계산한 상태를 교체할 때 그 사이 다른 결과가 반영되면 다시 읽어 시도하는 횟수
+_REPLACE_ATTEMPTS = 3
 
 
 async def get_user_abilities(user_id: str) -> list[dict]:
     supabase = get_supabase()
 
     result = (
-        supabase.table("user_abilities")
+        await supabase.table("user_abilities")
         .select("*, abilities(*)")
         .eq("user_id", user_id)
         .execute()
@@ -111,48 +29,134 @@ async def get_user_abilities(user_id: str) -> list[dict]:
 
 async def calculate_abilities(user_id: str) -> AllAbilitiesResponse:
     """
-    사용자의 모든 검사 결과를 기반으로 30개 능력치를 계산합니다.
+    사용자의 모든 검사 결과를 기반으로 30개 능력치를 처음부터 다시 계산하고
+    능력치 상태(user_ability_states)를 새로 저장합니다.
+    계산하는 동안 다른 결과가 상태에 반영되면 덮어쓰지 않고 다시 계산합니다.
     """
+    for _ in range(_REPLACE_ATTEMPTS):
+        # 상태 스냅샷을 검사 결과보다 먼저 읽어야 그 사이 반영된 결과를 교체 시 알아챔
+        expected = await _applied_results(user_id)
+        state = await _compute_ability_state(user_id)
+        if not await replace_ability_states({user_id: state}, {user_id: expected}):
+            return build_abilities_response(state)
+
+    # 결과가 계속 반영되는 중이면 RPC가 누적한 현재 상태로 응답
+    return build_abilities_response(await get_ability_state(user_id) or state)
+
+
+async def _compute_ability_state(user_id: str) -> dict:
+    """검사 결과 전체로 계산한 능력치 상태 (반영한 결과 ID 포함)"""
     supabase = get_supabase()
 
     # Get all test results for user
     results = (
-        supabase.table("test_results")
-        .select("*, tests(code)")
+        await supabase.table("test_results")
+        .select("id, raw_scores, tests(code)")
         .eq("user_id", user_id)
         .execute()
     )
 
-    test_results = results.data or []
-    completed_tests = [r["tests"]["code"] for r in test_results if r.get("tests")]
+    test_results = []
+    for result in results.data or []:
+        test_code = (result.get("tests") or {}).get("code")
+        if test_code:
+            test_results.append((test_code, result.get("raw_scores", {})))
+    state = compute_ability_states([test_results])[0]
+    state["applied_results"] = sorted(result["id"] for result in results.data or [])
+    return state
 
-    # Initialize ability scores
-    ability_scores = {}
-    ability_sources = {}
 
-    for ability in ABILITY_DEFINITIONS:
-        code = ability["code"]
-        ability_scores[code] = []
-        ability_sources[code] = []
-
-    # Process each test result
-    for result in test_results:
-        test_code = result.get("tests", {}).get("code")
-        if not test_code:
-            continue
-
-        raw_scores = result.get("raw_scores", {})
-        mapped_abilities = TEST_ABILITY_MAPPING.get(test_code, [])
-
-        for ability_code in mapped_abilities:
-            if ability_code in ability_scores:
-                # Calculate score contribution (normalized to 0-20)
-                score = _calculate_ability_score(test_code, ability_code, raw_scores)
-                if score is not None:
-                    ability_scores[ability_code].append(score)
-                    ability_sources[ability_code].append(test_code)
-
-    # Aggregate scores
+async def record_test_result(
+    user_id: str, test_result_id: str, test_code: str, raw_scores: dict
+) -> AllAbilitiesResponse:
+    """
+    검사 완료 시 새 결과 하나의 기여분만 능력치 상태에 누적합니다.
+    누적은 apply_ability_result RPC가 상태 행을 잠근 채 DB에서 하므로 동시에 완료된 검사도 모두 반영되고,
+    같은 결과(test_result_id)는 여러 번 호출해도 한 번만 반영됩니다.
+    (상태가 아직 없으면 전체 재계산 — 방금 저장된 결과도 포함됨)
+    """
+    table = ABILITY_TABLES.get(test_code)
+    scores = dict(table.score(raw_scores)) if table is not None else {}
+
+    state = await _apply_ability_result(user_id, test_result_id, test_code, scores)
+    if state is None:
+        state = await _create_ability_state(user_id)
+    if state is None:
+        # 그 사이 다른 요청이 상태를 만들었으면 그 상태에 누적
+        state = await _apply_ability_result(user_id, test_result_id, test_code, scores)
+    return build_abilities_response(state)
+
+
+async def _apply_ability_result(
+    user_id: str, test_result_id: str, test_code: str, scores: dict[str, float]
+) -> Optional[dict]:
+    supabase = get_supabase()
+    result = await supabase.rpc("apply_ability_result", {
+        "p_user_id": user_id,
+        "p_result_id": test_result_id,
+        "p_test_code": test_code,
+        "p_scores": scores,
+    }).execute()
+    return result.data or None
+
+
+async def _create_ability_state(user_id: str) -> Optional[dict]:
+    """
+    상태가 없을 때 전체 재계산으로 처음 만듦. 이미 있으면 덮어쓰지 않고 None
+    (동시에 다른 요청이 먼저 만든 상태를 지우지 않도록 상태가 없을 때만 저장)
+    """
+    state = await _compute_ability_state(user_id)
+    if await replace_ability_states({user_id: state}, {user_id: None}):
+        return None
+    return state
+
+
+async def get_abilities_summary(user_id: str) -> AllAbilitiesResponse:
+    """저장된 능력치 상태로 응답을 만듭니다 (검사 결과 재조회·재계산 없음)"""
+    state = await get_ability_state(user_id)
+    if state is None:
+        return await calculate_abilities(user_id)
+    return build_abilities_response(state)
+
+
+def _empty_state() -> dict:
+    return {
+        "score_sums": {},
+        "score_counts": {},
+        "source_tests": {},
+        "completed_tests": [],
+    }
+
+
+def apply_test_result(state: dict, test_code: str, raw_scores: Optional[dict]) -> dict:
+    """검사 결과 하나의 능력치 기여분(점수 합계·개수·출처 검사)을 상태에 누적"""
+    state["completed_tests"].append(test_code)
+
+    table = ABILITY_TABLES.get(test_code)
+    if table is None:
+        return state
+
+    # 능력치 점수 (0~20으로 정규화) — 검사별 변환표로 한 번에 계산
+    for ability_code, score in table.score(raw_scores):
+        state["score_sums"][ability_code] = state["score_sums"].get(ability_code, 0) + score
+        state["score_counts"][ability_code] = state["score_counts"].get(ability_code, 0) + 1
+        state["source_tests"].setdefault(ability_code, []).append(test_code)
+
+    return state
+
+
+def _aggregate(state: dict, code: str) -> tuple[float, float]:
+    count = state["score_counts"].get(code, 0)
+    if count:
+        avg_score = state["score_sums"][code] / count
+        confidence = min(count / 3, 1.0)  # Max confidence at 3 tests
+    else:
+        avg_score = 10  # Default middle score
+        confidence = 0
+    return avg_score, confidence
+
+
+def build_abilities_response(state: dict) -> AllAbilitiesResponse:
     categories_data = {}
     total_score = 0
     total_abilities = 0
@@ -160,14 +164,7 @@ async def calculate_abilities(user_id: str) -> AllAbilitiesResponse:
     for ability in ABILITY_DEFINITIONS:
         code = ability["code"]
         category = ability["category"]
-        scores = ability_scores[code]
-
-        if scores:
-            avg_score = sum(scores) / len(scores)
-            confidence = min(len(scores) / 3, 1.0)  # Max confidence at 3 tests
-        else:
-            avg_score = 10  # Default middle score
-            confidence = 0
+        avg_score, confidence = _aggregate(state, code)
 
         ability_data = AbilityScore(
             code=code,
@@ -176,7 +173,7 @@ async def calculate_abilities(user_id: str) -> AllAbilitiesResponse:
             score=round(avg_score, 1),
             max_score=20,
             confidence=round(confidence, 2),
-            source_tests=ability_sources[code],
+            source_tests=state["source_tests"].get(code, []),
         )
 
         if category not in categories_data:
@@ -186,12 +183,8 @@ async def calculate_abilities(user_id: str) -> AllAbilitiesResponse:
         total_score += avg_score
         total_abilities += 1
 
-        # Save to database
-        await _save_user_ability(
-            user_id, code, avg_score, confidence, ability_sources[code]
-        )
-
     # Build response
+    completed_tests = state["completed_tests"]
     all_tests = list(TEST_ABILITY_MAPPING.keys())
     pending_tests = [t for t in all_tests if t not in completed_tests]
 
@@ -210,120 +203,49 @@ async def calculate_abilities(user_id: str) -> AllAbilitiesResponse:
     )
 
 
-def _calculate_ability_score(
-    test_code: str, ability_code: str, raw_scores: dict
-) -> Optional[float]:
-    """
-    검사 결과에서 특정 능력치 점수를 계산합니다.
-    실제 구현에서는 각 검사별로 세부적인 변환 로직이 필요합니다.
-    """
-    if not raw_scores:
-        return None
-
-    # 간단한 예시 로직 - 실제로는 검사별로 다른 알고리즘 적용
-    if test_code == "mbti":
-        # MBTI 유형에 따른 능력치 매핑
-        type_code = raw_scores.get("type", "")
-        return _mbti_to_ability(type_code, ability_code)
-
-    elif test_code == "disc":
-        # DISC 유형에 따른 능력치 매핑
-        d_score = raw_scores.get("D", 0)
-        i_score = raw_scores.get("I", 0)
-        s_score = raw_scores.get("S", 0)
-        c_score = raw_scores.get("C", 0)
-        return _disc_to_ability(d_score, i_score, s_score, c_score, ability_code)
-
-    elif test_code == "iq":
-        # IQ 점수 기반
-        iq_score = raw_scores.get("score", 100)
-        return min(20, max(0, (iq_score - 70) / 8))  # 70-230 -> 0-20
-
-    # 기본값: raw_scores에서 직접 매핑
-    if ability_code in raw_scores:
-        return min(20, max(0, raw_scores[ability_code]))
-
-    return None
-
-
-def _mbti_to_ability(type_code: str, ability_code: str) -> float:
-    """MBTI 유형을 능력치로 변환"""
-    if not type_code or len(type_code) != 4:
-        return 10.0
-
-    mappings = {
-        "determination": {"E": 12, "I": 8, "T": 14, "F": 10, "J": 14, "P": 10},
-        "composure": {"I": 14, "E": 10, "T": 14, "F": 10, "J": 12, "P": 10},
-        "creativity": {"N": 16, "S": 10, "P": 14, "J": 10},
-        "analytical": {"T": 16, "F": 10, "N": 12, "S": 12},
-        "communication": {"E": 16, "I": 10, "F": 14, "T": 10},
-        "teamwork": {"F": 14, "T": 10, "S": 12, "N": 12},
-        "leadership": {"E": 14, "I": 10, "T": 12, "F": 12, "J": 14, "P": 10},
-        "empathy": {"F": 16, "T": 10, "E": 12, "I": 12},
-        "planning": {"J": 16, "P": 10, "S": 12, "N": 12},
-        "adaptability": {"P": 16, "J": 10, "N": 12, "S": 12},
-    }
+async def get_ability_state(user_id: str) -> Optional[dict]:
+    supabase = get_supabase()
 
-    if ability_code not in mappings:
-        return 10.0
-
-    score = 0
-    count = 0
-    for letter, value in mappings[ability_code].items():
-        if letter in type_code:
-            score += value
-            count += 1
-
-    return score / count if count > 0 else 10.0
-
-
-def _disc_to_ability(d: float, i: float, s: float, c: float, ability_code: str) -> float:
-    """DISC 점수를 능력치로 변환"""
-    mappings = {
-        "determination": d * 0.8,
-        "communication": i * 0.8,
-        "leadership": (d + i) * 0.4,
-        "influence": i * 0.8,
-        "execution": (d + c) * 0.4,
-        "teamwork": s * 0.8,
-        "adaptability": (i + s) * 0.4,
-    }
+    result = (
+        await supabase.table("user_ability_states")
+        .select("score_sums, score_counts, source_tests, completed_tests")
+        .eq("user_id", user_id)
+        .execute()
+    )
 
-    return min(20, max(0, mappings.get(ability_code, 10)))
+    return result.data[0] if result.data else None
 
 
-async def _save_user_ability(
-    user_id: str,
-    ability_code: str,
-    score: float,
-    confidence: float,
-    source_tests: list[str],
-) -> None:
-    """사용자 능력치를 데이터베이스에 저장"""
+async def _applied_results(user_id: str) -> Optional[list[str]]:
+    """저장된 상태가 반영한 검사 결과 ID (상태가 없으면 None)"""
     supabase = get_supabase()
 
-    # Get ability ID
-    ability = (
-        supabase.table("abilities")
-        .select("id")
-        .eq("code", ability_code)
-        .single()
+    result = (
+        await supabase.table("user_ability_states")
+        .select("applied_results")
+        .eq("user_id", user_id)
         .execute()
     )
 
-    if not ability.data:
-        return
-
-    ability_id = ability.data["id"]
-
-    # Upsert user ability
-    supabase.table("user_abilities").upsert(
-        {
-            "user_id": user_id,
-            "ability_id": ability_id,
-            "score": score,
-            "confidence": confidence,
-            "source_tests": source_tests,
-        },
-        on_conflict="user_id,ability_id",
-    ).execute()
+    return sorted(result.data[0].get("applied_results") or []) if result.data else None
+
+
+async def replace_ability_states(
+    states: dict[str, dict], expected: dict[str, Optional[list[str]]]
+) -> list[str]:
+    """
+    여러 사용자의 능력치 상태와 능력치별 점수(user_abilities)를 한 번의 replace_ability_states RPC로 교체합니다.
+    저장된 applied_results가 expected(읽을 때의 스냅샷, 상태가 없었으면 None)와 같은 사용자만 교체하고,
+    그 사이 다른 결과가 반영되어 교체하지 않은 사용자 ID를 돌려줍니다 (호출자가 다시 읽어 재시도).
+    """
+    if not states:
+        return []
+    supabase = get_supabase()
+
+    result = await supabase.rpc("replace_ability_states", {
+        "p_states": [
+            {"user_id": user_id, "expected_results": expected.get(user_id), **state}
+            for user_id, state in states.items()
+        ],
+    }).execute()
+    return [str(user_id) for user_id in result.data or []]
@@ -0,0 +1,157 @@
+from typing import Any, Optional
+
+from app.config import settings
+from app.services.identity_cache import MISSING, TTLCache
+from app.services.supabase_client import get_supabase
+from app.services.test_catalog import get_catalog
+from app.tests_engine.base import BaseTestEngine
+from app.tests_engine.scoring import RunningScore
+
+
+class SessionAnswers:
+    """이 워커가 저장한 세션 응답 행 (insert가 돌려준 행 그대로)과 누적 점수"""
+
+    def __init__(self, user_id: Optional[str] = None, test_id: Optional[int] = None):
+        self.user_id = user_id
+        self.test_id = test_id
+        self.rows: list[dict] = []
+        self.running: Optional[RunningScore] = None
+
+
+# 세션 ID → SessionAnswers
+_buffers = TTLCache(settings.answer_buffer_max_sessions, settings.answer_buffer_ttl_seconds)
+
+
+def _entry(session_id: str) -> Optional[SessionAnswers]:
+    entry = _buffers.get(session_id)
+    return None if entry is MISSING else entry
+
+
+def open_session(session: dict) -> None:
+    """검사 시작 시 세션 소유자를 기록 (이미 버퍼가 있으면 유지)"""
+    if _entry(session["id"]) is None:
+        _buffers.set(session["id"], SessionAnswers(session.get("user_id"), session.get("test_id")))
+
+
+def record_responses(session_id: str, rows: list[dict]) -> None:
+    """
+    responses insert 직후 호출 — 저장된 행을 세션 버퍼에 추가.
+    버퍼가 없으면(재시작, 다른 워커에서 시작, TTL 만료) 새 행만으로 버퍼를 만들지 않고 건너뜁니다.
+    다음 조회가 seed_responses로 DB의 응답 전체를 채웁니다.
+    """
+    entry = _entry(session_id)
+    if entry is not None:
+        entry.rows.extend(rows)
+
+
+def seed_responses(session_id: str, rows: list[dict]) -> SessionAnswers:
+    """DB에서 읽은 세션 응답 전체로 버퍼를 채움 (기존 버퍼의 세션 소유자는 유지)"""
+    entry = _entry(session_id)
+    seeded = SessionAnswers(entry.user_id, entry.test_id) if entry is not None else SessionAnswers()
+    seeded.rows = list(rows)
+    _buffers.set(session_id, seeded)
+    return seeded
+
+
+def discard(session_id: str) -> None:
+    _buffers.invalidate(session_id)
+
+
+async def get_session_owner(session_id: str) -> Optional[tuple[str, int]]:
+    """세션의 (user_id, test_id) — 버퍼에 없으면 DB에서 읽어 기록"""
+    entry = _entry(session_id)
+    if entry is not None and entry.user_id is not None:
+        return entry.user_id, entry.test_id
+
+    supabase = get_supabase()
+    result = (
+        await supabase.table("test_sessions")
+        .select("user_id, test_id")
+        .eq("id", session_id)
+        .execute()
+    )
+    if not result.data:
+        return None
+
+    session = result.data[0]
+    if entry is not None:
+        entry.user_id, entry.test_id = session["user_id"], session["test_id"]
+    return session["user_id"], session["test_id"]
+
+
+async def running_score(session_id: str, engine: BaseTestEngine) -> Optional[RunningScore]:
+    """
+    세션의 누적 점수. 지난 호출 이후 들어온 응답만 더하므로 응답 하나당 O(1)입니다.
+    (카탈로그가 다시 적재되어 채점 계획이 바뀌면 버퍼 전체로 다시 누적)
+    """
+    entry = _entry(session_id)
+    if entry is None:
+        return None
+
+    plan = await engine.get_scoring_plan()
+    if entry.running is None or entry.running.plan is not plan:
+        entry.running = RunningScore(plan)
+    if entry.running.responses < len(entry.rows):
+        entry.running.add(entry.rows[entry.running.responses:])
+    return entry.running
+
+
+async def _verified_entry(session_id: str, test_id: int) -> Optional[SessionAnswers]:
+    """
+    DB가 원본이므로 버퍼가 세션의 응답 전체라는 것이 확인될 때만 버퍼를 반환합니다.
+    (다른 워커가 받은 제출, 재시작 등으로 버퍼가 불완전하거나
+    카탈로그에 없는 문항이 섞여 있으면 None — 호출자는 DB 조회로 대체)
+    """
+    entry = _entry(session_id)
+    if entry is None:
+        return None
+
+    catalog = await get_catalog()
+    questions = {q["id"] for q in catalog.questions_by_test_id.get(test_id, [])}
+    if any(row.get("question_id") not in questions for row in entry.rows):
+        return None
+
+    # 행 수만 세는 가벼운 조회로 버퍼가 완전한지 확인 (문항 조인 없음)
+    supabase = get_supabase()
+    result = (
+        await supabase.table("responses")
+        .select("id", count="exact")
+        .eq("session_id", session_id)
+        .limit(1)
+        .execute()
+    )
+    if result.count != len(entry.rows):
+        return None
+    return entry
+
+
+async def _ordered_responses(entry: SessionAnswers, test_id: int) -> list[dict]:
+    catalog = await get_catalog()
+    questions = {q["id"]: q for q in catalog.questions_by_test_id.get(test_id, [])}
+    position = {question_id: i for i, question_id in enumerate(questions)}
+    return [
+        {**row, "questions": questions[row["question_id"]]}
+        for row in sorted(entry.rows, key=lambda row: (position[row["question_id"]], row.get("id") or 0))
+    ]
+
+
+async def completed_session(
+    session_id: str, engine: BaseTestEngine, test_id: int
+) -> Optional[tuple[dict[Any, Any], list[dict]]]:
+    """
+    완료 시 세션 점수 {지표: 점수}와 문항 순서 응답 목록.
+    버퍼가 불완전하면 None (호출자는 DB에서 응답을 읽어 채점)
+
+    정수 항만 누적된 경우 누적 합계를 그대로 쓰고(O(1)),
+    실수 항이 섞였으면 기존과 같은 덧셈 순서를 위해 버퍼 응답을 문항 순서대로 채점합니다.
+    """
+    entry = await _verified_entry(session_id, test_id)
+    if entry is None:
+        return None
+
+    responses = await _ordered_responses(entry, test_id)
+    running = await running_score(session_id, engine)
+    if running is not None and running.exact and running.complete:
+        return running.scores(), responses
+
+    return await engine.score_responses(responses), responses
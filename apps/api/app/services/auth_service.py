@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
@@ -11,13 +13,24 @@ from app.services.supabase_client import get_supabase
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt는 호출당 수백 ms CPU를 쓰므로 이벤트 루프 밖 전용 스레드 풀에서 실행
+# (bcrypt는 해싱 중 GIL을 놓으므로 워커 수만큼 병렬 처리됨)
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, pwd_context.verify, plain_password, hashed_password
+    )
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -57,17 +70,17 @@ async def create_user(user_data: UserCreate) -> Optional[dict]:
 
     # Check if user already exists
     existing = (
-        supabase.table("users").select("id").eq("email", user_data.email).execute()
+        await supabase.table("users").select("id").eq("email", user_data.email).execute()
     )
     if existing.data:
         return None
 
     # Hash password
-    password_hash = get_password_hash(user_data.password)
+    password_hash = await get_password_hash(user_data.password)
 
     # Insert user
     result = (
-        supabase.table("users")
+        await supabase.table("users")
         .insert(
             {
                 "email": user_data.email,
@@ -95,7 +108,7 @@ async def authenticate_user(email: str, password: str) -> Optional[dict]:
     supabase = get_supabase()
 
     result = (
-        supabase.table("users")
+        await supabase.table("users")
         .select("*")
         .eq("email", email)
         .single()
@@ -106,7 +119,7 @@ async def authenticate_user(email: str, password: str) -> Optional[dict]:
         return None
 
     user = result.data
-    if not verify_password(password, user.get("password_hash", "")):
+    if not await verify_password(password, user.get("password_hash", "")):
         return None
 
     return user
@@ -116,7 +129,7 @@ async def get_user_by_id(user_id: str) -> Optional[dict]:
     supabase = get_supabase()
 
     result = (
-        supabase.table("users")
+        await supabase.table("users")
         .select("*")
         .eq("id", user_id)
         .single()
@@ -38,7 +38,7 @@ async def create_company_and_member(
     supabase = get_supabase()
 
     existing = (
-        supabase.table("company_members")
+        await supabase.table("company_members")
         .select("id")
         .eq("email", email)
         .execute()
@@ -47,7 +47,7 @@ async def create_company_and_member(
         return None
 
     company_result = (
-        supabase.table("companies")
+        await supabase.table("companies")
         .insert({
             "name": company_name,
             "industry": industry,
@@ -61,10 +61,10 @@ async def create_company_and_member(
         return None
 
     company = company_result.data[0]
-    password_hash = get_password_hash(password)
+    password_hash = await get_password_hash(password)
 
     member_result = (
-        supabase.table("company_members")
+        await supabase.table("company_members")
         .insert({
             "company_id": company["id"],
             "email": email,
@@ -85,7 +85,7 @@ async def authenticate_company_member(email: str, password: str) -> Optional[dic
     supabase = get_supabase()
 
     result = (
-        supabase.table("company_members")
+        await supabase.table("company_members")
         .select("*, companies(*)")
         .eq("email", email)
         .eq("is_active", True)
@@ -97,7 +97,7 @@ async def authenticate_company_member(email: str, password: str) -> Optional[dic
         return None
 
     member = result.data
-    if not verify_password(password, member.get("password_hash", "")):
+    if not await verify_password(password, member.get("password_hash", "")):
         return None
 
     return member
@@ -107,7 +107,7 @@ async def get_company_member_by_id(member_id: str) -> Optional[dict]:
     supabase = get_supabase()
 
     result = (
-        supabase.table("company_members")
+        await supabase.table("company_members")
         .select("*, companies(*)")
         .eq("id", member_id)
         .eq("is_active", True)
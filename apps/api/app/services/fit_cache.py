@@ -0,0 +1,146 @@
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.services.matching_service import JobColumns, calculate_fit_scores
+from app.services.seeker_store import SeekerStore
+
+# 공고 쪽 적합도 입력 (calculate_fit_score(seeker, job_posting, None, None)이 읽는 값)
+_JOB_FIT_FIELDS = ("required_abilities", "preferred_culture", "conditions")
+_SCORE_FIELDS = ("ability", "culture", "condition", "total")
+
+
+class _Entry:
+    """공고 하나 × 구직자 스토어 전체의 점수 (0.1점 단위 정수, 스토어 행 순서)"""
+
+    def __init__(self, store: SeekerStore, inputs: dict):
+        self.store = store
+        self.inputs = inputs
+        self.stale = False
+        self.compute()
+
+    def compute(self) -> None:
+        self.version = self.store.version
+        self.job = JobColumns.from_postings([self.inputs])
+        self.scores = _tenths(calculate_fit_scores(self.store.columns(), self.job))
+        self.stale = False
+
+    def patch(self) -> None:
+        """계산 이후 바뀐 구직자 행만 다시 계산 (새로 추가된 행 포함)"""
+        if self.version == self.store.version:
+            return
+        n = len(self.store)
+        if self.scores.shape[1] < n:
+            grown = np.zeros((len(_SCORE_FIELDS), max(n, self.scores.shape[1] * 2)), dtype=np.int16)
+            grown[:, :self.scores.shape[1]] = self.scores
+            self.scores = grown
+        rows = np.flatnonzero(self.store.row_versions > self.version)
+        if len(rows):
+            self.scores[:, rows] = _tenths(calculate_fit_scores(self.store.columns(rows), self.job))
+        self.version = self.store.version
+
+    def read(self) -> dict[str, np.ndarray]:
+        n = len(self.store)
+        return {field: self.scores[k, :n] / 10 for k, field in enumerate(_SCORE_FIELDS)}
+
+
+class FitScoreCache:
+    """
+    공고별 구직자 전체 적합도 점수의 LRU 캐시 (최근 조회한 공고 max_jobs개).
+    구직자 행이 바뀌면 그 행만, 공고 입력이 바뀌면 그 공고 전체를 다시 계산하며,
+    읽을 때도 남은 변경을 반영하므로 항상 calculate_fit_score와 같은 값을 돌려줍니다.
+    """
+
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, store: SeekerStore, job_posting: dict) -> dict[str, np.ndarray]:
+        job_id = str(job_posting["id"])
+        inputs = _job_inputs(job_posting)
+        entry = self._entries.get(job_id)
+        if entry is None or entry.store is not store or entry.inputs != inputs:
+            entry = _Entry(store, inputs)
+            self._entries[job_id] = entry
+        elif entry.stale:
+            entry.compute()
+        else:
+            entry.patch()
+
+        self._entries.move_to_end(job_id)
+        while len(self._entries) > max(self.max_jobs, 1):
+            self._entries.popitem(last=False)
+        return entry.read()
+
+    def mark_job(self, job_posting: dict) -> bool:
+        """공고 입력이 바뀌었으면 다시 계산할 대상으로 표시 (캐시에 없는 공고는 무시)"""
+        entry = self._entries.get(str(job_posting["id"]))
+        inputs = _job_inputs(job_posting)
+        if entry is None or entry.inputs == inputs:
+            return False
+        entry.inputs = inputs
+        entry.stale = True
+        return True
+
+    def discard(self, job_id: str) -> None:
+        self._entries.pop(job_id, None)
+
+    async def refresh(self) -> None:
+        """표시된 공고는 전체, 나머지는 바뀐 구직자 행만 다시 계산 (공고마다 이벤트 루프에 양보)"""
+        for job_id in list(self._entries):
+            entry = self._entries.get(job_id)
+            if entry is None:
+                continue
+            if entry.stale:
+                entry.compute()
+            else:
+                entry.patch()
+            await asyncio.sleep(0)
+
+
+def _job_inputs(job_posting: dict) -> dict:
+    return {field: job_posting.get(field) for field in _JOB_FIT_FIELDS}
+
+
+def _tenths(scores: dict[str, np.ndarray]) -> np.ndarray:
+    # 점수는 모두 소수 첫째 자리로 반올림된 값이므로 0.1점 단위 정수로 손실 없이 보관 (x / 10으로 같은 float 복원)
+    return np.stack([np.rint(scores[field] * 10) for field in _SCORE_FIELDS]).astype(np.int16)
+
+
+_cache = FitScoreCache(settings.fit_cache_max_jobs)
+_refresh_task: Optional[asyncio.Task] = None
+_refresh_pending = False
+
+
+def get_candidate_scores(store: SeekerStore, job_posting: dict) -> dict[str, np.ndarray]:
+    """공고 하나 × 스토어 구직자 전체 점수 (score_job_candidates와 같은 값, 캐시에서 읽음)"""
+    return _cache.get(store, job_posting)
+
+
+def schedule_fit_refresh() -> None:
+    """캐시된 점수의 백그라운드 재계산 예약 (이미 도는 중이면 끝난 뒤 한 번 더)"""
+    global _refresh_task, _refresh_pending
+    _refresh_pending = True
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_run_refresh())
+
+
+async def _run_refresh() -> None:
+    global _refresh_pending
+    while _refresh_pending:
+        _refresh_pending = False
+        await _cache.refresh()
+
+
+def refresh_job_scores(job_posting: dict) -> None:
+    """공고가 수정되면 (입력이 바뀐 경우) 그 공고의 점수를 백그라운드에서 다시 계산"""
+    if job_posting.get("status", "active") != "active":
+        _cache.discard(str(job_posting["id"]))
+    elif _cache.mark_job(job_posting):
+        schedule_fit_refresh()
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.services.identity_cache import MISSING, TTLCache
+from app.services.matching_service import calculate_fit_score
+from app.services.seeker_store import SEEKER_STORE_COLUMNS, seeker_fit_input
+from app.services.supabase_client import get_supabase
+
+# 매칭 점수 계산에 필요한 컬럼만
+COMPANY_FIT_COLUMNS = "id, culture_tags"
+JOB_FIT_COLUMNS = "id, company_id, required_abilities, preferred_culture, conditions"
+
+_companies = TTLCache(settings.fit_input_cache_max_entries, settings.fit_input_cache_ttl_seconds)
+_jobs = TTLCache(settings.fit_input_cache_max_entries, settings.fit_input_cache_ttl_seconds)
+
+
+async def _fetch_one(table: str, columns: str, row_id: str) -> Optional[dict]:
+    supabase = get_supabase()
+    result = await supabase.table(table).select(columns).eq("id", row_id).execute()
+    return result.data[0] if result.data else None
+
+
+async def get_company_fit_input(company_id: str) -> Optional[dict]:
+    company = _companies.get(company_id)
+    if company is MISSING:
+        company = await _fetch_one("companies", COMPANY_FIT_COLUMNS, company_id)
+        if company is None:
+            return None
+        _companies.set(company_id, company)
+    return company
+
+
+async def get_job_fit_input(job_posting_id: Optional[str]) -> Optional[dict]:
+    if not job_posting_id:
+        return None
+    job = _jobs.get(job_posting_id)
+    if job is MISSING:
+        job = await _fetch_one("job_postings", JOB_FIT_COLUMNS, job_posting_id)
+        if job is None:
+            return None
+        _jobs.set(job_posting_id, job)
+    return job
+
+
+async def get_seeker_fit_input(seeker_profile_id: str) -> tuple[dict, Optional[np.ndarray]]:
+    """구직자 스토어에 있으면 그대로 사용 (DB 조회 없음), 없으면 매칭 컬럼만 조회"""
+    cached = seeker_fit_input(seeker_profile_id)
+    if cached is not None:
+        return cached
+    seeker = await _fetch_one("seeker_profiles", SEEKER_STORE_COLUMNS, seeker_profile_id)
+    return seeker or {}, None
+
+
+def invalidate_company_fit_input(company_id: str) -> None:
+    _companies.invalidate(company_id)
+
+
+def invalidate_job_fit_input(job_posting_id: str) -> None:
+    _jobs.invalidate(job_posting_id)
+
+
+async def compute_fit_score(
+    seeker_profile_id: str, company_id: str, job_posting_id: Optional[str]
+) -> dict:
+    """
+    (구직자, 기업, 공고) 매칭 점수. 입력은 캐시에서 읽고,
+    캐시에 없는 것만 동시에 조회합니다 (모두 캐시에 있으면 DB 왕복 없음).
+    """
+    (seeker, abilities), company, job = await asyncio.gather(
+        get_seeker_fit_input(seeker_profile_id),
+        get_company_fit_input(company_id),
+        get_job_fit_input(job_posting_id),
+    )
+    return calculate_fit_score(seeker, job or {}, company, None, abilities=abilities)
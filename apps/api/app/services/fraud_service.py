@@ -0,0 +1,100 @@
+import time
+from typing import AsyncIterator, Optional
+
+from app.services.rescoring_service import fetch_session_rows, iter_completed_sessions
+from app.services.supabase_client import get_supabase
+from app.services.test_catalog import get_catalog
+from app.tests_engine.fraud import DETECTIONS, detect_batch
+
+_DETECTION_TYPES = [detection_type for detection_type, _, _ in DETECTIONS]
+
+
+class FraudScanStats:
+    """부정행위 재검사 진행 상황 (청크마다 누적)"""
+
+    def __init__(self):
+        self.sessions = 0
+        self.flagged = 0
+        self.detections = 0
+        self.started_at = time.perf_counter()
+
+    @property
+    def sessions_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started_at
+        return self.sessions / elapsed if elapsed > 0 else 0.0
+
+
+async def rescan_chunk(
+    test_id: int,
+    session_ids: list[str],
+    stats: FraudScanStats,
+    dry_run: bool = False,
+) -> None:
+    """
+    세션 묶음의 응답을 한 번에 읽어 detect_batch로 판정하고
+    fraud_score는 bulk upsert, 탐지 로그는 세션별로 지우고 다시 bulk insert 합니다.
+    """
+    catalog = await get_catalog()
+    position = {q["id"]: i for i, q in enumerate(catalog.questions_by_test_id.get(test_id, []))}
+    last = len(position)
+
+    responses = await fetch_session_rows(
+        "responses",
+        "session_id, question_id, answer, response_time_ms, typing_pattern",
+        session_ids,
+        ["session_id", "id"],
+    )
+    by_session: dict[str, list[dict]] = {session_id: [] for session_id in session_ids}
+    for response in responses:
+        by_session[response["session_id"]].append(response)
+
+    # 연속 동일 응답 판정을 위해 문항 순서로 정렬 (완료 시 판정과 같은 순서)
+    reports = detect_batch([
+        sorted(by_session[session_id], key=lambda r: position.get(r["question_id"], last))
+        for session_id in session_ids
+    ])
+
+    logs = [
+        {"session_id": session_id, **detection}
+        for session_id, report in zip(session_ids, reports)
+        for detection in report["detections"]
+    ]
+
+    if not dry_run:
+        supabase = get_supabase()
+        await supabase.table("test_sessions").upsert(
+            [{"id": session_id, "fraud_score": report["score"]} for session_id, report in zip(session_ids, reports)],
+            on_conflict="id",
+        ).execute()
+        await (
+            supabase.table("fraud_detection_logs")
+            .delete()
+            .in_("session_id", session_ids)
+            .in_("detection_type", _DETECTION_TYPES)
+            .execute()
+        )
+        if logs:
+            await supabase.table("fraud_detection_logs").insert(logs).execute()
+
+    stats.sessions += len(session_ids)
+    stats.flagged += sum(1 for report in reports if report["detections"])
+    stats.detections += len(logs)
+
+
+async def rescan_test(
+    test_code: str,
+    chunk_size: int = 200,
+    after: Optional[str] = None,
+    dry_run: bool = False,
+    stats: Optional[FraudScanStats] = None,
+) -> AsyncIterator[tuple[str, FraudScanStats]]:
+    """검사의 완료된 세션 전체를 청크 단위로 다시 판정 (청크마다 (마지막 세션 ID, 누적 통계))"""
+    catalog = await get_catalog()
+    test = catalog.tests_by_code.get(test_code)
+    if test is None:
+        raise ValueError(f"Unknown test '{test_code}'")
+
+    stats = stats or FraudScanStats()
+    async for session_ids in iter_completed_sessions(test["id"], chunk_size, after):
+        await rescan_chunk(test["id"], session_ids, stats, dry_run=dry_run)
+        yield session_ids[-1], stats
@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from app.config import settings
+from app.services.auth_service import get_user_by_id
+from app.services.company_auth_service import get_company_member_by_id
+from app.services.supabase_client import get_supabase
+
+# 캐시에 없음 (None도 캐시할 수 있으므로 별도 표식 — TTLCache 사용처는 `is MISSING`으로 확인)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)과 최대 항목 수(LRU 제거)를 가진 프로세스 내 캐시.
+    인증된 요청마다 반복되는 사용자/기업 멤버/프로필 ID 조회를 줄이는 데 사용합니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key) -> Any:
+        """저장된 값, 없거나 만료되었으면 MISSING"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> None:
+        for key in [k for k, (_, v) in self._entries.items() if predicate(v)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_users = TTLCache(settings.identity_cache_max_entries, settings.identity_cache_ttl_seconds)
+_members = TTLCache(settings.identity_cache_max_entries, settings.identity_cache_ttl_seconds)
+_seeker_profile_ids = TTLCache(settings.identity_cache_max_entries, settings.identity_cache_ttl_seconds)
+
+
+async def get_user(user_id: str) -> Optional[dict]:
+    user = _users.get(user_id)
+    if user is MISSING:
+        user = await get_user_by_id(user_id)
+        if user is None:
+            return None
+        _users.set(user_id, user)
+    return user
+
+
+async def get_company_member(member_id: str) -> Optional[dict]:
+    member = _members.get(member_id)
+    if member is MISSING:
+        member = await get_company_member_by_id(member_id)
+        if member is None:
+            return None
+        _members.set(member_id, member)
+    return member
+
+
+async def get_seeker_profile_id(user_id: str) -> Optional[str]:
+    """사용자의 구직자 프로필 ID (프로필이 없으면 None — 없는 결과는 캐시하지 않음)"""
+    profile_id = _seeker_profile_ids.get(user_id)
+    if profile_id is MISSING:
+        supabase = get_supabase()
+        result = (
+            await supabase.table("seeker_profiles")
+            .select("id")
+            .eq("user_id", user_id)
+            .execute()
+        )
+        if not result.data:
+            return None
+        profile_id = result.data[0]["id"]
+        _seeker_profile_ids.set(user_id, profile_id)
+    return profile_id
+
+
+def invalidate_seeker_profile(user_id: str) -> None:
+    _seeker_profile_ids.invalidate(user_id)
+
+
+def invalidate_company(company_id: str) -> None:
+    """기업 정보 변경 시 해당 기업 멤버 캐시(companies(*) 조인 포함) 제거"""
+    _members.invalidate_where(lambda member: member.get("company_id") == company_id)
@@ -0,0 +1,166 @@
+import asyncio
+import time
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.services.matching_service import JobColumns, SeekerColumns, calculate_fit_scores
+from app.services.supabase_client import get_supabase
+
+# 매칭 점수 계산에 필요한 컬럼만 조회
+JOB_STORE_COLUMNS = "id, required_abilities, preferred_culture, conditions"
+_JOB_STORE_FIELDS = [column.strip() for column in JOB_STORE_COLUMNS.split(",")]
+_FETCH_CHUNK = 1000
+# 적재 후 바뀐 공고가 이보다 많아지면 기준 행렬을 다시 만듦
+_OVERLAY_LIMIT = 512
+
+
+class JobStore:
+    """
+    추천 공고 계산용 활성 공고 행렬.
+    적재 시점의 공고 전체로 기준 JobColumns를 만들고, 그 뒤 생성·수정된 공고는
+    작은 추가 행렬에 따로 모읍니다 (기준 행렬의 예전 행은 제외 표시).
+    추가 행렬이 _OVERLAY_LIMIT을 넘으면 전체를 다시 만듭니다.
+    """
+
+    def __init__(self, rows: list[dict]):
+        self._rows: dict[str, dict] = {}
+        for row in rows:
+            self._rows[str(row["id"])] = _fit_fields(row)
+        self._rebuild()
+        self.loaded_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+
+    def upsert(self, row: dict) -> None:
+        job_id = str(row["id"])
+        self._rows[job_id] = _fit_fields(row)
+        self._retire(job_id)
+        self._overlay[job_id] = self._rows[job_id]
+        self._overlay_columns = None
+        if len(self._overlay) > _OVERLAY_LIMIT:
+            self._rebuild()
+
+    def remove(self, job_id: str) -> None:
+        if self._rows.pop(job_id, None) is None:
+            return
+        self._retire(job_id)
+        if self._overlay.pop(job_id, None) is not None:
+            self._overlay_columns = None
+
+    def score(self, seeker: SeekerColumns) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """구직자 한 명 × 활성 공고 전체의 (공고 ID 배열, calculate_fit_scores 결과)"""
+        parts = []
+        if self._live.any():
+            scores = calculate_fit_scores(seeker, self._base)
+            parts.append((self._ids[self._live], {k: v[self._live] for k, v in scores.items()}))
+        if self._overlay:
+            if self._overlay_columns is None:
+                self._overlay_ids = np.array(list(self._overlay), dtype="U36")
+                self._overlay_columns = JobColumns.from_postings(list(self._overlay.values()))
+            parts.append((self._overlay_ids, calculate_fit_scores(seeker, self._overlay_columns)))
+
+        if not parts:
+            empty = np.empty(0)
+            return np.empty(0, dtype="U36"), {k: empty for k in ("ability", "culture", "condition", "total")}
+        if len(parts) == 1:
+            return parts[0]
+        return (
+            np.concatenate([ids for ids, _ in parts]),
+            {k: np.concatenate([scores[k] for _, scores in parts]) for k in parts[0][1]},
+        )
+
+    def _rebuild(self) -> None:
+        self._ids = np.array(list(self._rows), dtype="U36")
+        self._base = JobColumns.from_postings(list(self._rows.values()))
+        self._base_index = {job_id: i for i, job_id in enumerate(self._rows)}
+        self._live = np.ones(len(self._ids), dtype=bool)
+        self._overlay: dict[str, dict] = {}
+        self._overlay_columns: Optional[JobColumns] = None
+
+    def _retire(self, job_id: str) -> None:
+        i = self._base_index.pop(job_id, None)
+        if i is not None:
+            self._live[i] = False
+
+
+def _fit_fields(row: dict) -> dict:
+    return {field: row.get(field) for field in _JOB_STORE_FIELDS}
+
+
+_store: Optional[JobStore] = None
+_store_lock = asyncio.Lock()
+# 다시 적재하는 동안 들어온 변경 (적재한 행보다 나중일 수 있으므로 새 스토어에 다시 반영)
+_pending_syncs: Optional[list[dict]] = None
+
+
+async def fetch_active_jobs(columns: str = JOB_STORE_COLUMNS) -> list[dict]:
+    """활성 공고 전체를 id 순서로 청크 단위로 조회 (columns에 id 포함)"""
+    supabase = get_supabase()
+
+    rows = []
+    last_id = None
+    while True:
+        query = (
+            supabase.table("job_postings")
+            .select(columns)
+            .eq("status", "active")
+        )
+        # id 기준 keyset — 조회 중 행이 추가·삭제되어도 건너뛰거나 중복되지 않음
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        result = await query.order("id").limit(_FETCH_CHUNK).execute()
+
+        chunk = result.data or []
+        rows.extend(chunk)
+        if len(chunk) < _FETCH_CHUNK:
+            return rows
+        last_id = chunk[-1]["id"]
+
+
+async def get_job_store() -> JobStore:
+    """
+    공고 스토어를 반환합니다. 처음 호출 시 전체를 적재하고,
+    다른 워커에서 일어난 변경을 반영하기 위해 job_store_ttl_seconds 마다 다시 적재합니다.
+    """
+    global _store, _pending_syncs
+
+    if _store is not None and time.monotonic() - _store.loaded_at < settings.job_store_ttl_seconds:
+        return _store
+
+    async with _store_lock:
+        if _store is None or time.monotonic() - _store.loaded_at >= settings.job_store_ttl_seconds:
+            _pending_syncs = []
+            try:
+                store = JobStore(await fetch_active_jobs())
+                for row in _pending_syncs:
+                    _apply_sync(store, row)
+                _store = store
+            finally:
+                _pending_syncs = None
+        return _store
+
+
+def sync_job_posting(row: dict) -> None:
+    """
+    변경된 job_postings 행을 스토어에 반영 (아직 적재 전이면 다음 적재 때 반영됨).
+    다시 적재하는 중이면 새 스토어에도 다시 반영되도록 기록합니다.
+    """
+    if not row.get("id"):
+        return
+    if _pending_syncs is not None:
+        _pending_syncs.append(row)
+    if _store is not None:
+        _apply_sync(_store, row)
+
+
+def _apply_sync(store: JobStore, row: dict) -> None:
+    if row.get("status") == "active":
+        store.upsert(row)
+    else:
+        store.remove(str(row["id"]))
@@ -1,5 +1,67 @@
-import math
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
+
+from app.models.ability import ABILITY_DEFINITIONS
+
+
+# 능력치 벡터 컬럼 순서 (ABILITY_DEFINITIONS 순서 고정)
+ABILITY_COLUMNS = [a["code"] for a in ABILITY_DEFINITIONS]
+
+# 프론트엔드(abilities_snapshot, 공고 required_abilities)에서 쓰는 키 → 능력치 코드
+ABILITY_KEY_ALIASES = {
+    "decisiveness": "determination",
+    "focus": "concentration",
+    "analysis": "analytical",
+    "cooperation": "teamwork",
+    "problemSolving": "problem_solving",
+    "timeManagement": "time_management",
+    "precision": "attention_detail",
+    "stressTolerance": "stress_resistance",
+    "aesthetics": "aesthetic",
+    "spatialAwareness": "spatial",
+    "verbalAbility": "verbal",
+    "growthPotential": "growth_potential",
+    "learningSpeed": "learning_speed",
+    "diligence": "integrity",
+}
+
+_COLUMN_INDEX = {code: i for i, code in enumerate(ABILITY_COLUMNS)}
+
+# 문화 태그 → 어울리는 MBTI/DISC 성향 글자 (유형에 하나라도 있으면 매칭)
+CULTURE_KEYWORDS = {
+    "자율출퇴근": ["P", "I"],
+    "수평문화": ["P", "S", "I"],
+    "성과중심": ["J", "D", "C"],
+    "데이터중심": ["T", "C"],
+    "팀워크중심": ["E", "S", "I"],
+    "혁신적": ["N", "D", "I"],
+    "안정적": ["S", "J", "S"],
+    "성장지향": ["N", "D"],
+}
+
+# 문화 적합도 비트마스크: 성향 글자마다 한 비트, 문화 태그마다 한 비트 (CULTURE_KEYWORDS 순서)
+_LETTER_BITS = {
+    letter: 1 << i
+    for i, letter in enumerate(sorted({k for keywords in CULTURE_KEYWORDS.values() for k in keywords}))
+}
+_CULTURE_TAG_BITS = {tag: 1 << i for i, tag in enumerate(CULTURE_KEYWORDS)}
+_TAG_LETTER_MASKS = [
+    sum({_LETTER_BITS[k] for k in keywords}) for keywords in CULTURE_KEYWORDS.values()
+]
+# 성향 글자 조합 → 매칭되는 문화 태그 비트
+_CULTURE_BITS_BY_LETTERS = [
+    sum(1 << i for i, mask in enumerate(_TAG_LETTER_MASKS) if letters & mask)
+    for letters in range(1 << len(_LETTER_BITS))
+]
+# 문화 태그 비트 조합 → 켜진 비트 수 (np.bitwise_count는 NumPy 2.0 이상에만 있음)
+_TAG_POPCOUNT = np.array([bin(bits).count("1") for bits in range(1 << len(CULTURE_KEYWORDS))], dtype=np.int64)
+# comprehensive_profile이 없는 구직자 (문화 적합도 50점 고정)
+NO_CULTURE_PROFILE = -1
+
+
+def ability_code(key: str) -> str:
+    return ABILITY_KEY_ALIASES.get(key, key)
 
 
 def calculate_fit_score(
@@ -7,9 +69,10 @@ def calculate_fit_score(
     job_posting: dict,
     company: Optional[dict],
     team_profile: Optional[dict],
+    abilities: Optional[np.ndarray] = None,
 ) -> dict:
     ability_fit = calc_ability_fit(
-        seeker_profile.get("abilities_snapshot"),
+        abilities if abilities is not None else seeker_profile.get("abilities_snapshot"),
         job_posting.get("required_abilities"),
     )
     culture_fit = calc_culture_fit(
@@ -30,36 +93,17 @@ def calculate_fit_score(
 
 
 def calc_ability_fit(
-    abilities_snapshot: Optional[list],
+    abilities_snapshot: Union[list, np.ndarray, None],
     required_abilities: Optional[dict],
 ) -> float:
-    if not abilities_snapshot or not required_abilities:
-        return 50.0
-
     # abilities_snapshot: [{"key": "leadership", "score": 75, ...}, ...]
-    seeker_map = {}
-    for a in abilities_snapshot:
-        if isinstance(a, dict) and "key" in a:
-            seeker_map[a["key"]] = a.get("score", 0)
-
-    if not seeker_map or not required_abilities:
-        return 50.0
-
-    total_diff = 0
-    count = 0
-    for key, req in required_abilities.items():
-        min_score = req.get("min", 0) if isinstance(req, dict) else req
-        seeker_score = seeker_map.get(key, 50)
-        diff = max(0, min_score - seeker_score)
-        total_diff += diff ** 2
-        count += 1
-
-    if count == 0:
-        return 50.0
-
-    rmse = math.sqrt(total_diff / count)
-    score = max(0, 100 - rmse * 2)
-    return score
+    # 또는 SeekerStore에 미리 계산된 능력치 행
+    vector = (
+        abilities_snapshot
+        if isinstance(abilities_snapshot, np.ndarray)
+        else ability_vector(abilities_snapshot)
+    )
+    return float(calc_ability_fit_batch(vector[np.newaxis, :], required_abilities)[0])
 
 
 def calc_culture_fit(
@@ -72,36 +116,11 @@ def calc_culture_fit(
 
     score = 50.0
 
-    # 문화 태그 매칭
+    # 문화 태그 매칭 (MBTI/DISC 기반 문화 성향)
     if culture_tags and isinstance(culture_tags, list):
-        # MBTI/DISC 기반 문화 성향 매칭
-        mbti = comprehensive_profile.get("mbti", {})
-        disc = comprehensive_profile.get("disc", {})
-
-        culture_keywords = {
-            "자율출퇴근": ["P", "I"],
-            "수평문화": ["P", "S", "I"],
-            "성과중심": ["J", "D", "C"],
-            "데이터중심": ["T", "C"],
-            "팀워크중심": ["E", "S", "I"],
-            "혁신적": ["N", "D", "I"],
-            "안정적": ["S", "J", "S"],
-            "성장지향": ["N", "D"],
-        }
-
-        mbti_type = mbti.get("type", "")
-        disc_type = disc.get("type", "")
-        combined = mbti_type + disc_type
-
-        match_count = 0
-        total_tags = len(culture_tags)
-        for tag in culture_tags:
-            keywords = culture_keywords.get(tag, [])
-            if any(k in combined for k in keywords):
-                match_count += 1
-
-        if total_tags > 0:
-            score = 30 + (match_count / total_tags) * 70
+        bits = seeker_culture_bits(comprehensive_profile)
+        match_count = sum((bits & layer).bit_count() for layer in culture_tag_layers(culture_tags))
+        score = 30 + (match_count / len(culture_tags)) * 70
 
     # 팀 프로필 기반 보정
     if team_profile and team_profile.get("current_team_types"):
@@ -166,3 +185,357 @@ def calc_condition_fit(
         return 70.0
 
     return score / checks
+
+
+# ---- 배치(벡터화) 계산 ----
+
+def ability_vector(abilities_snapshot: Optional[list]) -> np.ndarray:
+    """abilities_snapshot을 ABILITY_COLUMNS 순서의 벡터로 변환 (없는 능력치는 NaN)"""
+    vector = np.full(len(ABILITY_COLUMNS), np.nan)
+    for a in abilities_snapshot or []:
+        if isinstance(a, dict) and "key" in a:
+            column = _COLUMN_INDEX.get(ability_code(a["key"]))
+            if column is not None:
+                vector[column] = a.get("score", 0)
+    return vector
+
+
+def calc_ability_fit_batch(
+    ability_matrix: np.ndarray,
+    required_abilities: Optional[dict],
+) -> np.ndarray:
+    """
+    calc_ability_fit의 벡터화 버전.
+    ability_matrix: (N, len(ABILITY_COLUMNS)) 구직자 능력치 행렬
+    """
+    n = ability_matrix.shape[0]
+    if not required_abilities:
+        return np.full(n, 50.0)
+
+    columns = []
+    mins = []
+    for key, req in required_abilities.items():
+        columns.append(_COLUMN_INDEX.get(ability_code(key), -1))
+        mins.append(req.get("min", 0) if isinstance(req, dict) else req)
+    columns = np.asarray(columns)
+    known = columns >= 0
+
+    # 스냅샷에 없는 능력치는 50점으로 간주
+    seeker_scores = np.full((n, len(columns)), 50.0)
+    seeker_scores[:, known] = ability_matrix[:, columns[known]]
+    seeker_scores[np.isnan(seeker_scores)] = 50.0
+
+    diff = np.maximum(0.0, np.asarray(mins, dtype=np.float64) - seeker_scores)
+    rmse = np.sqrt((diff ** 2).sum(axis=1) / len(columns))
+    fit = np.maximum(0.0, 100 - rmse * 2)
+
+    # 능력치 스냅샷이 비어 있는 구직자는 기본값
+    has_abilities = ~np.isnan(ability_matrix).all(axis=1)
+    return np.where(has_abilities, fit, 50.0)
+
+
+def seeker_culture_bits(comprehensive_profile: Optional[dict]) -> int:
+    """
+    구직자 MBTI+DISC 유형이 어울리는 문화 태그의 비트마스크 (CULTURE_KEYWORDS 순서).
+    프로필이 없으면 NO_CULTURE_PROFILE
+    """
+    if not comprehensive_profile:
+        return NO_CULTURE_PROFILE
+    mbti = comprehensive_profile.get("mbti", {})
+    disc = comprehensive_profile.get("disc", {})
+    letters = 0
+    for letter in mbti.get("type", "") + disc.get("type", ""):
+        letters |= _LETTER_BITS.get(letter, 0)
+    return _CULTURE_BITS_BY_LETTERS[letters]
+
+
+def culture_tag_layers(culture_tags: list) -> list[int]:
+    """
+    공고/기업 문화 태그를 비트마스크 층으로 변환합니다.
+    k번째 층은 k+1번 이상 나온 태그들이므로, 매칭 태그 수 = 층마다 (구직자 비트 & 층)의 popcount 합.
+    모르는 태그는 비트가 없어 총 태그 수에만 들어갑니다.
+    """
+    counts: dict[int, int] = {}
+    for tag in culture_tags:
+        bit = _CULTURE_TAG_BITS.get(tag)
+        if bit:
+            counts[bit] = counts.get(bit, 0) + 1
+
+    layers: list[int] = []
+    for bit, count in counts.items():
+        for k in range(count):
+            if k == len(layers):
+                layers.append(0)
+            layers[k] |= bit
+    return layers
+
+
+def calc_culture_fit_batch(
+    culture_bits: np.ndarray,
+    culture_tags: Optional[list],
+    team_profile: Optional[dict],
+) -> np.ndarray:
+    """
+    calc_culture_fit의 벡터화 버전.
+    culture_bits: (N,) 구직자별 seeker_culture_bits 값
+    """
+    jobs = JobColumns.from_postings([{}], culture_tags=[culture_tags], team_profiles=[team_profile])
+    return _culture_fit_pairs(culture_bits, jobs)
+
+
+class SeekerColumns:
+    """
+    구직자 N명의 적합도 입력 (열 단위).
+    - abilities: (N, len(ABILITY_COLUMNS)) 능력치 행렬 (없는 값은 NaN)
+    - culture_bits: (N,) seeker_culture_bits 값
+    - condition_codes: (N,) 고유 조건 입력 인덱스 → remote_pref / experience_years / location_pref (고유값 열)
+    """
+
+    def __init__(
+        self,
+        abilities: np.ndarray,
+        culture_bits: np.ndarray,
+        condition_codes: np.ndarray,
+        condition_inputs: list[dict],
+    ):
+        self.abilities = abilities
+        self.culture_bits = culture_bits
+        self.condition_codes = condition_codes
+        self.remote_pref = np.array([c.get("remote_pref") for c in condition_inputs], dtype=object)
+        self.experience_years = np.array(
+            [c.get("experience_years", 0) or 0 for c in condition_inputs], dtype=np.float64
+        )
+        self.location_pref = np.array([c.get("location_pref") for c in condition_inputs], dtype=object)
+
+    @classmethod
+    def from_profiles(
+        cls, seeker_profiles: list[dict], abilities: Optional[np.ndarray] = None
+    ) -> "SeekerColumns":
+        """abilities: 미리 계산된 (N, 30) 능력치 행렬 (없으면 abilities_snapshot에서 변환)"""
+        condition_index: dict = {}
+        condition_inputs: list[dict] = []
+        condition_codes = []
+        for seeker in seeker_profiles:
+            key = (seeker.get("remote_pref"), seeker.get("experience_years"), seeker.get("location_pref"))
+            if key not in condition_index:
+                condition_index[key] = len(condition_inputs)
+                condition_inputs.append(
+                    {"remote_pref": key[0], "experience_years": key[1], "location_pref": key[2]}
+                )
+            condition_codes.append(condition_index[key])
+
+        if abilities is None:
+            abilities = np.empty((len(seeker_profiles), len(ABILITY_COLUMNS)))
+            for i, seeker in enumerate(seeker_profiles):
+                abilities[i] = ability_vector(seeker.get("abilities_snapshot"))
+        return cls(
+            abilities,
+            np.array(
+                [seeker_culture_bits(s.get("comprehensive_profile")) for s in seeker_profiles],
+                dtype=np.int16,
+            ),
+            np.array(condition_codes, dtype=np.int64),
+            condition_inputs,
+        )
+
+    def __len__(self) -> int:
+        return len(self.culture_bits)
+
+
+class JobColumns:
+    """
+    공고 M개의 적합도 입력 (열 단위).
+    - 능력치 요구: 요구 항목 수 K가 같은 공고끼리 묶은 (공고 인덱스, (G, K) 컬럼, (G, K) 최소 점수)
+      (calc_ability_fit_batch와 같은 순서·개수로 합산해야 결과가 비트 단위로 같음)
+    - 문화: (M, L) culture_tag_layers, (M,) 태그 수 (목록이 아니면 0), (M,) 팀 프로필 보정 여부
+    - 조건: remote / location 고유값과 코드 (0 = 없음), experience_min / experience_max 열 (없으면 NaN)
+    """
+
+    def __init__(self, job_postings: list[dict], culture_tags: list, team_profiles: list):
+        n = len(job_postings)
+        self.ability_groups: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        groups: dict[int, tuple[list, list, list]] = {}
+        for j, job in enumerate(job_postings):
+            required = job.get("required_abilities")
+            if not required:
+                continue
+            indices, columns, mins = groups.setdefault(len(required), ([], [], []))
+            indices.append(j)
+            columns.append([_COLUMN_INDEX.get(ability_code(key), -1) for key in required])
+            mins.append([req.get("min", 0) if isinstance(req, dict) else req for req in required.values()])
+        for indices, columns, mins in groups.values():
+            self.ability_groups.append((
+                np.array(indices, dtype=np.int64),
+                np.array(columns, dtype=np.int64),
+                np.array(mins, dtype=np.float64),
+            ))
+
+        layers = [
+            culture_tag_layers(tags) if tags and isinstance(tags, list) else [] for tags in culture_tags
+        ]
+        self.culture_layers = np.zeros((n, max(map(len, layers), default=0)), dtype=np.int64)
+        for j, job_layers in enumerate(layers):
+            self.culture_layers[j, :len(job_layers)] = job_layers
+        self.culture_tag_counts = np.array(
+            [len(tags) if tags and isinstance(tags, list) else 0 for tags in culture_tags], dtype=np.int64
+        )
+        self.team_bonus = np.array(
+            [bool(team and team.get("current_team_types")) for team in team_profiles], dtype=bool
+        )
+
+        conditions = [job.get("conditions") or {} for job in job_postings]
+        self.has_conditions = np.array([bool(c) for c in conditions], dtype=bool)
+        self.remote_values, self.remote_codes = _intern_values([c.get("remote") for c in conditions])
+        self.experience_min = np.array(
+            [np.nan if c.get("experience_min") is None else c["experience_min"] for c in conditions],
+            dtype=np.float64,
+        )
+        self.experience_max = np.array(
+            [np.nan if c.get("experience_max") is None else c["experience_max"] for c in conditions],
+            dtype=np.float64,
+        )
+        self.location_values, self.location_codes = _intern_values([c.get("location") for c in conditions])
+
+    @classmethod
+    def from_postings(
+        cls,
+        job_postings: list[dict],
+        companies: Optional[list[Optional[dict]]] = None,
+        team_profiles: Optional[list[Optional[dict]]] = None,
+        culture_tags: Optional[list] = None,
+    ) -> "JobColumns":
+        """
+        calculate_fit_score(seeker, job_posting, company, team_profile)의 공고 쪽 입력을 열로 변환.
+        문화 태그는 기업이 있으면 기업의 culture_tags, 없으면 공고의 preferred_culture (culture_tags로 직접 지정 가능)
+        """
+        companies = companies or [None] * len(job_postings)
+        if culture_tags is None:
+            culture_tags = [
+                company.get("culture_tags") if company else job.get("preferred_culture")
+                for job, company in zip(job_postings, companies)
+            ]
+        return cls(job_postings, culture_tags, team_profiles or [None] * len(job_postings))
+
+    def __len__(self) -> int:
+        return len(self.culture_tag_counts)
+
+
+def calculate_fit_scores(seekers: SeekerColumns, jobs: JobColumns) -> dict[str, np.ndarray]:
+    """
+    calculate_fit_score의 벡터화 버전: 공고 하나 × 구직자 N명, 또는 구직자 한 명 × 공고 N개.
+    ability / culture / condition / total 배열을 반환하며 각 값은 스칼라 함수의 결과와 같습니다.
+    """
+    if len(seekers) != 1 and len(jobs) != 1:
+        raise ValueError("seekers와 jobs 중 한쪽은 1개여야 합니다")
+
+    ability = _ability_fit_pairs(seekers.abilities, jobs)
+    culture = _culture_fit_pairs(seekers.culture_bits, jobs)
+    condition_by_input = _condition_fit_pairs(seekers, jobs)
+    condition = condition_by_input[seekers.condition_codes] if len(jobs) == 1 else condition_by_input
+
+    return {
+        "ability": round_batch(ability),
+        "culture": round_batch(culture),
+        "condition": round_batch(condition),
+        "total": round_batch(ability * 0.6 + culture * 0.25 + condition * 0.15),
+    }
+
+
+def _ability_fit_pairs(ability_matrix: np.ndarray, jobs: JobColumns) -> np.ndarray:
+    n = max(len(ability_matrix), len(jobs))
+    fit = np.full(n, 50.0)
+    for indices, columns, mins in jobs.ability_groups:
+        # (구직자 수, 묶음 공고 수, K) → 한쪽이 1이므로 (n 또는 G, K)
+        seeker_scores = ability_matrix[:, np.maximum(columns, 0)].astype(np.float64)
+        seeker_scores[:, columns < 0] = 50.0
+        seeker_scores = seeker_scores.reshape(-1, columns.shape[1])
+        seeker_scores[np.isnan(seeker_scores)] = 50.0
+
+        diff = np.maximum(0.0, mins - seeker_scores)
+        rmse = np.sqrt((diff ** 2).sum(axis=1) / columns.shape[1])
+        group_fit = np.maximum(0.0, 100 - rmse * 2)
+        if len(jobs) == 1:
+            fit = group_fit
+        else:
+            fit[indices] = group_fit
+
+    # 능력치 스냅샷이 비어 있는 구직자는 기본값
+    has_abilities = ~np.isnan(ability_matrix).all(axis=1)
+    return np.where(has_abilities, fit, 50.0)
+
+
+def _culture_fit_pairs(culture_bits: np.ndarray, jobs: JobColumns) -> np.ndarray:
+    tag_counts = jobs.culture_tag_counts
+    # 층 값은 태그 비트 조합이므로 AND 결과는 항상 _TAG_POPCOUNT 범위 안 (NO_CULTURE_PROFILE 행도 아래에서 덮어씀)
+    match_count = _TAG_POPCOUNT[culture_bits[:, np.newaxis] & jobs.culture_layers].sum(axis=1)
+    score = np.where(
+        tag_counts > 0,
+        30 + (match_count / np.maximum(tag_counts, 1)) * 70,
+        50.0,
+    )
+    score = np.where(jobs.team_bonus, np.minimum(100, score + 5), score)
+    return np.where(culture_bits == NO_CULTURE_PROFILE, 50.0, score)
+
+
+def _condition_fit_pairs(seekers: SeekerColumns, jobs: JobColumns) -> np.ndarray:
+    """고유 조건 입력(구직자 한 명이면 1개) × 공고의 조건 적합도"""
+    # 문자열 비교는 (구직자 고유값, 공고 고유값) 표로 한 번씩만 계산한 뒤 공고 코드로 펼침
+    remote_pref = seekers.remote_pref[:, np.newaxis]
+    remote = np.where(
+        remote_pref == jobs.remote_values, 100.0, np.where(remote_pref == "hybrid", 70.0, 30.0)
+    )[:, jobs.remote_codes].reshape(-1)
+
+    exp = seekers.experience_years
+    experience_min = np.where(
+        exp >= jobs.experience_min, 100.0, np.maximum(0, 100 - (jobs.experience_min - exp) * 20)
+    )
+    experience_max = np.where(
+        exp <= jobs.experience_max, 100.0, np.maximum(0, 100 - (exp - jobs.experience_max) * 20)
+    )
+
+    location_pref = seekers.location_pref
+    contains = np.array(
+        [
+            [bool(pref) and value is not None and value in pref for value in jobs.location_values]
+            for pref in location_pref
+        ],
+        dtype=bool,
+    ).reshape(len(location_pref), len(jobs.location_values))
+    location = np.where(
+        location_pref.astype(bool)[:, np.newaxis], np.where(contains, 100.0, 40.0), 60.0
+    )[:, jobs.location_codes].reshape(-1)
+
+    # 스칼라 함수와 같은 순서로 합산 (검사하지 않은 항목은 0)
+    checks = [
+        (jobs.remote_codes > 0, remote),
+        (~np.isnan(jobs.experience_min), experience_min),
+        (~np.isnan(jobs.experience_max), experience_max),
+        (jobs.location_codes > 0, location),
+    ]
+    n = max(len(location_pref), len(jobs))
+    score = np.zeros(n)
+    count = np.zeros(n, dtype=np.int64)
+    for checked, value in checks:
+        score = score + np.where(checked, value, 0.0)
+        count = count + checked
+
+    fit = np.divide(score, count, out=np.full(n, 70.0), where=count > 0)
+    return np.where(jobs.has_conditions, fit, 70.0)
+
+
+def _intern_values(values: list) -> tuple[np.ndarray, np.ndarray]:
+    """값 목록 → (고유값 배열, 코드 배열). 코드 0은 없는 값(None/빈 값)"""
+    index: dict = {None: 0}
+    codes = [index.setdefault(value or None, len(index)) for value in values]
+    return np.array(list(index), dtype=object), np.array(codes, dtype=np.int64)
+
+
+def round_batch(values: np.ndarray, ndigits: int = 1) -> np.ndarray:
+    """내장 round()와 같은 결과를 내는 배열 반올림"""
+    rounded = np.round(values, ndigits)
+    # x.x5 경계 근처는 이진 부동소수 표현 차이로 np.round와 round()가 갈릴 수 있음
+    scaled = values * 10 ** ndigits
+    edge = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if edge.any():
+        rounded[edge] = [round(float(v), ndigits) for v in values[edge]]
+    return rounded
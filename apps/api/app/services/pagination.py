@@ -0,0 +1,121 @@
+import asyncio
+import base64
+import json
+import math
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+
+from app.services.supabase_client import get_supabase
+
+
+def encode_cursor(row: dict, sort_column: str) -> str:
+    """마지막 행의 (정렬 컬럼, id)를 불투명한 커서 문자열로 인코딩 (정렬 값이 NULL이면 null 그대로)"""
+    payload = json.dumps([row[sort_column], row["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[str], str]:
+    """커서 → (정렬 값, id). 정렬 값이 NULL이었으면 None"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        value = None if value is None else str(value)
+        row_id = str(row_id)
+        # 필터 문자열에 그대로 들어가므로 따옴표/역슬래시가 섞인 값은 거부
+        if any(c in (value or "") + row_id for c in '"\\'):
+            raise ValueError(cursor)
+        return value, row_id
+    except Exception:
+        raise _invalid_cursor()
+
+
+def decode_score_cursor(cursor: str) -> tuple[float, str]:
+    """점수 순위 커서 → (마지막 점수, id). 점수가 유한한 숫자가 아니면 400"""
+    value, row_id = decode_cursor(cursor)
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        raise _invalid_cursor()
+    if not math.isfinite(score):
+        raise _invalid_cursor()
+    return score, row_id
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor",
+    )
+
+
+def keyset(query, sort_column: str, cursor: Optional[str], limit: int, desc: bool = True):
+    """
+    (sort_column, id) 기준 keyset 페이지네이션을 쿼리에 적용합니다.
+    offset 대신 커서 이후 행만 조회하므로 깊은 페이지도 인덱스로 바로 찾아가고,
+    데이터가 바뀌어도 행이 중복되거나 누락되지 않습니다.
+    다음 페이지 존재 여부를 알기 위해 limit + 1개를 조회합니다.
+
+    정렬 값이 NULL인 행은 Postgres 기본 순서(가장 큰 값 취급 — 내림차순이면 맨 앞, 오름차순이면 맨 뒤)를
+    그대로 따르므로 (정렬 컬럼, id) 인덱스 순서와 같습니다.
+    """
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        op = "lt" if desc else "gt"
+        if value is None:
+            # NULL 구간 안에서는 id로 이어 가고, 내림차순이면 그 뒤에 NULL이 아닌 행 전체
+            after_nulls = f"and({sort_column}.is.null,id.{op}.\"{row_id}\")"
+            query = query.or_(f"{after_nulls},{sort_column}.not.is.null" if desc else after_nulls)
+        else:
+            conditions = (
+                f'{sort_column}.{op}."{value}",'
+                f'and({sort_column}.eq."{value}",id.{op}."{row_id}")'
+            )
+            # 오름차순이면 NULL 행은 NULL이 아닌 행 뒤에 옴
+            query = query.or_(conditions if desc else f"{conditions},{sort_column}.is.null")
+
+    return (
+        query.order(sort_column, desc=desc)
+        .order("id", desc=desc)
+        .limit(limit + 1)
+    )
+
+
+def paginate(rows: list[dict], sort_column: str, limit: int) -> tuple[list[dict], Optional[str]]:
+    """keyset()으로 조회한 결과를 (현재 페이지, 다음 커서)로 나눕니다"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1], sort_column)
+
+
+async def fetch_page(
+    table: str,
+    columns: str,
+    apply_filters: Callable,
+    sort_column: str,
+    cursor: Optional[str],
+    limit: int,
+    desc: bool = True,
+) -> tuple[list[dict], Optional[str], int]:
+    """
+    목록 엔드포인트 공통 조회: 커서 페이지와 필터 조건 전체 건수를 동시에 조회해
+    (현재 페이지, 다음 커서, 전체 건수)를 반환합니다.
+    apply_filters(query)는 select 쿼리에 목록 필터를 적용해 반환하는 함수입니다.
+    """
+    supabase = get_supabase()
+
+    page_query = keyset(
+        apply_filters(supabase.table(table).select(columns)),
+        sort_column, cursor, limit, desc,
+    )
+    count_query = apply_filters(
+        supabase.table(table).select("id", count="exact")
+    ).limit(1)
+
+    page_result, count_result = await asyncio.gather(
+        page_query.execute(), count_query.execute()
+    )
+
+    rows, next_cursor = paginate(page_result.data or [], sort_column, limit)
+    return rows, next_cursor, count_result.count or 0
@@ -27,7 +27,7 @@ async def prepare_payment(user_id: str, report_type: str) -> dict:
 
     # Create payment record
     result = (
-        supabase.table("payments")
+        await supabase.table("payments")
         .insert(
             {
                 "user_id": user_id,
@@ -58,7 +58,7 @@ async def confirm_payment(
 
     # Get payment record
     payment = (
-        supabase.table("payments")
+        await supabase.table("payments")
         .select("*")
         .eq("order_id", order_id)
         .single()
@@ -90,13 +90,13 @@ async def confirm_payment(
             toss_result = response.json()
         except httpx.HTTPError as e:
             # Update payment status to failed
-            supabase.table("payments").update({"status": "failed"}).eq(
+            await supabase.table("payments").update({"status": "failed"}).eq(
                 "id", payment.data["id"]
             ).execute()
             return None
 
     # Update payment status
-    supabase.table("payments").update(
+    await supabase.table("payments").update(
         {
             "status": "completed",
             "payment_key": payment_key,
@@ -116,7 +116,7 @@ async def get_payment(payment_id: str) -> Optional[dict]:
     supabase = get_supabase()
 
     result = (
-        supabase.table("payments")
+        await supabase.table("payments")
         .select("*")
         .eq("id", payment_id)
         .single()
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 구독자 큐 크기 (느린 클라이언트는 오래된 이벤트부터 버림)
+_QUEUE_SIZE = 100
+
+
+class InMemoryPubSub:
+    """
+    프로세스 내 pub/sub. 채널별 구독자 큐로 이벤트를 팬아웃합니다.
+    단일 워커에서는 그대로 쓰고, 여러 워커가 공유해야 하면 publish()만
+    외부 브로커로 보내는 하위 클래스(PostgresPubSub)를 사용합니다.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def publish(self, channel: str, event: dict) -> None:
+        self._deliver(channel, event)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        self._subscribers.setdefault(channel, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def _deliver(self, channel: str, event: dict) -> None:
+        for queue in self._subscribers.get(channel, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+class PostgresPubSub(InMemoryPubSub):
+    """
+    Postgres LISTEN/NOTIFY로 워커 간 이벤트를 공유하는 백엔드.
+    모든 워커가 하나의 NOTIFY 채널을 듣고, 자기 프로세스의 구독자에게만 전달합니다.
+    (NOTIFY 페이로드는 8000바이트 제한 — 초과 시 ValueError)
+
+    커넥션이 끊기면(종료 알림 또는 주기적 상태 확인 실패) 다시 연결하고 LISTEN을 다시 겁니다.
+    끊긴 동안의 알림은 유실되며, 그 사이 publish는 ConnectionError를 냅니다.
+    """
+
+    NOTIFY_CHANNEL = "metaphoi_events"
+    MAX_PAYLOAD = 7999
+    HEALTH_CHECK_SECONDS = 30
+    RECONNECT_DELAY_SECONDS = (1, 2, 5, 10, 30)
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self._dsn = dsn
+        self._conn = None
+        self._lock = asyncio.Lock()
+        self._lost = asyncio.Event()
+        self._watcher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self._connect()
+        self._watcher = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    async def publish(self, channel: str, event: dict) -> None:
+        payload = json.dumps({"channel": channel, "event": event}, default=str)
+        if len(payload.encode()) > self.MAX_PAYLOAD:
+            raise ValueError("Event payload too large for NOTIFY")
+        # 한 커넥션을 LISTEN과 공유하므로 쿼리는 직렬화
+        async with self._lock:
+            if self._conn is None or self._conn.is_closed():
+                self._lost.set()
+                raise ConnectionError("Pub/sub connection is not available")
+            await self._conn.execute("SELECT pg_notify($1, $2)", self.NOTIFY_CHANNEL, payload)
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        conn = await asyncpg.connect(self._dsn)
+        await conn.add_listener(self.NOTIFY_CHANNEL, self._on_notify)
+        conn.add_termination_listener(self._on_terminate)
+        self._conn = conn
+        self._lost.clear()
+
+    async def _watch(self) -> None:
+        """커넥션 감시 — 끊김 알림을 받거나 주기적 확인이 실패하면 다시 연결"""
+        while True:
+            try:
+                await asyncio.wait_for(self._lost.wait(), self.HEALTH_CHECK_SECONDS)
+            except asyncio.TimeoutError:
+                if await self._healthy():
+                    continue
+            await self._reconnect()
+
+    async def _healthy(self) -> bool:
+        async with self._lock:
+            if self._conn is None or self._conn.is_closed():
+                return False
+            try:
+                await asyncio.wait_for(self._conn.execute("SELECT 1"), self.HEALTH_CHECK_SECONDS)
+                return True
+            except Exception:
+                logger.warning("Pub/sub connection health check failed", exc_info=True)
+                return False
+
+    async def _reconnect(self) -> None:
+        async with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            conn.terminate()
+
+        attempt = 0
+        while True:
+            try:
+                await self._connect()
+                logger.info("Pub/sub connection re-established")
+                return
+            except Exception:
+                delay = self.RECONNECT_DELAY_SECONDS[min(attempt, len(self.RECONNECT_DELAY_SECONDS) - 1)]
+                logger.warning("Pub/sub reconnect failed, retrying in %ss", delay, exc_info=True)
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    def _on_terminate(self, connection) -> None:
+        if connection is self._conn:
+            self._lost.set()
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            data = json.loads(payload)
+            self._deliver(data["channel"], data["event"])
+        except (ValueError, KeyError):
+            pass  # 형식이 다른 알림은 무시
+
+
+def create_pubsub() -> InMemoryPubSub:
+    if settings.pubsub_backend == "postgres":
+        return PostgresPubSub(settings.pubsub_database_url)
+    return InMemoryPubSub()
+
+
+_pubsub: Optional[InMemoryPubSub] = None
+
+
+def get_pubsub() -> InMemoryPubSub:
+    global _pubsub
+    if _pubsub is None:
+        _pubsub = create_pubsub()
+    return _pubsub
+
+
+async def start_pubsub() -> None:
+    await get_pubsub().start()
+
+
+async def close_pubsub() -> None:
+    await get_pubsub().close()
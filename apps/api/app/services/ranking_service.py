@@ -0,0 +1,91 @@
+from typing import Optional
+
+import numpy as np
+
+from app.services.fit_cache import get_candidate_scores
+from app.services.job_store import JobStore
+from app.services.matching_service import JobColumns, SeekerColumns, calculate_fit_scores
+from app.services.seeker_store import SeekerStore
+
+
+def score_job_candidates(store: SeekerStore, job_posting: dict) -> dict[str, np.ndarray]:
+    """
+    공고 하나에 대해 스토어의 구직자 전체 적합도를 한 번에 계산합니다.
+    calculate_fit_score(seeker, job_posting, None, None)과 같은 값을 배열로 반환합니다.
+    """
+    return calculate_fit_scores(store.columns(), JobColumns.from_postings([job_posting]))
+
+
+def top_k(
+    totals: np.ndarray,
+    ids: np.ndarray,
+    limit: int,
+    after: Optional[tuple[float, str]] = None,
+) -> np.ndarray:
+    """
+    총점 내림차순, 동점은 ID 오름차순으로 정렬한 전역 순위에서
+    after=(총점, ID) 다음부터 limit개의 인덱스를 반환합니다 (keyset).
+    """
+    if after is None:
+        eligible = np.arange(len(totals))
+    else:
+        last_total, last_id = after
+        eligible = np.flatnonzero(
+            (totals < last_total) | ((totals == last_total) & (ids > last_id))
+        )
+
+    k = min(limit, len(eligible))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    # 상위 k개 경계 점수 이상인 후보만 정렬 (경계 동점자 포함 → 순서 안정)
+    scores = totals[eligible]
+    threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+    candidates = eligible[scores >= threshold]
+    order = candidates[np.lexsort((ids[candidates], -totals[candidates]))]
+    return order[:limit]
+
+
+def rank_candidates(
+    store: SeekerStore,
+    job_posting: dict,
+    limit: int,
+    after: Optional[tuple[float, str]] = None,
+) -> list[tuple[str, dict]]:
+    """
+    스토어의 구직자 전체 점수(공고별 캐시, 바뀐 행만 다시 계산)로
+    전역 순위의 한 페이지를 (seeker_id, fit_score)로 반환
+    """
+    return _ranked_page(store.ids, get_candidate_scores(store, job_posting), limit, after)
+
+
+def rank_jobs(
+    store: JobStore,
+    seeker: SeekerColumns,
+    limit: int,
+    after: Optional[tuple[float, str]] = None,
+) -> list[tuple[str, dict]]:
+    """구직자 한 명에 대해 활성 공고 전체를 점수화하여 전역 순위의 한 페이지를 (job_id, fit_score)로 반환"""
+    ids, scores = store.score(seeker)
+    return _ranked_page(ids, scores, limit, after)
+
+
+def _ranked_page(
+    ids: np.ndarray,
+    scores: dict[str, np.ndarray],
+    limit: int,
+    after: Optional[tuple[float, str]],
+) -> list[tuple[str, dict]]:
+    page = top_k(scores["total"], ids, limit, after)
+    return [
+        (
+            str(ids[i]),
+            {
+                "ability": float(scores["ability"][i]),
+                "culture": float(scores["culture"][i]),
+                "condition": float(scores["condition"][i]),
+                "total": float(scores["total"][i]),
+            },
+        )
+        for i in page
+    ]
@@ -0,0 +1,156 @@
+import time
+from typing import AsyncIterator, Optional
+
+from app.services.supabase_client import get_supabase
+from app.services.test_catalog import get_catalog
+from app.tests_engine.base import BaseTestEngine, get_test_engine
+
+_FETCH_CHUNK = 1000
+
+
+class RescoreStats:
+    """재채점 진행 상황 (청크마다 누적)"""
+
+    def __init__(self):
+        self.sessions = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.without_result = 0
+        self.failed: list[str] = []
+        self.started_at = time.perf_counter()
+
+    @property
+    def sessions_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started_at
+        return self.sessions / elapsed if elapsed > 0 else 0.0
+
+
+async def iter_completed_sessions(
+    test_id: int, chunk_size: int, after: Optional[str] = None
+) -> AsyncIterator[list[str]]:
+    """검사의 완료된 세션 ID를 id 순서로 chunk_size개씩 (after 이후부터)"""
+    supabase = get_supabase()
+
+    while True:
+        query = (
+            supabase.table("test_sessions")
+            .select("id")
+            .eq("test_id", test_id)
+            .eq("status", "completed")
+        )
+        if after:
+            query = query.gt("id", after)
+        result = await query.order("id").limit(chunk_size).execute()
+
+        session_ids = [row["id"] for row in result.data or []]
+        if not session_ids:
+            return
+        yield session_ids
+        if len(session_ids) < chunk_size:
+            return
+        after = session_ids[-1]
+
+
+async def fetch_rows_in(table: str, columns: str, column: str, values: list[str], order: list[str]) -> list[dict]:
+    """column IN (...) 조회를 PostgREST 최대 행 수 단위로 나눠 모두 가져옴"""
+    supabase = get_supabase()
+
+    rows = []
+    start = 0
+    while True:
+        query = supabase.table(table).select(columns).in_(column, values)
+        for order_column in order:
+            query = query.order(order_column)
+        result = await query.range(start, start + _FETCH_CHUNK - 1).execute()
+        chunk = result.data or []
+        rows.extend(chunk)
+        if len(chunk) < _FETCH_CHUNK:
+            return rows
+        start += _FETCH_CHUNK
+
+
+async def fetch_session_rows(table: str, columns: str, session_ids: list[str], order: list[str]) -> list[dict]:
+    return await fetch_rows_in(table, columns, "session_id", session_ids, order)
+
+
+async def rescore_chunk(
+    engine: BaseTestEngine,
+    session_ids: list[str],
+    stats: RescoreStats,
+    dry_run: bool = False,
+) -> None:
+    """
+    세션 묶음을 재채점하고 바뀐 test_results만 한 번의 bulk upsert로 저장합니다.
+    응답은 문항 조인 없이 (session_id, question_id, answer)만 읽고
+    카탈로그의 채점 계획으로 한 번에 채점합니다.
+    """
+    plan = await engine.get_scoring_plan()
+    responses = await fetch_session_rows(
+        "responses", "session_id, question_id, answer", session_ids, ["session_id", "id"]
+    )
+    results = await fetch_session_rows(
+        "test_results", "id, session_id, raw_scores, result_type", session_ids, ["session_id", "id"]
+    )
+
+    by_session: dict[str, list[dict]] = {session_id: [] for session_id in session_ids}
+    for response in responses:
+        by_session[response["session_id"]].append(response)
+
+    # calculate_result와 같은 문항 번호 순서로 채점 (실수 합산 순서 유지)
+    row_of, last = plan.row_of, len(plan)
+    sessions = [
+        sorted(by_session[session_id], key=lambda r: row_of.get(r["question_id"], last))
+        for session_id in session_ids
+    ]
+    scores = plan.score_batch(sessions)
+
+    rescored: dict[str, tuple[dict, str]] = {}
+    for session_id, session_scores in zip(session_ids, scores):
+        try:
+            rescored[session_id] = engine.build_result(session_scores)
+        except (ArithmeticError, IndexError, KeyError, ValueError):
+            stats.failed.append(session_id)
+
+    rows = []
+    with_result = set()
+    for result in results:
+        with_result.add(result["session_id"])
+        if result["session_id"] not in rescored:
+            continue
+        raw_scores, result_type = rescored[result["session_id"]]
+        if result.get("raw_scores") == raw_scores and result.get("result_type") == result_type:
+            stats.unchanged += 1
+            continue
+        rows.append({"id": result["id"], "raw_scores": raw_scores, "result_type": result_type})
+
+    if rows and not dry_run:
+        supabase = get_supabase()
+        await supabase.table("test_results").upsert(rows, on_conflict="id").execute()
+
+    stats.sessions += len(session_ids)
+    stats.updated += len(rows)
+    stats.without_result += sum(1 for session_id in rescored if session_id not in with_result)
+
+
+async def rescore_test(
+    test_code: str,
+    chunk_size: int = 200,
+    after: Optional[str] = None,
+    dry_run: bool = False,
+    stats: Optional[RescoreStats] = None,
+) -> AsyncIterator[tuple[str, RescoreStats]]:
+    """
+    검사의 완료된 세션 전체를 청크 단위로 재채점합니다.
+    청크를 저장할 때마다 (마지막 세션 ID, 누적 통계)를 내보내므로
+    호출자는 이를 체크포인트로 기록해 중단된 지점부터 재개할 수 있습니다.
+    """
+    engine = get_test_engine(test_code)
+    catalog = await get_catalog()
+    test = catalog.tests_by_code.get(test_code)
+    if engine is None or test is None:
+        raise ValueError(f"Unknown test '{test_code}'")
+
+    stats = stats or RescoreStats()
+    async for session_ids in iter_completed_sessions(test["id"], chunk_size, after):
+        await rescore_chunk(engine, session_ids, stats, dry_run=dry_run)
+        yield session_ids[-1], stats
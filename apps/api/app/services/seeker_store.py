@@ -0,0 +1,275 @@
+import asyncio
+import time
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.services.matching_service import (
+    ABILITY_COLUMNS,
+    SeekerColumns,
+    ability_vector,
+    seeker_culture_bits,
+)
+from app.services.supabase_client import get_supabase
+
+# 매칭 점수 계산에 필요한 컬럼만 조회
+SEEKER_STORE_COLUMNS = (
+    "id, is_active, visibility, abilities_snapshot, comprehensive_profile, "
+    "remote_pref, experience_years, location_pref"
+)
+_FETCH_CHUNK = 1000
+
+
+class SeekerStore:
+    """
+    seeker_profile_id로 색인된 구직자 매칭용 사전 계산 저장소.
+    - abilities: (N, 30) float32 능력치 행렬 (ABILITY_COLUMNS 순서, 없는 값은 NaN)
+    - culture_bits: 구직자별 문화 태그 매칭 비트마스크 (seeker_culture_bits)
+    - condition_codes: 조건 적합도 입력의 고유값 인덱스 (같은 입력을 가진 구직자는 공고당 한 번만 계산)
+    행은 프로필이 바뀔 때마다 upsert/remove로 갱신되며, 삭제 시 마지막 행을 빈자리로 옮겨
+    배열을 항상 [0, N) 구간에 빽빽하게 유지합니다.
+    행이 바뀔 때마다 version을 올려 row_versions에 기록하므로, 점수를 미리 계산해 둔 쪽은
+    계산 시점의 version보다 큰 행만 다시 계산하면 됩니다.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(capacity, 1)
+        self._index: dict[str, int] = {}
+        self._size = 0
+        self._ids = np.empty(capacity, dtype="U36")
+        self._abilities = np.full((capacity, len(ABILITY_COLUMNS)), np.nan, dtype=np.float32)
+        self._culture_codes = np.zeros(capacity, dtype=np.int64)
+        self._culture_bits = np.zeros(capacity, dtype=np.int16)
+        self._condition_codes = np.zeros(capacity, dtype=np.int64)
+        self._row_versions = np.zeros(capacity, dtype=np.int64)
+        self.version = 0
+
+        self.culture_inputs: list[Optional[dict]] = []
+        self._culture_input_bits: list[int] = []
+        self.condition_inputs: list[dict] = []
+        self._culture_index: dict = {}
+        self._condition_index: dict = {}
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "SeekerStore":
+        store = cls(capacity=len(rows))
+        for row in rows:
+            store.upsert(row)
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, seeker_id: str) -> bool:
+        return seeker_id in self._index
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def abilities(self) -> np.ndarray:
+        return self._abilities[:self._size]
+
+    @property
+    def culture_bits(self) -> np.ndarray:
+        return self._culture_bits[:self._size]
+
+    @property
+    def condition_codes(self) -> np.ndarray:
+        return self._condition_codes[:self._size]
+
+    @property
+    def row_versions(self) -> np.ndarray:
+        return self._row_versions[:self._size]
+
+    def columns(self, rows: Optional[np.ndarray] = None) -> SeekerColumns:
+        """calculate_fit_scores에 넘길 구직자 전체(또는 rows 행)의 열 단위 입력"""
+        if rows is None:
+            return SeekerColumns(self.abilities, self.culture_bits, self.condition_codes, self.condition_inputs)
+        return SeekerColumns(
+            self._abilities[rows], self._culture_bits[rows], self._condition_codes[rows], self.condition_inputs
+        )
+
+    def ability_row(self, seeker_id: str) -> Optional[np.ndarray]:
+        i = self._index.get(seeker_id)
+        return None if i is None else self._abilities[i]
+
+    def fit_input(self, seeker_id: str) -> Optional[dict]:
+        """
+        calculate_fit_score에 넘길 구직자 입력 (문화·조건 적합도가 쓰는 값만)과 능력치 행.
+        스토어에 없으면 None
+        """
+        i = self._index.get(seeker_id)
+        if i is None:
+            return None
+        condition = self.condition_inputs[self._condition_codes[i]]
+        return {"comprehensive_profile": self.culture_inputs[self._culture_codes[i]], **condition}
+
+    def upsert(self, row: dict) -> None:
+        seeker_id = str(row["id"])
+        i = self._index.get(seeker_id)
+        if i is None:
+            if self._size == len(self._ids):
+                self._grow()
+            i = self._size
+            self._size += 1
+            self._index[seeker_id] = i
+            self._ids[i] = seeker_id
+
+        self._abilities[i] = ability_vector(row.get("abilities_snapshot"))
+        self._culture_codes[i] = self._intern_culture(row.get("comprehensive_profile"))
+        self._culture_bits[i] = self._culture_input_bits[self._culture_codes[i]]
+        self._condition_codes[i] = self._intern_condition(row)
+        self._touch(i)
+
+    def remove(self, seeker_id: str) -> None:
+        i = self._index.pop(seeker_id, None)
+        if i is None:
+            return
+
+        last = self._size - 1
+        if i != last:
+            moved_id = str(self._ids[last])
+            self._ids[i] = moved_id
+            self._abilities[i] = self._abilities[last]
+            self._culture_codes[i] = self._culture_codes[last]
+            self._culture_bits[i] = self._culture_bits[last]
+            self._condition_codes[i] = self._condition_codes[last]
+            self._index[moved_id] = i
+            self._touch(i)
+        self._abilities[last] = np.nan
+        self._size = last
+
+    def _grow(self) -> None:
+        capacity = len(self._ids) * 2
+        self._ids = np.resize(self._ids, capacity)
+        abilities = np.full((capacity, len(ABILITY_COLUMNS)), np.nan, dtype=np.float32)
+        abilities[:self._size] = self._abilities[:self._size]
+        self._abilities = abilities
+        self._culture_codes = np.resize(self._culture_codes, capacity)
+        self._culture_bits = np.resize(self._culture_bits, capacity)
+        self._condition_codes = np.resize(self._condition_codes, capacity)
+        self._row_versions = np.resize(self._row_versions, capacity)
+
+    def _touch(self, i: int) -> None:
+        self.version += 1
+        self._row_versions[i] = self.version
+
+    def _intern_culture(self, comprehensive_profile: Optional[dict]) -> int:
+        # calc_culture_fit은 MBTI/DISC 유형 문자열만 사용
+        key = None
+        if comprehensive_profile:
+            mbti = comprehensive_profile.get("mbti") or {}
+            disc = comprehensive_profile.get("disc") or {}
+            key = (mbti.get("type") or "", disc.get("type") or "")
+
+        if key not in self._culture_index:
+            self._culture_index[key] = len(self.culture_inputs)
+            self.culture_inputs.append(
+                {"mbti": {"type": key[0]}, "disc": {"type": key[1]}} if key else None
+            )
+            self._culture_input_bits.append(seeker_culture_bits(self.culture_inputs[-1]))
+        return self._culture_index[key]
+
+    def _intern_condition(self, row: dict) -> int:
+        key = (row.get("remote_pref"), row.get("experience_years"), row.get("location_pref"))
+        if key not in self._condition_index:
+            self._condition_index[key] = len(self.condition_inputs)
+            self.condition_inputs.append(
+                {"remote_pref": key[0], "experience_years": key[1], "location_pref": key[2]}
+            )
+        return self._condition_index[key]
+
+
+_store: Optional[SeekerStore] = None
+_store_lock = asyncio.Lock()
+# 다시 적재하는 동안 들어온 변경 (적재한 행보다 나중일 수 있으므로 새 스토어에 다시 반영)
+_pending_syncs: Optional[list[dict]] = None
+
+
+def _is_listed(row: dict) -> bool:
+    return row.get("is_active", True) and row.get("visibility") != "hidden"
+
+
+async def fetch_active_seekers(columns: str = SEEKER_STORE_COLUMNS) -> list[dict]:
+    """공개된 활성 구직자 전체를 id 순서로 청크 단위로 조회 (columns에 id 포함)"""
+    supabase = get_supabase()
+
+    rows = []
+    last_id = None
+    while True:
+        query = (
+            supabase.table("seeker_profiles")
+            .select(columns)
+            .eq("is_active", True)
+            .neq("visibility", "hidden")
+        )
+        # id 기준 keyset — 조회 중 행이 추가·삭제되어도 건너뛰거나 중복되지 않음
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        result = await query.order("id").limit(_FETCH_CHUNK).execute()
+
+        chunk = result.data or []
+        rows.extend(chunk)
+        if len(chunk) < _FETCH_CHUNK:
+            return rows
+        last_id = chunk[-1]["id"]
+
+
+async def get_seeker_store() -> SeekerStore:
+    """
+    구직자 스토어를 반환합니다. 처음 호출 시 전체를 적재하고,
+    다른 워커에서 일어난 변경을 반영하기 위해 seeker_store_ttl_seconds 마다 다시 적재합니다.
+    """
+    global _store, _pending_syncs
+
+    if _store is not None and time.monotonic() - _store.loaded_at < settings.seeker_store_ttl_seconds:
+        return _store
+
+    async with _store_lock:
+        if _store is None or time.monotonic() - _store.loaded_at >= settings.seeker_store_ttl_seconds:
+            _pending_syncs = []
+            try:
+                store = SeekerStore.from_rows(await fetch_active_seekers())
+                for row in _pending_syncs:
+                    _apply_sync(store, row)
+                _store = store
+            finally:
+                _pending_syncs = None
+        return _store
+
+
+def sync_seeker_profile(row: dict) -> None:
+    """
+    변경된 seeker_profiles 행을 스토어에 반영 (아직 적재 전이면 다음 적재 때 반영됨).
+    다시 적재하는 중이면 새 스토어에도 다시 반영되도록 기록합니다.
+    """
+    if not row.get("id"):
+        return
+    if _pending_syncs is not None:
+        _pending_syncs.append(row)
+    if _store is not None:
+        _apply_sync(_store, row)
+
+
+def _apply_sync(store: SeekerStore, row: dict) -> None:
+    if _is_listed(row):
+        store.upsert(row)
+    else:
+        store.remove(str(row["id"]))
+
+
+def seeker_fit_input(seeker_id: str) -> Optional[tuple[dict, np.ndarray]]:
+    """적재된 스토어에 있는 구직자의 (적합도 입력, 능력치 행) (없으면 None)"""
+    if _store is None:
+        return None
+    seeker = _store.fit_input(seeker_id)
+    return None if seeker is None else (seeker, _store.ability_row(seeker_id))
+
+
+def ability_row(seeker_id: str) -> Optional[np.ndarray]:
+    """적재된 스토어에 있는 구직자의 능력치 행 (없으면 None)"""
+    return _store.ability_row(seeker_id) if _store is not None else None
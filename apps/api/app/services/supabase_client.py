@@ -1,8 +1,51 @@
-from supabase import create_client, Client
+import httpx
+from postgrest import AsyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
+
 from app.config import settings
 
-supabase: Client = create_client(settings.supabase_url, settings.supabase_service_key)
+
+class PooledPostgrestClient(AsyncPostgrestClient):
+    """
+    HTTP/2 keep-alive 커넥션 풀을 사용하는 비동기 PostgREST 클라이언트.
+    워커 프로세스당 하나의 인스턴스를 공유하므로 요청마다 TCP/TLS 연결을 새로 맺지 않고,
+    쿼리 대기 중에도 이벤트 루프가 막히지 않습니다.
+    """
+
+    def create_session(self, base_url, headers, timeout, *args, **kwargs) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=settings.db_http2,
+            limits=httpx.Limits(
+                max_connections=settings.db_pool_max_connections,
+                max_keepalive_connections=settings.db_pool_max_keepalive,
+            ),
+            follow_redirects=True,
+        )
+
+
+def create_supabase(url: str, key: str) -> PooledPostgrestClient:
+    return PooledPostgrestClient(
+        f"{url}/rest/v1",
+        headers={
+            **DEFAULT_POSTGREST_CLIENT_HEADERS,
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+        },
+    )
 
 
-def get_supabase() -> Client:
+supabase: PooledPostgrestClient = create_supabase(
+    settings.supabase_url, settings.supabase_service_key
+)
+
+
+def get_supabase() -> PooledPostgrestClient:
     return supabase
+
+
+async def close_supabase() -> None:
+    """커넥션 풀 정리 (앱 종료 시 호출)"""
+    await supabase.aclose()
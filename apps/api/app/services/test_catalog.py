@@ -0,0 +1,94 @@
+import asyncio
+import hashlib
+import time
+from typing import Optional
+
+from app.config import settings
+from app.models.test import TestResponse
+from app.services.supabase_client import get_supabase
+
+_FETCH_CHUNK = 1000
+
+
+class TestCatalog:
+    """
+    검사 목록과 문항 은행의 메모리 스냅샷.
+    문항은 거의 바뀌지 않으므로 검사 시작/조회 때마다 DB에서 다시 읽지 않고,
+    GET /api/tests/{code} 응답은 미리 직렬화한 바이트와 ETag로 제공합니다.
+    """
+
+    def __init__(self, tests: list[dict], questions: list[dict], version: int):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.tests_by_code: dict[str, dict] = {t["code"]: t for t in tests}
+        self.questions_by_test_id: dict[int, list[dict]] = {}
+        for question in questions:
+            self.questions_by_test_id.setdefault(question["test_id"], []).append(question)
+
+        self.active_tests = [t for t in tests if t.get("is_active")]
+        self._details: dict[str, tuple[bytes, str]] = {}
+
+    def detail(self, code: str) -> Optional[tuple[bytes, str]]:
+        """검사 상세 응답 (JSON 바이트, ETag) — 코드별로 처음 요청될 때 한 번만 직렬화"""
+        cached = self._details.get(code)
+        if cached is None:
+            test = self.tests_by_code.get(code)
+            if test is None:
+                return None
+            body = TestResponse(
+                test=test,
+                questions=self.questions_by_test_id.get(test["id"], []),
+            ).model_dump_json().encode()
+            # 내용 해시 기반 ETag (워커/재적재와 무관하게 같은 내용이면 같은 값)
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            cached = self._details[code] = (body, etag)
+        return cached
+
+
+_catalog: Optional[TestCatalog] = None
+_catalog_lock = asyncio.Lock()
+_version = 0
+
+
+async def _fetch_all(table: str, order: list[str]) -> list[dict]:
+    supabase = get_supabase()
+
+    rows = []
+    start = 0
+    while True:
+        query = supabase.table(table).select("*")
+        for column in order:
+            query = query.order(column)
+        result = await query.range(start, start + _FETCH_CHUNK - 1).execute()
+        chunk = result.data or []
+        rows.extend(chunk)
+        if len(chunk) < _FETCH_CHUNK:
+            return rows
+        start += _FETCH_CHUNK
+
+
+async def get_catalog() -> TestCatalog:
+    """
+    검사 카탈로그를 반환합니다. 처음 호출 시 전체를 적재하고
+    test_catalog_ttl_seconds 마다 (또는 invalidate_catalog() 이후) 다시 적재합니다.
+    """
+    global _catalog, _version
+
+    if _catalog is not None and time.monotonic() - _catalog.loaded_at < settings.test_catalog_ttl_seconds:
+        return _catalog
+
+    async with _catalog_lock:
+        if _catalog is None or time.monotonic() - _catalog.loaded_at >= settings.test_catalog_ttl_seconds:
+            tests, questions = await asyncio.gather(
+                _fetch_all("tests", ["id"]),
+                _fetch_all("questions", ["test_id", "question_number", "id"]),
+            )
+            _version += 1
+            _catalog = TestCatalog(tests, questions, _version)
+        return _catalog
+
+
+def invalidate_catalog() -> None:
+    """검사/문항 변경 후 호출 — 다음 조회 때 새로 적재"""
+    global _catalog
+    _catalog = None
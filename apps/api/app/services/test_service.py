@@ -2,7 +2,9 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
+from app.services import answer_buffer
 from app.services.supabase_client import get_supabase
+from app.services.test_catalog import get_catalog
 from app.models.test import (
     Test,
     TestSession,
@@ -14,27 +16,18 @@ from app.models.test import (
 
 
 async def get_all_tests() -> list[dict]:
-    supabase = get_supabase()
-    result = supabase.table("tests").select("*").eq("is_active", True).execute()
-    return result.data or []
+    catalog = await get_catalog()
+    return catalog.active_tests
 
 
 async def get_test_by_code(code: str) -> Optional[dict]:
-    supabase = get_supabase()
-    result = supabase.table("tests").select("*").eq("code", code).single().execute()
-    return result.data
+    catalog = await get_catalog()
+    return catalog.tests_by_code.get(code)
 
 
 async def get_test_questions(test_id: int) -> list[dict]:
-    supabase = get_supabase()
-    result = (
-        supabase.table("questions")
-        .select("*")
-        .eq("test_id", test_id)
-        .order("question_number")
-        .execute()
-    )
-    return result.data or []
+    catalog = await get_catalog()
+    return catalog.questions_by_test_id.get(test_id, [])
 
 
 async def start_test_session(user_id: str, test_id: int) -> dict:
@@ -42,7 +35,7 @@ async def start_test_session(user_id: str, test_id: int) -> dict:
 
     # Check for existing in-progress session
     existing = (
-        supabase.table("test_sessions")
+        await supabase.table("test_sessions")
         .select("*")
         .eq("user_id", user_id)
         .eq("test_id", test_id)
@@ -55,7 +48,7 @@ async def start_test_session(user_id: str, test_id: int) -> dict:
 
     # Create new session
     result = (
-        supabase.table("test_sessions")
+        await supabase.table("test_sessions")
         .insert(
             {
                 "user_id": user_id,
@@ -85,18 +78,19 @@ async def submit_responses(
         for answer in answers
     ]
 
-    result = supabase.table("responses").insert(responses_data).execute()
+    result = await supabase.table("responses").insert(responses_data).execute()
+    answer_buffer.record_responses(session_id, result.data or [])
     return result.data or []
 
 
 async def complete_test_session(
-    session_id: str, raw_scores: dict, result_type: str
+    session_id: str, raw_scores: dict, result_type: str, fraud_score: float = 0
 ) -> Optional[dict]:
     supabase = get_supabase()
 
     # Get session
     session = (
-        supabase.table("test_sessions")
+        await supabase.table("test_sessions")
         .select("*")
         .eq("id", session_id)
         .single()
@@ -113,17 +107,18 @@ async def complete_test_session(
     time_spent = int((datetime.utcnow() - started_at.replace(tzinfo=None)).total_seconds())
 
     # Update session
-    supabase.table("test_sessions").update(
+    await supabase.table("test_sessions").update(
         {
             "status": "completed",
             "completed_at": datetime.utcnow().isoformat(),
             "time_spent_seconds": time_spent,
+            "fraud_score": fraud_score,
         }
     ).eq("id", session_id).execute()
 
     # Create test result
     result = (
-        supabase.table("test_results")
+        await supabase.table("test_results")
         .insert(
             {
                 "session_id": session_id,
@@ -139,11 +134,22 @@ async def complete_test_session(
     return result.data[0] if result.data else None
 
 
+async def record_fraud_detections(session_id: str, detections: list[dict]) -> None:
+    """부정행위 탐지 결과를 fraud_detection_logs에 한 번에 기록"""
+    if not detections:
+        return
+
+    supabase = get_supabase()
+    await supabase.table("fraud_detection_logs").insert(
+        [{"session_id": session_id, **detection} for detection in detections]
+    ).execute()
+
+
 async def get_user_test_results(user_id: str) -> list[dict]:
     supabase = get_supabase()
 
     result = (
-        supabase.table("test_results")
+        await supabase.table("test_results")
         .select("*, tests(*)")
         .eq("user_id", user_id)
         .order("created_at", desc=True)
@@ -162,7 +168,7 @@ async def get_test_result_by_code(user_id: str, test_code: str) -> Optional[dict
         return None
 
     result = (
-        supabase.table("test_results")
+        await supabase.table("test_results")
         .select("*")
         .eq("user_id", user_id)
         .eq("test_id", test["id"])
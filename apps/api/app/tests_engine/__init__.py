@@ -1,7 +1,20 @@
+import importlib
+
 from app.tests_engine.base import BaseTestEngine, get_test_engine
-from app.tests_engine.mbti import MBTIEngine
-from app.tests_engine.disc import DISCEngine
-from app.tests_engine.enneagram import EnneagramEngine
+
+# 엔진 클래스는 처음 참조될 때 import (앱 시작 시 모든 엔진 모듈을 읽지 않음, 인스턴스는 만들지 않음)
+_LAZY_ENGINES = {
+    "MBTIEngine": "mbti",
+    "DISCEngine": "disc",
+    "EnneagramEngine": "enneagram",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ENGINES:
+        return getattr(importlib.import_module(f"{__name__}.{_LAZY_ENGINES[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseTestEngine",
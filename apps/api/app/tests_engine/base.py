@@ -1,7 +1,16 @@
+import importlib
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Any
+from typing import Any, Hashable, Optional, Tuple
 
 from app.services.supabase_client import get_supabase
+from app.services.test_catalog import get_catalog
+from app.tests_engine.fraud import detect_batch
+from app.tests_engine.interpretation import InterpretationTemplate
+from app.tests_engine.scoring import ScoringPlan
+
+# 검사 코드 → 컴파일된 채점 계획 (카탈로그 버전이 바뀌면 다시 컴파일)
+_plans: dict[str, ScoringPlan] = {}
 
 
 class BaseTestEngine(ABC):
@@ -10,15 +19,24 @@ class BaseTestEngine(ABC):
     test_code: str
     test_name: str
 
+    # 문항 가중치 합산 채점 설정 (score_responses 사용 엔진)
+    indicators: tuple = ()
+    numeric_answer_types: tuple = (int, float)
+    string_answer_mode: str = "option"  # "option": scoring_weights[응답] 가산, "weight": 가중치 가산
+
+    def __init__(self):
+        self._templates: Optional[dict[Hashable, InterpretationTemplate]] = None
+
     @abstractmethod
     async def calculate_result(
-        self, session_id: str
+        self, session_id: str, responses: Optional[list[dict]] = None
     ) -> Tuple[dict[str, Any], str]:
         """
         검사 결과를 계산합니다.
 
         Args:
             session_id: 검사 세션 ID
+            responses: 이미 가진 세션 응답 (get_responses와 같은 형태, 없으면 DB에서 조회)
 
         Returns:
             Tuple[raw_scores, result_type]
@@ -28,6 +46,65 @@ class BaseTestEngine(ABC):
         pass
 
     @abstractmethod
+    def build_result(
+        self, scores: dict[Any, Any]
+    ) -> Tuple[dict[str, Any], str]:
+        """
+        지표별 점수로 결과를 구성합니다. (calculate_result와 일괄 재채점이 공유)
+
+        Args:
+            scores: 채점 계획으로 계산한 {지표: 점수}
+
+        Returns:
+            Tuple[raw_scores, result_type]
+        """
+        pass
+
+    @abstractmethod
+    def build_interpretation(self, key: Hashable) -> dict[str, Any]:
+        """
+        해석 페이로드의 정적 부분을 만듭니다. (결과 유형별로 한 번만 호출)
+
+        Args:
+            key: interpretation_key가 돌려준 결과 유형 키
+
+        Returns:
+            해석 딕셔너리 — 사용자별 값이 들어갈 자리는 Slot(이름)
+        """
+        pass
+
+    @abstractmethod
+    def interpretation_values(
+        self, raw_scores: dict[str, Any], result_type: str
+    ) -> dict[str, Any]:
+        """해석 페이로드의 Slot 이름 → 사용자별 값 (원점수에서 가져옴)"""
+        pass
+
+    def interpretation_keys(self) -> list[Hashable]:
+        """미리 만들어 둘 결과 유형 키 목록 (엔진 생성 시 모두 준비)"""
+        return []
+
+    def interpretation_key(self, raw_scores: dict[str, Any], result_type: str) -> Hashable:
+        """해석 템플릿을 고르는 키 (정적 부분이 결과 유형 외 원점수 값에도 좌우되면 재정의)"""
+        return result_type
+
+    def get_interpretation_template(
+        self, raw_scores: dict[str, Any], result_type: str
+    ) -> InterpretationTemplate:
+        key = self.interpretation_key(raw_scores, result_type)
+        templates = self._templates
+        if templates is None:
+            # 처음 해석할 때 알려진 결과 유형 전체를 한 번에 준비
+            templates = self._templates = {
+                known: InterpretationTemplate(self.build_interpretation(known))
+                for known in self.interpretation_keys()
+            }
+        template = templates.get(key)
+        if template is None:
+            # 알 수 없는 유형은 캐시하지 않음 (키 수가 유형 수로 제한되도록)
+            template = InterpretationTemplate(self.build_interpretation(key))
+        return template
+
     def interpret_result(
         self, raw_scores: dict[str, Any], result_type: str
     ) -> dict[str, Any]:
@@ -41,14 +118,52 @@ class BaseTestEngine(ABC):
         Returns:
             해석 결과 딕셔너리
         """
-        pass
+        template = self.get_interpretation_template(raw_scores, result_type)
+        return template.render(self.interpretation_values(raw_scores, result_type))
+
+    def interpret_result_json(
+        self, raw_scores: dict[str, Any], result_type: str
+    ) -> bytes:
+        """interpret_result의 JSON 바이트 (정적 부분은 미리 직렬화된 바이트 재사용)"""
+        template = self.get_interpretation_template(raw_scores, result_type)
+        return template.render_json(self.interpretation_values(raw_scores, result_type))
+
+    def indicator_key(self, key: Any) -> Any:
+        """scoring_weights 키 → 지표 키"""
+        return key
+
+    async def get_scoring_plan(self) -> ScoringPlan:
+        """검사 문항 은행을 컴파일한 채점 계획 (카탈로그 버전별로 한 번)"""
+        catalog = await get_catalog()
+        plan = _plans.get(self.test_code)
+        if plan is None or plan.version != catalog.version:
+            test = catalog.tests_by_code.get(self.test_code)
+            plan = _plans[self.test_code] = ScoringPlan(
+                catalog.questions_by_test_id.get(test["id"], []) if test else [],
+                self.indicators,
+                numeric_answer_types=self.numeric_answer_types,
+                string_answer_mode=self.string_answer_mode,
+                indicator_key=self.indicator_key,
+                version=catalog.version,
+            )
+        return plan
+
+    async def score_responses(self, responses: list[dict]) -> dict[Any, float]:
+        """응답을 채점 계획으로 채점하여 {지표: 점수}를 반환합니다."""
+        plan = await self.get_scoring_plan()
+        return plan.score(responses)
+
+    async def score_sessions(self, sessions: list[list[dict]]) -> list[dict[Any, float]]:
+        """여러 세션의 응답을 한 번에 채점합니다. (세션 순서대로 {지표: 점수} 목록)"""
+        plan = await self.get_scoring_plan()
+        return plan.score_batch(sessions)
 
     async def get_responses(self, session_id: str) -> list[dict]:
         """세션의 모든 응답을 가져옵니다."""
         supabase = get_supabase()
 
         result = (
-            supabase.table("responses")
+            await supabase.table("responses")
             .select("*, questions(*)")
             .eq("session_id", session_id)
             .order("questions(question_number)")
@@ -57,49 +172,33 @@ class BaseTestEngine(ABC):
 
         return result.data or []
 
+    def detect_fraud(self, responses: list[dict]) -> dict[str, Any]:
+        """
+        부정행위 판정 (응답 시간, 답 다양성/엔트로피, 연속 동일 응답, typing_pattern).
+        {"score": 0.0~1.0, "detections": [{"detection_type", "severity", "details"}]}
+        """
+        return detect_batch([responses])[0]
+
     def calculate_fraud_score(self, responses: list[dict]) -> float:
         """
         부정행위 점수를 계산합니다.
         0.0 ~ 1.0 사이의 값 (높을수록 부정행위 의심)
         """
-        if not responses:
-            return 0.0
-
-        fraud_indicators = []
-
-        # 1. 응답 시간 분석
-        response_times = [
-            r.get("response_time_ms", 0)
-            for r in responses
-            if r.get("response_time_ms")
-        ]
-        if response_times:
-            avg_time = sum(response_times) / len(response_times)
-
-            # 너무 빠른 응답 (평균 1초 미만)
-            if avg_time < 1000:
-                fraud_indicators.append(0.3)
-
-            # 너무 일정한 응답 시간
-            if len(response_times) > 5:
-                time_variance = sum(
-                    (t - avg_time) ** 2 for t in response_times
-                ) / len(response_times)
-                if time_variance < 10000:  # 매우 일정한 패턴
-                    fraud_indicators.append(0.2)
-
-        # 2. 응답 패턴 분석
-        answers = [r.get("answer") for r in responses]
-        if answers:
-            # 모든 응답이 같은 경우
-            if len(set(str(a) for a in answers if a is not None)) <= 2:
-                fraud_indicators.append(0.4)
-
-        return min(1.0, sum(fraud_indicators))
+        return self.detect_fraud(responses)["score"]
 
 
 # 엔진 레지스트리
+# 검사 코드 → 엔진 모듈. 모듈(유형 설명표 포함)은 해당 검사가 처음 쓰일 때 import 합니다.
+# 새 검사 엔진은 모듈을 만들고 여기에 한 줄 추가합니다.
+ENGINE_MODULES: dict[str, str] = {
+    "mbti": "app.tests_engine.mbti",
+    "disc": "app.tests_engine.disc",
+    "enneagram": "app.tests_engine.enneagram",
+}
+
 _engines: dict[str, type[BaseTestEngine]] = {}
+_instances: dict[str, BaseTestEngine] = {}
+_registry_lock = threading.Lock()
 
 
 def register_engine(engine_class: type[BaseTestEngine]) -> type[BaseTestEngine]:
@@ -109,8 +208,26 @@ def register_engine(engine_class: type[BaseTestEngine]) -> type[BaseTestEngine]:
 
 
 def get_test_engine(test_code: str) -> Optional[BaseTestEngine]:
-    """테스트 코드로 엔진 인스턴스를 가져옵니다."""
-    engine_class = _engines.get(test_code)
-    if engine_class:
-        return engine_class()
-    return None
+    """
+    테스트 코드로 엔진 인스턴스를 가져옵니다.
+    엔진은 상태가 없으므로 검사별로 하나만 만들어 모든 요청이 공유합니다.
+    (첫 사용 시 모듈 import와 생성은 락으로 한 번만 수행 — 스레드 풀에서 호출해도 안전)
+    """
+    engine = _instances.get(test_code)
+    if engine is not None:
+        return engine
+
+    module = ENGINE_MODULES.get(test_code)
+    if module is None and test_code not in _engines:
+        return None
+
+    with _registry_lock:
+        engine = _instances.get(test_code)
+        if engine is None:
+            if test_code not in _engines:
+                importlib.import_module(module)
+            engine_class = _engines.get(test_code)
+            if engine_class is None:
+                return None
+            engine = _instances[test_code] = engine_class()
+    return engine
@@ -1,6 +1,7 @@
-from typing import Tuple, Any
+from typing import Any, Optional, Tuple
 
 from app.tests_engine.base import BaseTestEngine, register_engine
+from app.tests_engine.interpretation import Slot
 
 
 @register_engine
@@ -10,6 +11,8 @@ class DISCEngine(BaseTestEngine):
     test_code = "disc"
     test_name = "DISC 행동 유형 검사"
 
+    indicators = ("D", "I", "S", "C")
+
     # DISC 유형 설명
     TYPE_DESCRIPTIONS = {
         "D": {
@@ -63,26 +66,17 @@ class DISCEngine(BaseTestEngine):
     }
 
     async def calculate_result(
-        self, session_id: str
+        self, session_id: str, responses: Optional[list[dict]] = None
     ) -> Tuple[dict[str, Any], str]:
-        responses = await self.get_responses(session_id)
+        if responses is None:
+            responses = await self.get_responses(session_id)
 
         # 각 유형별 점수 계산
-        scores = {"D": 0, "I": 0, "S": 0, "C": 0}
-
-        for response in responses:
-            question = response.get("questions", {})
-            answer = response.get("answer")
-            scoring = question.get("scoring_weights", {})
+        scores = await self.score_responses(responses)
 
-            if answer is not None and scoring:
-                for disc_type, weight in scoring.items():
-                    if disc_type in scores:
-                        if isinstance(answer, (int, float)):
-                            scores[disc_type] += weight * answer
-                        elif isinstance(answer, str) and answer in scoring:
-                            scores[disc_type] += scoring[answer]
+        return self.build_result(scores)
 
+    def build_result(self, scores: dict[Any, Any]) -> Tuple[dict[str, Any], str]:
         # 정규화 (0-100 스케일)
         max_score = max(scores.values()) if scores.values() else 1
         normalized = {k: round(v / max_score * 100, 1) for k, v in scores.items()}
@@ -110,10 +104,24 @@ class DISCEngine(BaseTestEngine):
 
         return raw_scores, result_type
 
-    def interpret_result(
+    def interpretation_keys(self) -> list[tuple[str, str]]:
+        return [
+            (primary, f"{primary}{secondary.lower()}")
+            for primary in self.TYPE_DESCRIPTIONS
+            for secondary in self.TYPE_DESCRIPTIONS
+            if secondary != primary
+        ]
+
+    def interpretation_key(self, raw_scores: dict[str, Any], result_type: str) -> tuple[str, str]:
+        return raw_scores.get("primary", result_type[0]), result_type
+
+    def interpretation_values(
         self, raw_scores: dict[str, Any], result_type: str
     ) -> dict[str, Any]:
-        primary = raw_scores.get("primary", result_type[0])
+        return {key: raw_scores.get(f"{key}_normalized", 0) for key in ("D", "I", "S", "C")}
+
+    def build_interpretation(self, key: tuple[str, str]) -> dict[str, Any]:
+        primary, result_type = key
         primary_info = self.TYPE_DESCRIPTIONS.get(primary, {})
 
         return {
@@ -128,9 +136,9 @@ class DISCEngine(BaseTestEngine):
             "work_style": primary_info.get("work_style", ""),
             "composite_description": self.COMPOSITE_TYPES.get(result_type, ""),
             "scores": {
-                "D": raw_scores.get("D_normalized", 0),
-                "I": raw_scores.get("I_normalized", 0),
-                "S": raw_scores.get("S_normalized", 0),
-                "C": raw_scores.get("C_normalized", 0),
+                "D": Slot("D"),
+                "I": Slot("I"),
+                "S": Slot("S"),
+                "C": Slot("C"),
             },
         }
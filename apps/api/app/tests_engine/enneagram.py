@@ -1,6 +1,7 @@
-from typing import Tuple, Any
+from typing import Any, Optional, Tuple
 
 from app.tests_engine.base import BaseTestEngine, register_engine
+from app.tests_engine.interpretation import Slot
 
 
 @register_engine
@@ -10,6 +11,9 @@ class EnneagramEngine(BaseTestEngine):
     test_code = "enneagram"
     test_name = "에니어그램 성격 유형 검사"
 
+    indicators = tuple(range(1, 10))
+    string_answer_mode = "weight"
+
     # 9가지 유형 설명
     TYPE_DESCRIPTIONS = {
         1: {
@@ -126,28 +130,21 @@ class EnneagramEngine(BaseTestEngine):
         "9w1": "몽상가 - 이상주의적이고 평화로운",
     }
 
+    def indicator_key(self, key: Any) -> Any:
+        return int(key) if isinstance(key, str) else key
+
     async def calculate_result(
-        self, session_id: str
+        self, session_id: str, responses: Optional[list[dict]] = None
     ) -> Tuple[dict[str, Any], str]:
-        responses = await self.get_responses(session_id)
+        if responses is None:
+            responses = await self.get_responses(session_id)
 
         # 각 유형별 점수 계산 (1-9)
-        scores = {i: 0 for i in range(1, 10)}
-
-        for response in responses:
-            question = response.get("questions", {})
-            answer = response.get("answer")
-            scoring = question.get("scoring_weights", {})
-
-            if answer is not None and scoring:
-                for type_num, weight in scoring.items():
-                    type_int = int(type_num) if isinstance(type_num, str) else type_num
-                    if type_int in scores:
-                        if isinstance(answer, (int, float)):
-                            scores[type_int] += weight * answer
-                        elif isinstance(answer, str):
-                            scores[type_int] += weight
+        scores = await self.score_responses(responses)
+
+        return self.build_result(scores)
 
+    def build_result(self, scores: dict[Any, Any]) -> Tuple[dict[str, Any], str]:
         # 주요 유형 결정
         sorted_types = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         primary_type = sorted_types[0][0]
@@ -170,10 +167,26 @@ class EnneagramEngine(BaseTestEngine):
 
         return raw_scores, result_type
 
-    def interpret_result(
+    def interpretation_keys(self) -> list[tuple[int, str]]:
+        return [
+            (primary, f"{primary}w{wing}")
+            for primary in self.TYPE_DESCRIPTIONS
+            for wing in (primary - 1 if primary > 1 else 9, primary + 1 if primary < 9 else 1)
+        ]
+
+    def interpretation_key(self, raw_scores: dict[str, Any], result_type: str) -> tuple[int, str]:
+        return raw_scores.get("primary_type", 1), result_type
+
+    def interpretation_values(
         self, raw_scores: dict[str, Any], result_type: str
     ) -> dict[str, Any]:
-        primary_type = raw_scores.get("primary_type", 1)
+        return {
+            "scores": {str(k): v for k, v in raw_scores.items() if k not in ["primary_type", "wing", "top_three"]},
+            "top_three": raw_scores.get("top_three", []),
+        }
+
+    def build_interpretation(self, key: tuple[int, str]) -> dict[str, Any]:
+        primary_type, result_type = key
         type_info = self.TYPE_DESCRIPTIONS.get(primary_type, {})
 
         return {
@@ -188,6 +201,6 @@ class EnneagramEngine(BaseTestEngine):
             "growth_direction": type_info.get("growth_direction"),
             "stress_direction": type_info.get("stress_direction"),
             "wing_description": self.WING_DESCRIPTIONS.get(result_type, ""),
-            "scores": {str(k): v for k, v in raw_scores.items() if k not in ["primary_type", "wing", "top_three"]},
-            "top_three_types": raw_scores.get("top_three", []),
+            "scores": Slot("scores"),
+            "top_three_types": Slot("top_three"),
         }
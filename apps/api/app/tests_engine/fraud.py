@@ -0,0 +1,170 @@
+import math
+from typing import Any
+
+import numpy as np
+
+# 탐지 규칙: (detection_type, 가중치, severity)
+# 세션 부정행위 점수 = 걸린 규칙 가중치의 합 (최대 1.0)
+DETECTIONS = (
+    ("fast_responses", 0.3, "medium"),       # 평균 응답 시간 1초 미만
+    ("uniform_timing", 0.2, "low"),          # 응답 시간이 지나치게 일정 (분산 < 10000ms²)
+    ("low_answer_variety", 0.4, "high"),     # 서로 다른 답이 2개 이하
+    ("low_answer_entropy", 0.2, "low"),      # 답 분포 엔트로피 1비트 미만
+    ("straight_lining", 0.3, "medium"),      # 같은 답 연속 (전체의 절반 이상, 8문항 이상)
+    ("pasted_input", 0.2, "medium"),         # typing_pattern에 붙여넣기 기록
+    ("focus_lost", 0.1, "low"),              # typing_pattern에 화면 이탈 3회 이상
+)
+
+FAST_MEAN_MS = 1000
+UNIFORM_VARIANCE = 10000
+MIN_TIMED_RESPONSES = 5
+MAX_DISTINCT_ANSWERS = 2
+MIN_ENTROPY_BITS = 1.0
+MIN_ENTROPY_ANSWERS = 10
+STRAIGHT_LINE_RATIO = 0.5
+STRAIGHT_LINE_MIN_RUN = 8
+FOCUS_LOST_MIN = 3
+
+
+def _typing_counts(pattern: Any) -> tuple[float, float]:
+    """typing_pattern → (붙여넣기 횟수, 화면 이탈 횟수) — 클라이언트가 보낸 키만 사용"""
+    if not isinstance(pattern, dict):
+        return 0.0, 0.0
+    paste = pattern.get("paste_count", 1 if pattern.get("pasted") else 0)
+    blur = pattern.get("blur_count", 0)
+    return (
+        float(paste) if isinstance(paste, (int, float)) else 0.0,
+        float(blur) if isinstance(blur, (int, float)) else 0.0,
+    )
+
+
+def extract_features(sessions: list[list[dict]]) -> dict[str, np.ndarray]:
+    """
+    여러 세션의 응답(문항 순서)을 한 번에 펼쳐 세션별 특징 벡터를 계산합니다.
+    응답을 한 번 훑어 열 배열로 펼친 뒤, 세션마다 반복하지 않고
+    (세션 번호, 값) 배열에 bincount/unique를 적용합니다.
+    """
+    n = len(sessions)
+    lengths = np.fromiter((len(s) for s in sessions), dtype=np.int64, count=n)
+    session = np.repeat(np.arange(n), lengths)
+
+    # 응답을 한 번만 훑어 열(column) 배열로 펼침 — 이후 계산은 모두 배열 연산
+    # 답은 기존 규칙처럼 문자열 기준으로 같은 답을 판단 (None은 -1)
+    codes: dict[str, int] = {}
+    time_values, answer_codes, typing_values = [], [], []
+    for responses in sessions:
+        for r in responses:
+            time_values.append(r.get("response_time_ms") or 0)
+            answer = r.get("answer")
+            if answer is None:
+                answer_codes.append(-1)
+            else:
+                key = answer if type(answer) is str else str(answer)
+                code = codes.get(key)
+                if code is None:
+                    code = codes[key] = len(codes)
+                answer_codes.append(code)
+            pattern = r.get("typing_pattern")
+            if pattern:
+                typing_values.append((len(answer_codes) - 1, *_typing_counts(pattern)))
+
+    # 응답 시간 (없거나 0이면 제외 — 기존 규칙과 동일)
+    times = np.array(time_values, dtype=np.float64)
+    timed = times > 0
+    timed_count = np.bincount(session[timed], minlength=n)
+    time_sum = np.bincount(session[timed], weights=times[timed], minlength=n)
+    mean_time = np.divide(time_sum, timed_count, out=np.zeros(n), where=timed_count > 0)
+    deviation = (times[timed] - mean_time[session[timed]]) ** 2
+    time_variance = np.divide(
+        np.bincount(session[timed], weights=deviation, minlength=n),
+        timed_count, out=np.zeros(n), where=timed_count > 0,
+    )
+
+    # 답 패턴 (세션 × 답 코드 빈도)
+    answer_code = np.array(answer_codes, dtype=np.int64)
+    answered = answer_code >= 0
+    answered_count = np.bincount(session[answered], minlength=n)
+    pair, pair_count = np.unique(session[answered] * (len(codes) + 1) + answer_code[answered], return_counts=True)
+    pair_session = pair // (len(codes) + 1)
+    distinct_answers = np.bincount(pair_session, minlength=n)
+    p = pair_count / answered_count[pair_session]
+    answer_entropy = -np.bincount(pair_session, weights=p * np.log2(p), minlength=n) + 0.0
+
+    # 같은 답이 연속된 최장 구간 (세션 경계나 답이 바뀌는 곳에서 새 구간 시작)
+    longest_run = np.zeros(n, dtype=np.int64)
+    if len(answer_code):
+        starts = np.ones(len(answer_code), dtype=bool)
+        starts[1:] = (answer_code[1:] != answer_code[:-1]) | (session[1:] != session[:-1])
+        run_id = np.cumsum(starts) - 1
+        run_length = np.bincount(run_id[answered], minlength=int(run_id[-1]) + 1)
+        np.maximum.at(longest_run, session[starts], run_length[run_id[starts]])
+
+    typing = np.array(typing_values, dtype=np.float64).reshape(-1, 3)
+    typing_session = session[typing[:, 0].astype(np.int64)]
+
+    return {
+        "responses": lengths,
+        "timed_responses": timed_count,
+        "mean_response_ms": mean_time,
+        "response_ms_variance": time_variance,
+        "answered": answered_count,
+        "distinct_answers": distinct_answers,
+        "answer_entropy_bits": answer_entropy,
+        "longest_same_answer_run": longest_run,
+        "paste_count": np.bincount(typing_session, weights=typing[:, 1], minlength=n),
+        "focus_lost_count": np.bincount(typing_session, weights=typing[:, 2], minlength=n),
+    }
+
+
+def evaluate(features: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """특징 벡터 → 규칙별 세션 적중 여부 (bool 배열)"""
+    f = features
+    return {
+        "fast_responses": (f["timed_responses"] > 0) & (f["mean_response_ms"] < FAST_MEAN_MS),
+        "uniform_timing": (f["timed_responses"] > MIN_TIMED_RESPONSES) & (f["response_ms_variance"] < UNIFORM_VARIANCE),
+        "low_answer_variety": (f["responses"] > 0) & (f["distinct_answers"] <= MAX_DISTINCT_ANSWERS),
+        "low_answer_entropy": (f["answered"] >= MIN_ENTROPY_ANSWERS) & (f["answer_entropy_bits"] < MIN_ENTROPY_BITS),
+        "straight_lining": (f["longest_same_answer_run"] >= STRAIGHT_LINE_MIN_RUN)
+        & (f["longest_same_answer_run"] >= STRAIGHT_LINE_RATIO * f["answered"]),
+        "pasted_input": f["paste_count"] > 0,
+        "focus_lost": f["focus_lost_count"] >= FOCUS_LOST_MIN,
+    }
+
+
+def detect_batch(sessions: list[list[dict]]) -> list[dict]:
+    """
+    세션별 부정행위 판정 목록.
+    각 항목: {"score": 0.0~1.0, "detections": [{"detection_type", "severity", "details"}]}
+    """
+    if not sessions:
+        return []
+
+    features = extract_features(sessions)
+    hits = evaluate(features)
+
+    weights = np.zeros(len(sessions))
+    for detection_type, weight, _ in DETECTIONS:
+        weights += np.where(hits[detection_type], weight, 0.0)
+    scores = np.minimum(1.0, weights).round(2).tolist()
+
+    columns = {name: values.tolist() for name, values in features.items()}
+    flagged = {name: np.flatnonzero(hit).tolist() for name, hit in hits.items()}
+
+    reports = [{"score": score, "detections": []} for score in scores]
+    for detection_type, weight, severity in DETECTIONS:
+        for i in flagged[detection_type]:
+            reports[i]["detections"].append({
+                "detection_type": detection_type,
+                "severity": severity,
+                "details": {
+                    "weight": weight,
+                    **{name: _json_number(values[i]) for name, values in columns.items()},
+                },
+            })
+    return reports
+
+
+def _json_number(value: float) -> float:
+    if isinstance(value, float):
+        return round(value, 3) if math.isfinite(value) else 0.0
+    return value
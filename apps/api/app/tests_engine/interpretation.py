@@ -0,0 +1,70 @@
+import json
+import re
+from typing import Any
+
+# 응답 JSON 직렬화 형식 (Starlette JSONResponse와 동일)
+_DUMPS = {"ensure_ascii": False, "allow_nan": False, "separators": (",", ":")}
+
+
+def dumps(value: Any) -> bytes:
+    return json.dumps(value, **_DUMPS).encode()
+
+
+class Slot:
+    """해석 템플릿에서 사용자별 값이 들어갈 자리"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class InterpretationTemplate:
+    """
+    결과 유형별 해석 페이로드의 정적 부분을 미리 만들어 둔 템플릿.
+
+    유형 설명/라벨 같은 정적 값은 한 번만 JSON 바이트로 직렬화하고,
+    Slot 자리에는 응답 시점에 사용자별 숫자 값만 직렬화해 이어 붙입니다.
+    """
+
+    def __init__(self, payload: dict[str, Any]):
+        self.payload = payload
+
+        slots: list[str] = []
+
+        def mark(node: Any) -> Any:
+            if isinstance(node, Slot):
+                slots.append(node.name)
+                return f"\x00slot{len(slots) - 1}\x00"
+            if isinstance(node, dict):
+                return {key: mark(value) for key, value in node.items()}
+            if isinstance(node, list):
+                return [mark(value) for value in node]
+            return node
+
+        text = json.dumps(mark(payload), **_DUMPS)
+        parts = re.split(r'"\\u0000slot(\d+)\\u0000"', text)
+
+        # parts = [정적, 슬롯 번호, 정적, 슬롯 번호, ..., 정적]
+        self._segments = [part.encode() for part in parts[0::2]]
+        self._slots = [slots[int(index)] for index in parts[1::2]]
+
+    def render(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Slot을 값으로 채운 해석 딕셔너리"""
+
+        def fill(node: Any) -> Any:
+            if isinstance(node, Slot):
+                return values[node.name]
+            if isinstance(node, dict):
+                return {key: fill(value) for key, value in node.items()}
+            if isinstance(node, list):
+                return [fill(value) for value in node]
+            return node
+
+        return fill(self.payload)
+
+    def render_json(self, values: dict[str, Any]) -> bytes:
+        """render(values)를 JSON으로 직렬화한 것과 같은 바이트 (정적 부분은 재직렬화하지 않음)"""
+        out = [self._segments[0]]
+        for name, segment in zip(self._slots, self._segments[1:]):
+            out.append(dumps(values[name]))
+            out.append(segment)
+        return b"".join(out)
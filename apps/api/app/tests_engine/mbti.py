@@ -1,6 +1,7 @@
-from typing import Tuple, Any
+from typing import Any, Optional, Tuple
 
 from app.tests_engine.base import BaseTestEngine, register_engine
+from app.tests_engine.interpretation import Slot
 
 
 @register_engine
@@ -10,6 +11,9 @@ class MBTIEngine(BaseTestEngine):
     test_code = "mbti"
     test_name = "MBTI 성격 유형 검사"
 
+    indicators = ("E", "I", "S", "N", "T", "F", "J", "P")
+    numeric_answer_types = (int,)
+
     # 4가지 지표별 설명
     DIMENSIONS = {
         "E-I": {"E": "외향(Extraversion)", "I": "내향(Introversion)"},
@@ -119,27 +123,17 @@ class MBTIEngine(BaseTestEngine):
     }
 
     async def calculate_result(
-        self, session_id: str
+        self, session_id: str, responses: Optional[list[dict]] = None
     ) -> Tuple[dict[str, Any], str]:
-        responses = await self.get_responses(session_id)
+        if responses is None:
+            responses = await self.get_responses(session_id)
 
         # 각 지표별 점수 계산
-        scores = {"E": 0, "I": 0, "S": 0, "N": 0, "T": 0, "F": 0, "J": 0, "P": 0}
-
-        for response in responses:
-            question = response.get("questions", {})
-            answer = response.get("answer")
-            scoring = question.get("scoring_weights", {})
-
-            if answer is not None and scoring:
-                # 응답에 따른 점수 가산
-                for indicator, weight in scoring.items():
-                    if indicator in scores:
-                        if isinstance(answer, int):
-                            scores[indicator] += weight * answer
-                        elif isinstance(answer, str) and answer in scoring:
-                            scores[indicator] += scoring[answer]
+        scores = await self.score_responses(responses)
+
+        return self.build_result(scores)
 
+    def build_result(self, scores: dict[Any, Any]) -> Tuple[dict[str, Any], str]:
         # 유형 결정
         type_code = ""
         type_code += "E" if scores["E"] >= scores["I"] else "I"
@@ -175,9 +169,18 @@ class MBTIEngine(BaseTestEngine):
             "second": round(abs(b) / total * 100, 1),
         }
 
-    def interpret_result(
+    def interpretation_keys(self) -> list[str]:
+        return list(self.TYPE_DESCRIPTIONS)
+
+    def interpretation_values(
         self, raw_scores: dict[str, Any], result_type: str
     ) -> dict[str, Any]:
+        return {
+            key: raw_scores.get(key, {})
+            for key in ("E_I_pct", "S_N_pct", "T_F_pct", "J_P_pct")
+        }
+
+    def build_interpretation(self, result_type: str) -> dict[str, Any]:
         type_info = self.TYPE_DESCRIPTIONS.get(
             result_type,
             {
@@ -199,25 +202,25 @@ class MBTIEngine(BaseTestEngine):
                     "result": result_type[0],
                     "E_label": self.DIMENSIONS["E-I"]["E"],
                     "I_label": self.DIMENSIONS["E-I"]["I"],
-                    "percentage": raw_scores.get("E_I_pct", {}),
+                    "percentage": Slot("E_I_pct"),
                 },
                 "S-N": {
                     "result": result_type[1],
                     "S_label": self.DIMENSIONS["S-N"]["S"],
                     "N_label": self.DIMENSIONS["S-N"]["N"],
-                    "percentage": raw_scores.get("S_N_pct", {}),
+                    "percentage": Slot("S_N_pct"),
                 },
                 "T-F": {
                     "result": result_type[2],
                     "T_label": self.DIMENSIONS["T-F"]["T"],
                     "F_label": self.DIMENSIONS["T-F"]["F"],
-                    "percentage": raw_scores.get("T_F_pct", {}),
+                    "percentage": Slot("T_F_pct"),
                 },
                 "J-P": {
                     "result": result_type[3],
                     "J_label": self.DIMENSIONS["J-P"]["J"],
                     "P_label": self.DIMENSIONS["J-P"]["P"],
-                    "percentage": raw_scores.get("J_P_pct", {}),
+                    "percentage": Slot("J_P_pct"),
                 },
             },
         }
@@ -0,0 +1,152 @@
+from typing import Any, Callable, Optional
+
+_NUMBER = (int, float)
+
+
+class ScoringPlan:
+    """
+    검사 문항 은행을 한 번 컴파일한 채점 계획.
+
+    문항마다 scoring_weights에서 지표 키가 있는 열만 골라 (지표 열, 가중치) 목록으로 컴파일합니다.
+    - weighted: 문항별 원래 가중치 목록 (숫자가 아닌 가중치는 0)
+    - unit: 문항별 가중치 1 목록 (선택지 응답용)
+    - options: 문항별 {선택지 키: 값} 조회표 (문자열 응답용)
+
+    채점은 응답마다 (목록, 계수)를 고른 뒤 계수 × 가중치를 더합니다.
+    - 숫자 응답: 계수 = 응답값, 목록 = weighted
+    - 문자열 응답(option 모드): 계수 = scoring_weights[응답], 목록 = unit
+    - 문자열 응답(weight 모드): 계수 = 1, 목록 = weighted
+    기존 응답별 루프와 같은 항을 같은 순서로 더하므로 결과 값과 타입(int/float)이 같습니다.
+    """
+
+    def __init__(
+        self,
+        questions: list[dict],
+        indicators: tuple,
+        numeric_answer_types: tuple = _NUMBER,
+        string_answer_mode: str = "option",
+        indicator_key: Callable[[Any], Any] = lambda key: key,
+        version: Optional[int] = None,
+    ):
+        self.indicators = indicators
+        self.numeric_answer_types = numeric_answer_types
+        self.string_answer_mode = string_answer_mode
+        self.indicator_key = indicator_key
+        self.version = version
+
+        self._column = {indicator: i for i, indicator in enumerate(indicators)}
+        self.row_of: dict[Any, int] = {}
+        self.weighted: list[list[tuple[int, Any]]] = []
+        self.unit: list[list[tuple[int, Any]]] = []
+        self.options: list[dict[str, Any]] = []
+        self.has_scoring: list[bool] = []
+        self.add_questions(questions)
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def add_questions(self, questions: list[dict]) -> None:
+        """문항을 계획에 추가 (이미 있는 문항 ID는 건너뜀)"""
+        for question in questions:
+            if question.get("id") in self.row_of:
+                continue
+
+            scoring = question.get("scoring_weights") or {}
+            weights: dict[int, Any] = {}
+            for key, weight in scoring.items():
+                try:
+                    column = self._column.get(self.indicator_key(key))
+                except ValueError:
+                    column = None
+                if column is None:
+                    continue
+                if isinstance(weight, float):
+                    weights[column] = weight
+                else:
+                    weights[column] = int(weight) if isinstance(weight, _NUMBER) else 0
+
+            columns = sorted(weights)
+            self.row_of[question.get("id")] = len(self.options)
+            self.weighted.append([(column, weights[column]) for column in columns])
+            self.unit.append([(column, 1) for column in columns])
+            self.options.append({
+                key: value for key, value in scoring.items() if isinstance(value, _NUMBER)
+            })
+            self.has_scoring.append(bool(scoring))
+
+    def score(self, responses: list[dict]) -> dict:
+        """
+        응답 목록(question_id, answer)을 채점하여 {지표: 점수}를 반환합니다.
+        계획에 없는 문항은 응답에 조인된 questions로 추가합니다.
+        """
+        self._add_missing(responses)
+
+        totals = [0] * len(self.indicators)
+        for entries, coef in self._iter_terms(responses):
+            for column, weight in entries:
+                totals[column] += coef * weight
+        return dict(zip(self.indicators, totals))
+
+    def score_batch(self, sessions: list[list[dict]]) -> list[dict]:
+        """여러 세션을 채점합니다. (재채점 작업용, 세션 순서대로 {지표: 점수} 목록)"""
+        return [self.score(responses) for responses in sessions]
+
+    def _add_missing(self, responses: list[dict]) -> None:
+        """계획에 없는 문항을 응답에 조인된 questions로 추가"""
+        missing = [
+            r["questions"] for r in responses
+            if r.get("question_id") not in self.row_of and r.get("questions")
+        ]
+        if missing:
+            self.add_questions(missing)
+
+    def _iter_terms(self, responses: list[dict]):
+        """채점 대상 응답의 ((지표 열, 가중치) 목록, 계수)를 응답 순서대로"""
+        row_of, options, has_scoring = self.row_of, self.options, self.has_scoring
+        numeric_types, weight_mode = self.numeric_answer_types, self.string_answer_mode == "weight"
+        weighted, unit = self.weighted, self.unit
+
+        for response in responses:
+            row = row_of.get(response.get("question_id"))
+            answer = response.get("answer")
+            if row is None or answer is None or not has_scoring[row]:
+                continue
+
+            if isinstance(answer, numeric_types):
+                yield weighted[row], answer
+            elif isinstance(answer, str) and weight_mode:
+                yield weighted[row], 1
+            elif isinstance(answer, str) and answer in options[row]:
+                yield unit[row], options[row][answer]
+
+
+class RunningScore:
+    """
+    응답이 들어올 때마다 지표별 합계를 누적하는 세션 채점 상태.
+
+    정수 항만 더해진 동안은 덧셈 순서와 무관하게 score()와 같으므로(exact)
+    완료 시 그대로 결과로 쓰고, 실수 항이 섞이면 진행률 표시용 잠정 점수로만 씁니다.
+    """
+
+    def __init__(self, plan: ScoringPlan):
+        self.plan = plan
+        self.totals = [0] * len(plan.indicators)
+        self.responses = 0
+        self.exact = True  # 실수 항 없음 — 최종 점수로 사용 가능
+        self.complete = True  # 모든 응답 문항이 계획에 있음
+
+    def add(self, responses: list[dict]) -> None:
+        self.responses += len(responses)
+        if any(r.get("question_id") not in self.plan.row_of for r in responses):
+            self.complete = False
+
+        totals = self.totals
+        for entries, coef in self.plan._iter_terms(responses):
+            for column, weight in entries:
+                term = coef * weight
+                if isinstance(term, float):
+                    self.exact = False
+                totals[column] += term
+
+    def scores(self) -> dict:
+        return dict(zip(self.plan.indicators, self.totals))
@@ -0,0 +1,54 @@
+"""벤치마크용 합성 데이터"""
+import random
+
+from app.services.matching_service import ABILITY_COLUMNS
+
+MBTI_TYPES = [a + b + c + d for a in "EI" for b in "SN" for c in "TF" for d in "JP"]
+DISC_TYPES = ["Di", "Dc", "Id", "Is", "Si", "Sc", "Cd", "Cs"]
+CULTURE_TAGS = ["자율출퇴근", "수평문화", "성과중심", "데이터중심", "팀워크중심", "혁신적", "안정적", "성장지향"]
+REMOTE_PREFS = [None, "remote", "hybrid", "office"]
+LOCATIONS = [None, "서울", "서울 강남", "판교", "부산", "대전"]
+
+
+def make_seekers(n: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    seekers = []
+    for i in range(n):
+        seekers.append({
+            "id": f"{i:08d}-0000-0000-0000-000000000000",
+            "abilities_snapshot": [
+                {"key": code, "score": rng.randint(0, 100)}
+                for code in ABILITY_COLUMNS
+                if rng.random() < 0.9
+            ],
+            "comprehensive_profile": (
+                {"mbti": {"type": rng.choice(MBTI_TYPES)}, "disc": {"type": rng.choice(DISC_TYPES)}}
+                if rng.random() < 0.95
+                else None
+            ),
+            "remote_pref": rng.choice(REMOTE_PREFS),
+            "experience_years": rng.randint(0, 20),
+            "location_pref": rng.choice(LOCATIONS),
+        })
+    return seekers
+
+
+def make_jobs(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        jobs.append({
+            "id": f"{i:08d}-1111-1111-1111-111111111111",
+            "required_abilities": {
+                code: {"min": rng.randint(40, 90)}
+                for code in rng.sample(ABILITY_COLUMNS, rng.randint(2, 8))
+            },
+            "preferred_culture": rng.sample(CULTURE_TAGS, rng.randint(0, 4)) or None,
+            "conditions": {
+                "remote": rng.choice(REMOTE_PREFS),
+                "experience_min": rng.choice([None, 0, 2, 5]),
+                "experience_max": rng.choice([None, 10, 15]),
+                "location": rng.choice(LOCATIONS),
+            },
+        })
+    return jobs
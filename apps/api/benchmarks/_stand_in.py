@@ -0,0 +1,62 @@
+"""로컬 PostgREST 대역(stand-in) 서버"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+# (method, table, query, body) -> 응답 JSON
+Route = Callable[[str, str, dict, Any], Any]
+
+
+class StandIn:
+    """
+    요청마다 latency_ms 만큼 대기한 뒤 route의 결과를 돌려주는 HTTP 서버.
+    처리한 요청은 requests에 (method, table)로 기록되어 DB 왕복 횟수를 셀 수 있습니다.
+    """
+
+    def __init__(self, route: Route, latency_ms: float = 0):
+        self.requests: list[tuple[str, str]] = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                url = urlparse(self.path)
+                table = url.path.rsplit("/", 1)[-1]
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                stand_in.requests.append((self.command, table))
+
+                if latency_ms:
+                    time.sleep(latency_ms / 1000)
+                payload = json.dumps(route(self.command, table, parse_qs(url.query), body)).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            # 동시 연결이 많은 벤치마크에서 연결이 거부되지 않도록 (기본 5)
+            request_queue_size = 256
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self) -> "StandIn":
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.shutdown()
@@ -0,0 +1,149 @@
+"""
+표 기반 능력치 매핑 검증 및 벤치마크.
+
+검사별 원점수(MBTI 유형, DISC 점수, IQ, 직접 매핑 점수, 빈 결과 등)를 섞은 합성 사용자를 만들어
+기존 검사별 분기 루프로 만든 능력치 상태와 apply_test_result(결과 하나씩),
+compute_ability_states(여러 사용자 일괄)의 상태가 같은지 확인한 뒤 처리량(users/s)을 비교합니다.
+
+실행: cd apps/api && python -m benchmarks.ability_mapping [--users 20000]
+"""
+import argparse
+import random
+import time
+from typing import Optional
+
+from benchmarks import _env  # noqa: F401
+
+from app.models.ability import ABILITY_DEFINITIONS
+from app.services.ability_mapping import TEST_ABILITY_MAPPING, compute_ability_states
+from app.services.ability_service import _empty_state, apply_test_result
+
+_ABILITY_CODES = {ability["code"] for ability in ABILITY_DEFINITIONS}
+
+
+# ---- 기존 검사별 분기 루프 (기준) ----
+
+def legacy_score(test_code: str, ability_code: str, raw_scores: dict) -> Optional[float]:
+    if not raw_scores:
+        return None
+    if test_code == "mbti":
+        return legacy_mbti(raw_scores.get("type", ""), ability_code)
+    elif test_code == "disc":
+        return legacy_disc(
+            raw_scores.get("D", 0), raw_scores.get("I", 0),
+            raw_scores.get("S", 0), raw_scores.get("C", 0), ability_code,
+        )
+    elif test_code == "iq":
+        return min(20, max(0, (raw_scores.get("score", 100) - 70) / 8))
+    if ability_code in raw_scores:
+        return min(20, max(0, raw_scores[ability_code]))
+    return None
+
+
+def legacy_mbti(type_code: str, ability_code: str) -> float:
+    if not type_code or len(type_code) != 4:
+        return 10.0
+    mappings = {
+        "determination": {"E": 12, "I": 8, "T": 14, "F": 10, "J": 14, "P": 10},
+        "composure": {"I": 14, "E": 10, "T": 14, "F": 10, "J": 12, "P": 10},
+        "creativity": {"N": 16, "S": 10, "P": 14, "J": 10},
+        "analytical": {"T": 16, "F": 10, "N": 12, "S": 12},
+        "communication": {"E": 16, "I": 10, "F": 14, "T": 10},
+        "teamwork": {"F": 14, "T": 10, "S": 12, "N": 12},
+        "leadership": {"E": 14, "I": 10, "T": 12, "F": 12, "J": 14, "P": 10},
+        "empathy": {"F": 16, "T": 10, "E": 12, "I": 12},
+        "planning": {"J": 16, "P": 10, "S": 12, "N": 12},
+        "adaptability": {"P": 16, "J": 10, "N": 12, "S": 12},
+    }
+    if ability_code not in mappings:
+        return 10.0
+    score = 0
+    count = 0
+    for letter, value in mappings[ability_code].items():
+        if letter in type_code:
+            score += value
+            count += 1
+    return score / count if count > 0 else 10.0
+
+
+def legacy_disc(d: float, i: float, s: float, c: float, ability_code: str) -> float:
+    mappings = {
+        "determination": d * 0.8,
+        "communication": i * 0.8,
+        "leadership": (d + i) * 0.4,
+        "influence": i * 0.8,
+        "execution": (d + c) * 0.4,
+        "teamwork": s * 0.8,
+        "adaptability": (i + s) * 0.4,
+    }
+    return min(20, max(0, mappings.get(ability_code, 10)))
+
+
+def legacy_state(results: list[tuple[str, dict]]) -> dict:
+    state = _empty_state()
+    for test_code, raw_scores in results:
+        state["completed_tests"].append(test_code)
+        for ability_code in TEST_ABILITY_MAPPING.get(test_code, []):
+            if ability_code not in _ABILITY_CODES:
+                continue
+            score = legacy_score(test_code, ability_code, raw_scores)
+            if score is not None:
+                state["score_sums"][ability_code] = state["score_sums"].get(ability_code, 0) + score
+                state["score_counts"][ability_code] = state["score_counts"].get(ability_code, 0) + 1
+                state["source_tests"].setdefault(ability_code, []).append(test_code)
+    return state
+
+
+# ---- 합성 데이터 ----
+
+def make_result(rng: random.Random, codes: list[str]) -> tuple[str, dict]:
+    test_code = rng.choice(["mbti", "mbti", "disc", "disc", "iq", "enneagram", "tci", "gallup", "holland", "saju"])
+    if rng.random() < 0.05:
+        return test_code, {}
+    if test_code == "mbti":
+        type_code = rng.choice(["".join(rng.choice(pair) for pair in ("EI", "SN", "TF", "JP")), "", "INT", "XXXX"])
+        return test_code, {"type": type_code}
+    if test_code == "disc":
+        return test_code, {
+            key: rng.choice([rng.randint(-10, 40), round(rng.uniform(-5, 40), 3)])
+            for key in "DISC" if rng.random() < 0.9
+        }
+    if test_code == "iq":
+        return test_code, {"score": rng.choice([rng.randint(50, 250), rng.uniform(60, 200)])} if rng.random() < 0.8 else {"x": 1}
+    return test_code, {code: rng.choice([rng.randint(-5, 30), rng.uniform(-3, 25)]) for code in rng.sample(codes, 8)}
+
+
+def main(n_users: int) -> None:
+    rng = random.Random(19)
+    codes = [ability["code"] for ability in ABILITY_DEFINITIONS]
+    users = [[make_result(rng, codes) for _ in range(rng.randint(0, 12))] for _ in range(n_users)]
+
+    def per_result(results):
+        state = _empty_state()
+        for test_code, raw_scores in results:
+            apply_test_result(state, test_code, raw_scores)
+        return state
+
+    timings, states = {}, {}
+    for name, run in (
+        ("legacy loop", lambda: [legacy_state(results) for results in users]),
+        ("table, per result", lambda: [per_result(results) for results in users]),
+        ("table, batch", lambda: compute_ability_states(users)),
+    ):
+        started = time.perf_counter()
+        states[name] = run()
+        timings[name] = time.perf_counter() - started
+
+    expected = states["legacy loop"]
+    for name, result in states.items():
+        assert result == expected, name
+    print(f"{n_users} users, {sum(map(len, users))} results: identical states")
+    for name, elapsed in timings.items():
+        print(f"{name:<18} {n_users / elapsed:10,.0f} users/s ({timings['legacy loop'] / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.users)
@@ -0,0 +1,61 @@
+"""
+calculate_abilities 호출당 DB 왕복 횟수 벤치마크.
+
+PostgREST 대역 서버에 들어온 요청 수를 세어 호출 1회당 왕복 횟수와 소요 시간을 출력합니다.
+첫 호출은 연결을 새로 맺으므로 따로 표시합니다.
+
+실행: cd apps/api && python -m benchmarks.ability_round_trips [--calls 20] [--latency-ms 5]
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._stand_in import StandIn
+
+from app.services import supabase_client
+from app.services.ability_service import calculate_abilities
+
+TEST_RESULTS = [
+    {"id": "00000000-0000-0000-0000-000000000001", "tests": {"code": "mbti"}, "raw_scores": {"type": "INTJ"}},
+    {"id": "00000000-0000-0000-0000-000000000002", "tests": {"code": "disc"}, "raw_scores": {"D": 20, "I": 8, "S": 5, "C": 14}},
+    {"id": "00000000-0000-0000-0000-000000000003", "tests": {"code": "iq"}, "raw_scores": {"score": 125}},
+]
+
+
+def route(method: str, table: str, query: dict, body):
+    if table == "test_results":
+        return TEST_RESULTS
+    if table == "replace_ability_states":
+        return []
+    return body if isinstance(body, list) else [body or {}]
+
+
+async def main(calls: int, latency_ms: float) -> None:
+    with StandIn(route, latency_ms) as stand_in:
+        supabase_client.supabase = supabase_client.create_supabase(stand_in.url, "bench.bench.bench")
+
+        for label, n in [("first call", 1), ("warm calls", calls)]:
+            stand_in.requests.clear()
+            started = time.perf_counter()
+            for _ in range(n):
+                await calculate_abilities("00000000-0000-0000-0000-000000000000")
+            elapsed = (time.perf_counter() - started) / n
+
+            per_call = len(stand_in.requests) / n
+            breakdown = ", ".join(
+                f"{method} {table} x{count / n:g}"
+                for (method, table), count in Counter(stand_in.requests).items()
+            )
+            print(f"{label:<10} {per_call:5.1f} round trips/call, {elapsed * 1000:6.1f} ms/call  ({breakdown})")
+
+        await supabase_client.close_supabase()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.latency_ms))
@@ -0,0 +1,62 @@
+"""
+공고별 후보자 전역 순위 벤치마크.
+
+합성 구직자 N명으로 SeekerStore을 만들고 rank_candidates의 소요 시간을 측정합니다.
+측정 전에 일부 구직자에 대해 calculate_fit_score(스칼라)와 결과가 같은지 확인합니다.
+
+실행: cd apps/api && python -m benchmarks.candidate_ranking [--seekers 100000]
+"""
+import argparse
+import time
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._data import make_jobs, make_seekers
+
+from app.services.matching_service import calculate_fit_score
+from app.services.ranking_service import rank_candidates, score_job_candidates
+from app.services.seeker_store import SeekerStore
+
+
+def main(n_seekers: int, repeat: int) -> None:
+    seekers = make_seekers(n_seekers)
+    jobs = make_jobs(repeat)
+
+    started = time.perf_counter()
+    store = SeekerStore.from_rows(seekers)
+    print(f"store build: {n_seekers} seekers in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    # 스칼라 함수와 결과 비교
+    for job in jobs[:3]:
+        scores = score_job_candidates(store, job)
+        for i in range(0, n_seekers, max(1, n_seekers // 500)):
+            expected = calculate_fit_score(seekers[i], job, None, None)
+            assert expected["total"] == scores["total"][i], (i, expected, scores["total"][i])
+
+    # 커서로 이어 받은 페이지가 한 번에 받은 순위와 같은지 확인
+    full = rank_candidates(store, jobs[0], limit=60)
+    paged, after = [], None
+    for _ in range(3):
+        page = rank_candidates(store, jobs[0], limit=20, after=after)
+        paged += page
+        after = (page[-1][1]["total"], page[-1][0])
+    assert paged == full
+
+    timings = []
+    for job in jobs:
+        started = time.perf_counter()
+        rank_candidates(store, job, limit=20, after=after)
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    print(
+        f"rank_candidates: median {timings[len(timings) // 2] * 1000:.1f} ms, "
+        f"max {timings[-1] * 1000:.1f} ms ({repeat} jobs)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seekers", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.seekers, args.repeat)
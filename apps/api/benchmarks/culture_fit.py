@@ -0,0 +1,137 @@
+"""
+문화 적합도 비트마스크 검증 및 벤치마크.
+
+MBTI/DISC 유형(없는 프로필, 빈 유형, 소문자/모르는 글자 포함)을 섞은 합성 구직자와
+문화 태그 목록(중복·모르는 태그, 빈 목록, 목록이 아닌 값 포함)을 만들어
+기존 문자열 포함 검사 버전과 calc_culture_fit(비트마스크), calc_culture_fit_batch(구직자 전체)의
+점수가 모든 쌍에서 같은지 확인한 뒤 처리량(pairs/s)을 비교합니다.
+
+실행: cd apps/api && python -m benchmarks.culture_fit [--seekers 100000] [--jobs 50]
+"""
+import argparse
+import random
+import time
+from typing import Optional
+
+import numpy as np
+
+from benchmarks import _env  # noqa: F401
+
+from app.services.matching_service import CULTURE_KEYWORDS, calc_culture_fit, calc_culture_fit_batch
+from app.services.seeker_store import SeekerStore
+
+
+# ---- 기존 문자열 포함 검사 (기준) ----
+
+def legacy_culture_fit(
+    comprehensive_profile: Optional[dict],
+    culture_tags: Optional[list],
+    team_profile: Optional[dict],
+) -> float:
+    if not comprehensive_profile:
+        return 50.0
+
+    score = 50.0
+
+    if culture_tags and isinstance(culture_tags, list):
+        mbti = comprehensive_profile.get("mbti", {})
+        disc = comprehensive_profile.get("disc", {})
+
+        culture_keywords = {
+            "자율출퇴근": ["P", "I"],
+            "수평문화": ["P", "S", "I"],
+            "성과중심": ["J", "D", "C"],
+            "데이터중심": ["T", "C"],
+            "팀워크중심": ["E", "S", "I"],
+            "혁신적": ["N", "D", "I"],
+            "안정적": ["S", "J", "S"],
+            "성장지향": ["N", "D"],
+        }
+
+        combined = mbti.get("type", "") + disc.get("type", "")
+
+        match_count = 0
+        total_tags = len(culture_tags)
+        for tag in culture_tags:
+            keywords = culture_keywords.get(tag, [])
+            if any(k in combined for k in keywords):
+                match_count += 1
+
+        if total_tags > 0:
+            score = 30 + (match_count / total_tags) * 70
+
+    if team_profile and team_profile.get("current_team_types"):
+        team_types = team_profile.get("current_team_types", {})
+        if team_types:
+            score = min(100, score + 5)
+
+    return score
+
+
+# ---- 합성 데이터 ----
+
+def make_profile(rng: random.Random) -> Optional[dict]:
+    if rng.random() < 0.1:
+        return None
+    mbti = "".join(rng.choice(pair) for pair in ("EI", "SN", "TF", "JP"))
+    if rng.random() < 0.05:
+        mbti = rng.choice(["", mbti.lower(), "XYZ"])
+    disc = "".join(rng.sample("DISC", rng.randint(0, 2)))
+    return {"mbti": {"type": mbti}, "disc": {"type": disc}}
+
+
+def make_tags(rng: random.Random):
+    roll = rng.random()
+    if roll < 0.05:
+        return None
+    if roll < 0.1:
+        return "수평문화"
+    known = list(CULTURE_KEYWORDS)
+    tags = [rng.choice(known) for _ in range(rng.randint(0, 5))]
+    if rng.random() < 0.2:
+        tags.append("워라밸")
+    return tags
+
+
+def main(n_seekers: int, n_jobs: int) -> None:
+    rng = random.Random(22)
+    profiles = [make_profile(rng) for _ in range(n_seekers)]
+    jobs = [
+        (make_tags(rng), rng.choice([None, {}, {"current_team_types": {"ENTJ": 2}}]))
+        for _ in range(n_jobs)
+    ]
+    store = SeekerStore.from_rows([
+        {"id": f"seeker-{i}", "comprehensive_profile": profile} for i, profile in enumerate(profiles)
+    ])
+
+    started = time.perf_counter()
+    expected = [[legacy_culture_fit(p, tags, team) for p in profiles] for tags, team in jobs]
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scalar = [[calc_culture_fit(p, tags, team) for p in profiles] for tags, team in jobs]
+    scalar_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = [calc_culture_fit_batch(store.culture_bits, tags, team) for tags, team in jobs]
+    batch_elapsed = time.perf_counter() - started
+
+    for j in range(n_jobs):
+        assert scalar[j] == expected[j], jobs[j]
+        assert np.array_equal(batch[j], np.asarray(expected[j], dtype=np.float64)), jobs[j]
+    pairs = n_seekers * n_jobs
+    print(f"{n_seekers} seekers x {n_jobs} jobs: identical culture scores")
+    for name, elapsed in (
+        ("legacy substring", legacy_elapsed),
+        ("bitmask, per pair", scalar_elapsed),
+        ("bitmask, batch", batch_elapsed),
+    ):
+        print(f"{name:<18} {pairs / elapsed:14,.0f} pairs/s ({legacy_elapsed / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seekers", type=int, default=100000)
+    parser.add_argument("--jobs", type=int, default=50)
+    args = parser.parse_args()
+    main(args.seekers, args.jobs)
@@ -0,0 +1,64 @@
+"""
+동기 Supabase 클라이언트 vs 비동기 풀링 클라이언트 동시성 벤치마크.
+
+로컬 PostgREST 대역(stand-in) 서버를 띄우고, async 핸들러 N개를 동시에 실행하여
+초당 처리 요청 수(requests/sec)를 비교합니다.
+
+실행: cd apps/api && python -m benchmarks.db_concurrency [--concurrency 50] [--requests 500] [--latency-ms 20]
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._stand_in import StandIn
+
+from postgrest import SyncPostgrestClient
+
+from app.services.supabase_client import create_supabase
+
+
+async def run(handler, concurrency: int, total: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await handler()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+async def main(concurrency: int, total: int, latency_ms: int) -> None:
+    with StandIn(lambda *args: [{"id": 1}], latency_ms) as stand_in:
+        await compare(stand_in.url, concurrency, total, latency_ms)
+
+
+async def compare(url: str, concurrency: int, total: int, latency_ms: int) -> None:
+    sync_client = SyncPostgrestClient(f"{url}/rest/v1")
+    async_client = create_supabase(url, "bench.bench.bench")
+
+    async def sync_handler():
+        # 기존 방식: async 핸들러 안에서 동기 클라이언트 호출 (이벤트 루프 블로킹)
+        sync_client.table("tests").select("*").eq("code", "mbti").execute()
+
+    async def async_handler():
+        await async_client.table("tests").select("*").eq("code", "mbti").execute()
+
+    print(f"concurrency={concurrency} requests={total} latency={latency_ms}ms")
+    for name, handler in [("sync client", sync_handler), ("async pooled client", async_handler)]:
+        rps = await run(handler, concurrency, total)
+        print(f"  {name:<22} {rps:8.1f} req/s")
+
+    sync_client.session.close()
+    await async_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency-ms", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.requests, args.latency_ms))
@@ -0,0 +1,78 @@
+"""
+검사 엔진 레지스트리 시작 시간 / 조회 비용 벤치마크.
+
+새 인터프리터에서 (매번 별도 프로세스로)
+- lazy:  app.tests_engine import만 (엔진 모듈은 첫 사용 시 import)
+- eager: 등록된 엔진 모듈을 모두 import (이전 __init__ 동작)
+의 import 시간을 재고, 엔진별 첫 get_test_engine(모듈 import + 생성) 시간과
+이후 조회(싱글턴) 대비 요청마다 새 인스턴스를 만드는 비용을 출력합니다.
+
+실행: cd apps/api && python -m benchmarks.engine_startup [--runs 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks import _env  # noqa: F401
+
+from app.tests_engine.base import ENGINE_MODULES, get_test_engine
+
+_IMPORT_SNIPPET = """
+import importlib, json, sys, time
+from benchmarks import _env
+import app.services.test_catalog, numpy  # 공통 의존성은 측정에서 제외
+started = time.perf_counter()
+import app.tests_engine
+if sys.argv[1] == "eager":
+    for module in app.tests_engine.base.ENGINE_MODULES.values():
+        importlib.import_module(module)
+print(json.dumps((time.perf_counter() - started) * 1000))
+"""
+
+
+def import_ms(mode: str, runs: int) -> float:
+    samples = [
+        json.loads(subprocess.run(
+            [sys.executable, "-c", _IMPORT_SNIPPET, mode],
+            capture_output=True, text=True, check=True,
+        ).stdout)
+        for _ in range(runs)
+    ]
+    return statistics.median(samples)
+
+
+def main(runs: int) -> None:
+    for mode in ("lazy", "eager"):
+        print(f"import app.tests_engine ({mode:<5}) {import_ms(mode, runs):7.2f} ms (median of {runs})")
+
+    for code in ENGINE_MODULES:
+        started = time.perf_counter()
+        engine = get_test_engine(code)
+        first_ms = (time.perf_counter() - started) * 1000
+
+        n = 100_000
+        started = time.perf_counter()
+        for _ in range(n):
+            get_test_engine(code)
+        lookup_ns = (time.perf_counter() - started) / n * 1e9
+
+        engine_class = type(engine)
+        started = time.perf_counter()
+        for _ in range(n):
+            engine_class()
+        construct_ns = (time.perf_counter() - started) / n * 1e9
+
+        print(
+            f"{code:<10} first use {first_ms:6.2f} ms, "
+            f"singleton lookup {lookup_ns:5.0f} ns, new instance {construct_ns:5.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.runs)
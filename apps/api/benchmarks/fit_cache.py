@@ -0,0 +1,97 @@
+"""
+공고별 후보자 점수 캐시 검증 및 벤치마크.
+
+합성 구직자 N명의 SeekerStore로 rank_candidates를 캐시 없이(매번 전체 계산) / 캐시 적중 /
+구직자 일부 변경 후(바뀐 행만 다시 계산) 나눠 측정합니다.
+구직자 추가·수정·삭제와 공고 입력 수정을 섞은 뒤, 백그라운드 재계산을 기다린 경우와
+읽는 시점에 반영하는 경우 모두 캐시 점수가 score_job_candidates(전체 재계산)와 같은지 확인합니다.
+
+실행: cd apps/api && python -m benchmarks.fit_cache [--seekers 100000] [--jobs 20]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._data import make_jobs, make_seekers
+
+from app.services import fit_cache
+from app.services.fit_cache import get_candidate_scores, refresh_job_scores, schedule_fit_refresh
+from app.services.ranking_service import score_job_candidates, top_k
+from app.services.seeker_store import SeekerStore
+
+
+def assert_same(store: SeekerStore, jobs: list[dict]) -> None:
+    for job in jobs:
+        cached = get_candidate_scores(store, job)
+        expected = score_job_candidates(store, job)
+        for field, values in expected.items():
+            assert np.array_equal(cached[field], values), (job["id"], field)
+
+
+def churn(store: SeekerStore, seekers: list[dict], jobs: list[dict], rng: random.Random) -> None:
+    """구직자 추가·수정·삭제, 공고 요구 능력치 수정"""
+    extra = make_seekers(200, seed=rng.randint(0, 10**6))
+    for i, seeker in enumerate(extra):
+        if i % 3 == 0:
+            store.upsert({**seeker, "id": f"new-{rng.random()}"})
+        elif i % 3 == 1:
+            store.upsert({**seeker, "id": rng.choice(seekers)["id"]})
+        else:
+            store.remove(str(store.ids[rng.randrange(len(store))]))
+    for job in jobs[::4]:
+        job["required_abilities"] = make_jobs(1, seed=rng.randint(0, 10**6))[0]["required_abilities"]
+        refresh_job_scores(job)
+
+
+def timed_ranking(store: SeekerStore, jobs: list[dict], scores_for) -> list[float]:
+    timings = []
+    for job in jobs:
+        started = time.perf_counter()
+        scores = scores_for(store, job)
+        top_k(scores["total"], store.ids, 21)
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)
+
+
+def report(name: str, timings: list[float]) -> None:
+    print(f"{name:<28} median {timings[len(timings) // 2] * 1000:6.2f} ms, max {timings[-1] * 1000:6.2f} ms")
+
+
+async def main(n_seekers: int, n_jobs: int) -> None:
+    rng = random.Random(25)
+    seekers = make_seekers(n_seekers)
+    jobs = make_jobs(n_jobs)
+    store = SeekerStore.from_rows(seekers)
+    fit_cache._cache.max_jobs = n_jobs
+
+    report("no cache (full compute)", timed_ranking(store, jobs, score_job_candidates))
+    report("cache miss", timed_ranking(store, jobs, get_candidate_scores))
+    report("cache hit", timed_ranking(store, jobs, get_candidate_scores))
+
+    for seeker in rng.sample(seekers, 100):
+        store.upsert({**seeker, "experience_years": rng.randint(0, 20)})
+    report("hit after 100 seeker edits", timed_ranking(store, jobs, get_candidate_scores))
+
+    # 백그라운드 재계산 후
+    churn(store, seekers, jobs, rng)
+    schedule_fit_refresh()
+    await fit_cache._refresh_task
+    report("hit after background refresh", timed_ranking(store, jobs, get_candidate_scores))
+    assert_same(store, jobs)
+
+    # 재계산 전에 읽는 경우 (읽는 시점에 반영)
+    churn(store, seekers, jobs, rng)
+    assert_same(store, jobs)
+    print(f"{len(store)} seekers x {n_jobs} jobs: cached scores identical to full recompute")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seekers", type=int, default=100_000)
+    parser.add_argument("--jobs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.seekers, args.jobs))
@@ -0,0 +1,113 @@
+"""
+calculate_fit_scores(열 단위 배치) 검증 및 벤치마크.
+
+합성 구직자/공고(별칭·모르는 능력치 키, 숫자만 있는 요구치, 기업 문화 태그, 팀 프로필,
+빈 조건 등 포함)로 공고 하나 × 구직자 N명, 구직자 한 명 × 공고 N개 두 방향 모두
+ability/culture/condition/total이 모든 쌍에서 calculate_fit_score와 같은지 확인한 뒤
+처리량(pairs/s)을 비교합니다.
+
+실행: cd apps/api && python -m benchmarks.fit_scores [--seekers 20000] [--jobs 20000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._data import CULTURE_TAGS, make_jobs, make_seekers
+
+from app.services.matching_service import (
+    JobColumns,
+    SeekerColumns,
+    calculate_fit_score,
+    calculate_fit_scores,
+)
+
+_FIELDS = ("ability", "culture", "condition", "total")
+
+
+def edge_cases(seekers: list[dict], jobs: list[dict], rng: random.Random) -> tuple[list, list]:
+    """공고/기업/팀 프로필 입력에 경계 사례를 섞음 (구직자는 빈 스냅샷·빈 경력 추가)"""
+    for seeker in seekers[::17]:
+        seeker["abilities_snapshot"] = []
+    for seeker in seekers[::23]:
+        seeker["experience_years"] = None
+
+    edge_jobs = [
+        {"required_abilities": {"analysis": {"min": 70}, "analytical": 65, "unknown_key": 50}},
+        {"required_abilities": {"leadership": 85.5}, "conditions": {}},
+        {"required_abilities": None, "conditions": None, "preferred_culture": ["워라밸", "혁신적", "혁신적"]},
+        {"required_abilities": {"focus": {}}, "conditions": {"experience_min": 2.5, "experience_max": 3}},
+        {"conditions": {"remote": "", "location": "서울"}, "preferred_culture": "수평문화"},
+    ]
+    # 7개 간격으로 배치하되 공고가 적으면 간격을 줄이고 들어가는 만큼만 사용
+    step = max(1, min(7, len(jobs) // len(edge_jobs)))
+    for i, job in enumerate(edge_jobs[:len(jobs)]):
+        jobs[i * step] = {**jobs[i * step], **job}
+
+    companies = [
+        {"culture_tags": rng.sample(CULTURE_TAGS, rng.randint(0, 3))} if rng.random() < 0.3 else None
+        for _ in jobs
+    ]
+    teams = [
+        rng.choice([None, {}, {"current_team_types": {}}, {"current_team_types": {"ENTJ": 2}}])
+        for _ in jobs
+    ]
+    return companies, teams
+
+
+def check(batch: dict, expected: list[dict], label: str) -> None:
+    for field in _FIELDS:
+        values = batch[field].tolist()
+        for i, scores in enumerate(expected):
+            assert values[i] == scores[field], (label, i, field, values[i], scores)
+
+
+def timed(run) -> tuple[object, float]:
+    started = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - started
+
+
+def main(n_seekers: int, n_jobs: int) -> None:
+    rng = random.Random(23)
+    seekers = make_seekers(n_seekers)
+    jobs = make_jobs(n_jobs)
+    companies, teams = edge_cases(seekers, jobs, rng)
+
+    # 공고 하나 × 구직자 N명
+    job_columns = [
+        JobColumns.from_postings([job], [company], [team])
+        for job, company, team in zip(jobs, companies, teams)
+    ]
+    seeker_columns = SeekerColumns.from_profiles(seekers)
+    for j in range(0, n_jobs, max(1, n_jobs // 5)):
+        expected, scalar_elapsed = timed(
+            lambda: [calculate_fit_score(s, jobs[j], companies[j], teams[j]) for s in seekers]
+        )
+        batch, batch_elapsed = timed(lambda: calculate_fit_scores(seeker_columns, job_columns[j]))
+        check(batch, expected, f"job {j}")
+    print(f"1 job x {n_seekers} seekers: identical scores")
+    print(f"  scalar {n_seekers / scalar_elapsed:12,.0f} pairs/s")
+    print(f"  batch  {n_seekers / batch_elapsed:12,.0f} pairs/s ({scalar_elapsed / batch_elapsed:.0f}x)")
+
+    # 구직자 한 명 × 공고 N개
+    all_jobs = JobColumns.from_postings(jobs, companies, teams)
+    for i in range(0, n_seekers, max(1, n_seekers // 5)):
+        expected, scalar_elapsed = timed(lambda: [
+            calculate_fit_score(seekers[i], job, company, team)
+            for job, company, team in zip(jobs, companies, teams)
+        ])
+        one_seeker = SeekerColumns.from_profiles([seekers[i]])
+        batch, batch_elapsed = timed(lambda: calculate_fit_scores(one_seeker, all_jobs))
+        check(batch, expected, f"seeker {i}")
+    print(f"1 seeker x {n_jobs} jobs: identical scores")
+    print(f"  scalar {n_jobs / scalar_elapsed:12,.0f} pairs/s")
+    print(f"  batch  {n_jobs / batch_elapsed:12,.0f} pairs/s ({scalar_elapsed / batch_elapsed:.0f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seekers", type=int, default=20000)
+    parser.add_argument("--jobs", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.seekers, args.jobs)
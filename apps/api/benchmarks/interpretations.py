@@ -0,0 +1,61 @@
+"""
+검사 결과 해석 페이로드 직렬화 벤치마크.
+
+엔진별로 무작위 원점수에 대해
+- dict:     interpret_result 딕셔너리를 만들어 FastAPI처럼 jsonable_encoder + json.dumps
+- template: interpret_result_json (정적 부분은 미리 직렬화된 바이트, 점수만 직렬화)
+의 결과 바이트가 같은지 확인하고 호출당 시간을 비교합니다.
+
+실행: cd apps/api && python -m benchmarks.interpretations [--calls 20000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import _env  # noqa: F401
+
+from fastapi.encoders import jsonable_encoder
+
+from app.tests_engine import get_test_engine
+from app.tests_engine.interpretation import dumps
+
+
+def sample_results(engine, rng: random.Random, n: int) -> list[tuple[dict, str]]:
+    results = []
+    while len(results) < n:
+        scores = {k: rng.randint(1, 40) for k in engine.indicators}
+        results.append(engine.build_result(scores))
+    return results
+
+
+def main(calls: int) -> None:
+    rng = random.Random(3)
+    for code in ("mbti", "disc", "enneagram"):
+        engine = get_test_engine(code)
+        results = sample_results(engine, rng, 500)
+
+        for raw_scores, result_type in results:
+            expected = dumps(jsonable_encoder(engine.interpret_result(raw_scores, result_type)))
+            assert engine.interpret_result_json(raw_scores, result_type) == expected, (code, result_type)
+
+        timings = {}
+        for name, render in (
+            ("dict", lambda r, t: dumps(jsonable_encoder(engine.interpret_result(r, t)))),
+            ("template", engine.interpret_result_json),
+        ):
+            started = time.perf_counter()
+            for i in range(calls):
+                render(*results[i % len(results)])
+            timings[name] = (time.perf_counter() - started) / calls * 1e6
+
+        print(
+            f"{code:<10} identical bytes; dict+encode {timings['dict']:6.1f} us, "
+            f"template {timings['template']:5.1f} us ({timings['dict'] / timings['template']:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.calls)
@@ -0,0 +1,101 @@
+"""
+구직자별 추천 공고 순위 벤치마크.
+
+합성 활성 공고 N개로 JobStore를 만들고 rank_jobs(구직자 한 명 × 공고 전체)의 지연 시간(p50/p95)을 측정합니다.
+측정 전에 다음을 확인합니다.
+- 몇몇 구직자의 상위 페이지가 calculate_fit_score(스칼라)로 전체를 정렬한 결과와 같은지
+- 공고 생성/수정/마감(추가 행렬, 기준 행렬 재구성 포함) 뒤의 순위가 새로 만든 스토어와 같은지
+(응답에는 이 밖에 페이지 공고 조회 DB 왕복 1회가 더해짐)
+
+실행: cd apps/api && python -m benchmarks.job_recommendations [--jobs 50000] [--seekers 200]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._data import make_jobs, make_seekers
+
+from app.services.job_store import JobStore
+from app.services.matching_service import SeekerColumns, calculate_fit_score
+from app.services.ranking_service import rank_jobs
+
+
+def brute_force(seeker: dict, jobs: list[dict], limit: int) -> list[tuple[str, dict]]:
+    scored = [(job["id"], calculate_fit_score(seeker, job, None, None)) for job in jobs]
+    scored.sort(key=lambda item: (-item[1]["total"], item[0]))
+    return scored[:limit]
+
+
+def check_overlay(store: JobStore, jobs: list[dict], seekers: list[dict], rng: random.Random) -> None:
+    """생성·수정·마감을 섞어 반영한 스토어와 같은 공고로 새로 만든 스토어의 순위 비교"""
+    active = {job["id"]: job for job in jobs}
+    new_jobs = make_jobs(700, seed=99)
+    for step in range(700):
+        roll = rng.random()
+        if roll < 0.4:
+            job = {**new_jobs[step], "id": f"{step:08d}-2222-2222-2222-222222222222", "status": "active"}
+            active[job["id"]] = job
+            store.upsert(job)
+        elif roll < 0.8:
+            job_id = rng.choice(list(active))
+            job = {**active[job_id], "required_abilities": new_jobs[step]["required_abilities"]}
+            active[job_id] = job
+            store.upsert(job)
+        else:
+            job_id = rng.choice(list(active))
+            del active[job_id]
+            store.remove(job_id)
+
+    fresh = JobStore(list(active.values()))
+    assert len(store) == len(fresh)
+    for seeker in seekers[:5]:
+        columns = SeekerColumns.from_profiles([seeker])
+        assert rank_jobs(store, columns, 100) == rank_jobs(fresh, columns, 100)
+
+
+def main(n_jobs: int, n_seekers: int) -> None:
+    rng = random.Random(24)
+    jobs = make_jobs(n_jobs)
+    seekers = make_seekers(n_seekers)
+
+    started = time.perf_counter()
+    store = JobStore(jobs)
+    print(f"store build: {n_jobs} jobs in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    # 스칼라 함수로 전체를 정렬한 결과와 비교 (커서로 이어 받은 페이지 포함)
+    for seeker in seekers[:3]:
+        columns = SeekerColumns.from_profiles([seeker])
+        expected = brute_force(seeker, jobs, 60)
+        paged, after = [], None
+        for _ in range(3):
+            page = rank_jobs(store, columns, 20, after)
+            paged += page
+            after = (page[-1][1]["total"], page[-1][0])
+        assert paged == expected
+    print("top pages: identical to scalar calculate_fit_score ranking")
+
+    check_overlay(store, jobs, seekers, rng)
+    print("after create/update/close: identical to a freshly built store")
+
+    timings = []
+    for seeker in seekers:
+        columns = SeekerColumns.from_profiles([seeker])
+        started = time.perf_counter()
+        rank_jobs(store, columns, 21)
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    print(
+        f"rank_jobs ({len(store)} jobs): p50 {timings[len(timings) // 2] * 1000:.1f} ms, "
+        f"p95 {timings[int(len(timings) * 0.95)] * 1000:.1f} ms, max {timings[-1] * 1000:.1f} ms "
+        f"({n_seekers} seekers)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--seekers", type=int, default=200)
+    args = parser.parse_args()
+    main(args.jobs, args.seekers)
@@ -0,0 +1,87 @@
+"""
+동시 로그인 처리량 벤치마크 (비밀번호 해싱 스레드 풀 크기 산정용).
+
+PostgREST 대역 서버로 authenticate_user를 동시에 N건 실행하고
+초당 로그인 수와 이벤트 루프 최대 지연(다른 요청이 멈추는 시간)을 출력합니다.
+"inline"은 bcrypt를 이벤트 루프에서 직접 실행한 기준선입니다.
+
+실행: cd apps/api && python -m benchmarks.login_throughput [--logins 32] [--workers 1,2,4,8]
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._stand_in import StandIn
+
+from app.services import auth_service, supabase_client
+
+PASSWORD = "correct horse battery staple"
+USER = {
+    "id": "00000000-0000-0000-0000-000000000000",
+    "email": "bench@example.com",
+    "password_hash": auth_service.pwd_context.hash(PASSWORD),
+}
+
+
+def route(method: str, table: str, query: dict, body):
+    return USER
+
+
+async def _inline_verify(plain_password: str, hashed_password: str) -> bool:
+    return auth_service.pwd_context.verify(plain_password, hashed_password)
+
+
+async def _measure(logins: int) -> tuple[float, float]:
+    """(초당 로그인 수, 이벤트 루프 최대 지연 ms)"""
+    max_lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal max_lag
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(auth_service.authenticate_user(USER["email"], PASSWORD) for _ in range(logins))
+    )
+    elapsed = time.perf_counter() - started
+
+    done = True
+    await tick
+    assert all(results)
+    return logins / elapsed, max_lag * 1000
+
+
+async def main(logins: int, workers: list[int]) -> None:
+    with StandIn(route) as stand_in:
+        supabase_client.supabase = supabase_client.create_supabase(stand_in.url, "bench.bench.bench")
+        pooled_verify = auth_service.verify_password
+
+        auth_service.verify_password = _inline_verify
+        rate, lag = await _measure(logins)
+        print(f"inline      {rate:6.1f} logins/s, max event loop stall {lag:7.1f} ms")
+
+        auth_service.verify_password = pooled_verify
+        for n in workers:
+            auth_service._password_executor = ThreadPoolExecutor(max_workers=n)
+            rate, lag = await _measure(logins)
+            print(f"{n:2d} workers  {rate:6.1f} logins/s, max event loop stall {lag:7.1f} ms")
+            auth_service._password_executor.shutdown()
+
+        await supabase_client.close_supabase()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", default="1,2,4,8")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, [int(n) for n in args.workers.split(",")]))
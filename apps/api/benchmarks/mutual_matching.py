@@ -0,0 +1,305 @@
+"""
+양방향 관심 → 매칭 성사 동시성 벤치마크.
+
+구직자/기업 쌍마다 서로에게 보내는 관심 두 건을 동시에 요청해
+기존 흐름(중복 확인 → 저장 → 역방향 조회 → 매칭 생성 → 상태 갱신을 각각 요청)과
+create_interest RPC 흐름의 요청당 DB 왕복 수를 비교합니다.
+
+대역(stand-in)의 테이블은 제약이 없는 단순 목록이고, create_interest는 012_atomic_matching.sql의
+함수를 파이썬 잠금 하나로 흉내낸 것입니다. 따라서 RPC 흐름의 쌍별 매칭 수는 동시성 검증이 아니며
+(기존 흐름의 중복만 보여줌), 실제 함수의 동시성은 mutual_matching_postgres로 실제 DB에서 확인합니다.
+(대역은 .single()의 단일 객체 응답을 흉내내지 않으므로 기존 흐름은 .single() 대신 첫 행을 사용 — 왕복 수는 같음)
+
+실행: cd apps/api && python -m benchmarks.mutual_matching [--pairs 50] [--latency-ms 5]
+"""
+import argparse
+import asyncio
+import threading
+import time
+import uuid
+from collections import Counter
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._stand_in import StandIn
+
+from app.routers.matching import InterestCreate, _create_interest
+from app.services import supabase_client
+from app.services.fit_inputs import get_company_fit_input, get_job_fit_input
+from app.services.matching_service import calculate_fit_score
+from app.services.seeker_store import ability_row, get_seeker_store
+
+_CONTROL_PARAMS = {"select", "limit", "offset", "order", "on_conflict", "columns"}
+
+
+class Tables:
+    """PostgREST 대역용 메모리 테이블 (eq/in/is 필터, 제약 없음)"""
+
+    def __init__(self, seekers: list[dict], companies: list[dict], jobs: list[dict]):
+        self.rows = {
+            "seeker_profiles": seekers,
+            "companies": companies,
+            "job_postings": jobs,
+            "interests": [],
+            "matches": [],
+        }
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _matches(row: dict, query: dict) -> bool:
+        for column, (condition,) in query.items():
+            if column in _CONTROL_PARAMS:
+                continue
+            op, _, value = condition.partition(".")
+            cell = row.get(column)
+            text = str(cell)
+            if isinstance(cell, bool):
+                text, value = text.lower(), value.lower()
+            if op == "eq" and text != value:
+                return False
+            if op == "neq" and text == value:
+                return False
+            if op == "is" and cell is not None:
+                return False
+            if op == "in" and text not in value.strip("()").split(","):
+                return False
+        return True
+
+    def route(self, method: str, table: str, query: dict, body):
+        if table == "create_interest":
+            return self.create_interest(body)
+
+        with self.lock:
+            rows = self.rows.get(table, [])
+            if method == "GET":
+                found = [row for row in rows if self._matches(row, query)]
+                offset = int(query.get("offset", ["0"])[0])
+                limit = int(query.get("limit", [str(len(found))])[0])
+                return found[offset:offset + limit]
+            if method == "POST":
+                inserted = []
+                for row in body if isinstance(body, list) else [body]:
+                    row = {"id": str(uuid.uuid4()), "status": "pending" if table == "interests" else "active", **row}
+                    rows.append(row)
+                    inserted.append(row)
+                return inserted
+            if method == "PATCH":
+                updated = [row for row in rows if self._matches(row, query)]
+                for row in updated:
+                    row.update(body)
+                return updated
+        return []
+
+    def create_interest(self, params: dict) -> dict:
+        """012_atomic_matching.sql의 create_interest와 같은 동작 (요청 하나를 원자적으로 처리)"""
+        with self.lock:
+            interests, matches = self.rows["interests"], self.rows["matches"]
+            if any(
+                i["from_type"] == params["p_from_type"] and i["from_id"] == params["p_from_id"]
+                and i["to_id"] == params["p_to_id"]
+                for i in interests
+            ):
+                return {"duplicate": True}
+
+            interest = {
+                "id": str(uuid.uuid4()),
+                "from_type": params["p_from_type"],
+                "from_id": params["p_from_id"],
+                "to_type": params["p_to_type"],
+                "to_id": params["p_to_id"],
+                "job_posting_id": params["p_job_posting_id"],
+                "message": params["p_message"],
+                "status": "pending",
+            }
+            interests.append(interest)
+            inserted = dict(interest)  # RETURNING 시점의 행 (status pending)
+
+            reverse = next((
+                i for i in interests
+                if i["from_type"] == params["p_to_type"] and i["from_id"] == params["p_to_id"]
+                and i["to_id"] == params["p_from_id"] and i["status"] == "pending"
+            ), None)
+            match = None
+            if reverse is not None:
+                seeker_id, company_id = (
+                    (params["p_from_id"], params["p_to_id"]) if params["p_from_type"] == "seeker"
+                    else (params["p_to_id"], params["p_from_id"])
+                )
+                key = (seeker_id, company_id, params["p_job_posting_id"])
+                match = next((
+                    m for m in matches
+                    if (m["seeker_profile_id"], m["company_id"], m["job_posting_id"]) == key
+                ), None)
+                if match is None:
+                    match = {
+                        "id": str(uuid.uuid4()),
+                        "seeker_profile_id": seeker_id,
+                        "company_id": company_id,
+                        "job_posting_id": params["p_job_posting_id"],
+                        "fit_score": params["p_fit_score"],
+                        "status": "active",
+                    }
+                    matches.append(match)
+                reverse["status"] = interest["status"] = "accepted"
+            return {"duplicate": False, "interest": inserted, "match": match}
+
+
+# ---- 기존 흐름 (기준) ----
+
+async def legacy_create_interest(from_type: str, from_id: str, data: InterestCreate) -> dict:
+    supabase = supabase_client.get_supabase()
+    to_type = "company" if from_type == "seeker" else "seeker"
+
+    existing = (
+        await supabase.table("interests").select("id")
+        .eq("from_type", from_type).eq("from_id", from_id).eq("to_id", data.to_id)
+        .execute()
+    )
+    if existing.data:
+        return {"interest": None, "match": None}
+
+    result = await supabase.table("interests").insert({
+        "from_type": from_type,
+        "from_id": from_id,
+        "to_type": to_type,
+        "to_id": data.to_id,
+        "job_posting_id": data.job_posting_id,
+        "message": data.message,
+    }).execute()
+
+    reverse = (
+        await supabase.table("interests").select("id")
+        .eq("from_type", to_type).eq("from_id", data.to_id).eq("to_id", from_id).eq("status", "pending")
+        .execute()
+    )
+
+    match_created = None
+    if reverse.data:
+        seeker_id, company_id = (from_id, data.to_id) if from_type == "seeker" else (data.to_id, from_id)
+        match_created = await legacy_create_match(seeker_id, company_id, data.job_posting_id)
+        await supabase.table("interests").update({"status": "accepted"}).eq("id", reverse.data[0]["id"]).execute()
+        await supabase.table("interests").update({"status": "accepted"}).eq("id", result.data[0]["id"]).execute()
+
+    return {"interest": result.data[0], "match": match_created}
+
+
+async def legacy_create_match(seeker_profile_id: str, company_id: str, job_posting_id: str) -> dict:
+    supabase = supabase_client.get_supabase()
+    seeker = await supabase.table("seeker_profiles").select("*").eq("id", seeker_profile_id).execute()
+    company = await supabase.table("companies").select("*").eq("id", company_id).execute()
+    job = await supabase.table("job_postings").select("*").eq("id", job_posting_id).execute()
+
+    fit_score = calculate_fit_score(
+        seeker.data[0], job.data[0], company.data[0], None, abilities=ability_row(seeker_profile_id)
+    )
+    result = await supabase.table("matches").insert({
+        "seeker_profile_id": seeker_profile_id,
+        "company_id": company_id,
+        "job_posting_id": job_posting_id,
+        "fit_score": fit_score,
+    }).execute()
+    return result.data[0]
+
+
+# ---- 실행 ----
+
+def make_data(n_pairs: int) -> tuple[list[dict], list[dict], list[dict]]:
+    seekers, companies, jobs = [], [], []
+    for i in range(n_pairs):
+        seekers.append({
+            "id": str(uuid.UUID(int=i + 1)),
+            "is_active": True,
+            "visibility": "public",
+            "abilities_snapshot": [{"key": "leadership", "score": 40 + i % 50}, {"key": "analysis", "score": 70}],
+            "comprehensive_profile": {"mbti": {"type": "ENTJ"}, "disc": {"type": "DI"}},
+            "remote_pref": "hybrid",
+            "experience_years": i % 10,
+            "location_pref": "서울",
+        })
+        companies.append({"id": str(uuid.UUID(int=10**6 + i)), "culture_tags": ["수평문화", "성과중심"]})
+        jobs.append({
+            "id": str(uuid.UUID(int=2 * 10**6 + i)),
+            "company_id": companies[-1]["id"],
+            "required_abilities": {"leadership": {"min": 60}, "analysis": 65},
+            "preferred_culture": ["혁신적"],
+            "conditions": {"remote": "remote", "experience_min": 3, "location": "서울"},
+        })
+    return seekers, companies, jobs
+
+
+async def run(flow, n_pairs: int, stand_in: StandIn) -> float:
+    supabase_client.supabase = supabase_client.create_supabase(stand_in.url, "bench.bench.bench")
+    seekers, companies, jobs = make_data(n_pairs)
+
+    calls = []
+    for seeker, company, job in zip(seekers, companies, jobs):
+        calls.append(flow("seeker", seeker["id"], InterestCreate(
+            to_type="company", to_id=company["id"], job_posting_id=job["id"]
+        )))
+        calls.append(flow("company", company["id"], InterestCreate(
+            to_type="seeker", to_id=seeker["id"], job_posting_id=job["id"]
+        )))
+
+    started = time.perf_counter()
+    await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - started
+    await supabase_client.close_supabase()
+    return elapsed
+
+
+def report(name: str, tables: Tables, stand_in: StandIn, n_pairs: int, elapsed: float) -> None:
+    per_pair = Counter((m["seeker_profile_id"], m["company_id"]) for m in tables.rows["matches"])
+    duplicated = sum(1 for count in per_pair.values() if count > 1)
+    missed = n_pairs - len(per_pair)
+    trips = Counter(table for _, table in stand_in.requests)
+    if "create_interest" in trips:
+        # 대역의 create_interest는 파이썬 잠금으로 직렬화되므로 매칭 수는 검증 결과가 아님
+        matches = "matches not checked (stand-in RPC; see benchmarks.mutual_matching_postgres)"
+    else:
+        matches = (
+            f"{len(tables.rows['matches'])} matches for {n_pairs} pairs "
+            f"({duplicated} pairs duplicated, {missed} pairs missed)"
+        )
+    print(
+        f"{name:<8} {len(stand_in.requests) / (2 * n_pairs):4.1f} round trips/request, "
+        f"{2 * n_pairs / elapsed:6.0f} requests/s | {matches}"
+    )
+    print(f"         {dict(trips)}")
+
+
+async def warm_up(stand_in: StandIn, n_pairs: int, fit_inputs: bool) -> None:
+    """구직자 스토어 적재 (+ 기업/공고 매칭 점수 입력 캐시 채우기)"""
+    supabase_client.supabase = supabase_client.create_supabase(stand_in.url, "bench.bench.bench")
+    await get_seeker_store()
+    if fit_inputs:
+        _, companies, jobs = make_data(n_pairs)
+        for company, job in zip(companies, jobs):
+            await get_company_fit_input(company["id"])
+            await get_job_fit_input(job["id"])
+    await supabase_client.close_supabase()
+
+
+def main(n_pairs: int, latency_ms: float) -> None:
+    async def rpc_create_interest(from_type: str, from_id: str, data: InterestCreate) -> dict:
+        return await _create_interest(from_type, from_id, data.to_type, data)
+
+    for name, flow, warm in (
+        ("legacy", legacy_create_interest, None),
+        ("rpc", rpc_create_interest, False),
+        ("rpc+warm", rpc_create_interest, True),
+    ):
+        tables = Tables(*make_data(n_pairs))
+        with StandIn(tables.route, latency_ms=latency_ms) as stand_in:
+            if warm is not None:
+                # 구직자 스토어는 후보자 순위 등에서 이미 적재된 상태 (rpc+warm은 기업/공고 캐시도 채워진 상태)
+                asyncio.run(warm_up(stand_in, n_pairs, fit_inputs=warm))
+                stand_in.requests.clear()
+            elapsed = asyncio.run(run(flow, n_pairs, stand_in))
+            report(name, tables, stand_in, n_pairs, elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5)
+    args = parser.parse_args()
+    main(args.pairs, args.latency_ms)
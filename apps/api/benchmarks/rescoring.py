@@ -0,0 +1,147 @@
+"""
+검사 결과 일괄 재채점 처리량 벤치마크.
+
+PostgREST 대역 서버에 완료된 MBTI 세션 N개(응답 48개씩)를 두고
+- per-session: 세션마다 engine.calculate_result(문항 조인 조회) + test_results 수정
+- batch: rescoring_service.rescore_test (청크 조회 → score_batch → bulk upsert)
+를 실행해 초당 세션 수와 DB 왕복 횟수를 비교하고, 두 방식의 결과가 같은지 확인합니다.
+
+실행: cd apps/api && python -m benchmarks.rescoring [--sessions 2000] [--chunk-size 200] [--latency-ms 2]
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from benchmarks import _env  # noqa: F401
+from benchmarks._stand_in import StandIn
+
+from app.services import supabase_client, test_catalog
+from app.services.rescoring_service import rescore_test
+from app.tests_engine import MBTIEngine
+
+N_QUESTIONS = 48
+TEST = {"id": 1, "code": "mbti", "name": "MBTI", "is_active": True}
+
+
+def make_data(n_sessions: int):
+    rng = random.Random(13)
+    questions = [
+        {
+            "id": i + 1,
+            "test_id": TEST["id"],
+            "question_number": i + 1,
+            "scoring_weights": {k: rng.choice([1, -1]) for k in rng.sample("EISNTFJP", 2)},
+        }
+        for i in range(N_QUESTIONS)
+    ]
+    sessions = sorted(str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(n_sessions))
+    responses = [
+        {"id": n + 1, "session_id": s, "question_id": q["id"], "answer": rng.randint(1, 5)}
+        for n, (s, q) in enumerate((s, q) for s in sessions for q in questions)
+    ]
+    results = {s: {"id": f"r-{s}", "session_id": s, "raw_scores": {}, "result_type": None} for s in sessions}
+    return questions, sessions, responses, results
+
+
+def make_route(questions, sessions, responses, results):
+    questions_by_id = {q["id"]: q for q in questions}
+    responses_by_session: dict[str, list[dict]] = {}
+    for response in responses:
+        responses_by_session.setdefault(response["session_id"], []).append(response)
+
+    def page(rows: list, query: dict) -> list:
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(len(rows))])[0])
+        return rows[offset:offset + limit]
+
+    def session_filter(query: dict) -> list[str]:
+        value = query["session_id"][0]
+        if value.startswith("in.("):
+            return [s.strip('"') for s in value[4:-1].split(",")]
+        return [value[3:]]
+
+    def route(method: str, table: str, query: dict, body):
+        if table == "tests":
+            return page([TEST], query)
+        if table == "questions":
+            return page(questions, query)
+        if table == "test_sessions":
+            after = query["id"][0][3:] if "id" in query else ""
+            return page([{"id": s} for s in sessions if s > after], query)
+        if table == "responses":
+            rows = [r for s in session_filter(query) for r in responses_by_session.get(s, [])]
+            if "questions" in query.get("select", [""])[0]:
+                rows = [{**r, "questions": questions_by_id[r["question_id"]]} for r in rows]
+            return page(rows, query)
+        if table == "test_results":
+            if method == "GET":
+                return page([results[s] for s in session_filter(query) if s in results], query)
+            for row in body if isinstance(body, list) else [body]:
+                target = row.get("id") or f"r-{query['session_id'][0][3:]}"
+                results[target[2:]].update({k: v for k, v in row.items() if k != "id"})
+            return body if isinstance(body, list) else [body]
+        return []
+
+    return route
+
+
+async def per_session(sessions: list[str]) -> dict:
+    engine = MBTIEngine()
+    supabase = supabase_client.get_supabase()
+    scored = {}
+    for session_id in sessions:
+        raw_scores, result_type = await engine.calculate_result(session_id)
+        await supabase.table("test_results").update(
+            {"raw_scores": raw_scores, "result_type": result_type}
+        ).eq("session_id", session_id).execute()
+        scored[session_id] = (raw_scores, result_type)
+    return scored
+
+
+async def main(n_sessions: int, chunk_size: int, latency_ms: float) -> None:
+    questions, sessions, responses, results = make_data(n_sessions)
+
+    with StandIn(make_route(questions, sessions, responses, results), latency_ms) as stand_in:
+        supabase_client.supabase = supabase_client.create_supabase(stand_in.url, "bench.bench.bench")
+        await test_catalog.get_catalog()
+
+        stand_in.requests.clear()
+        started = time.perf_counter()
+        expected = await per_session(sessions)
+        elapsed = time.perf_counter() - started
+        print(
+            f"per-session {n_sessions / elapsed:8.0f} sessions/s, "
+            f"{len(stand_in.requests) / n_sessions:5.2f} round trips/session"
+        )
+
+        for row in results.values():
+            row.update({"raw_scores": {}, "result_type": None})
+
+        stand_in.requests.clear()
+        started = time.perf_counter()
+        async for _, stats in rescore_test("mbti", chunk_size=chunk_size):
+            pass
+        elapsed = time.perf_counter() - started
+        print(
+            f"batch       {n_sessions / elapsed:8.0f} sessions/s, "
+            f"{len(stand_in.requests) / n_sessions:5.2f} round trips/session "
+            f"(chunk {chunk_size}, {stats.updated} updated)"
+        )
+
+        for session_id, (raw_scores, result_type) in expected.items():
+            assert results[session_id]["raw_scores"] == raw_scores, session_id
+            assert results[session_id]["result_type"] == result_type, session_id
+        print(f"identical results for {n_sessions} sessions")
+
+        await supabase_client.close_supabase()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.chunk_size, args.latency_ms))
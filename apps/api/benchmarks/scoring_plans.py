@@ -0,0 +1,166 @@
+"""
+컴파일된 채점 계획(ScoringPlan) 검증 및 벤치마크.
+
+MBTI/DISC/에니어그램 엔진별로 여러 답변 형식(정수, 실수, bool, 선택지 문자열,
+없는 선택지, None)이 섞인 합성 세션(mixed)과 시드 데이터 형식의 리커트 세션(likert)을
+만들어 기존 응답별 루프와 점수(값과 타입)가 같은지 확인한 뒤, 세션당 채점 시간을 비교합니다.
+
+실행: cd apps/api && python -m benchmarks.scoring_plans [--sessions 2000] [--questions 48]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import _env  # noqa: F401
+
+from app.tests_engine import DISCEngine, EnneagramEngine, MBTIEngine
+from app.tests_engine.scoring import ScoringPlan
+
+
+# ---- 기존 엔진의 응답별 루프 (기준) ----
+
+def legacy_mbti(responses: list[dict]) -> dict:
+    scores = {"E": 0, "I": 0, "S": 0, "N": 0, "T": 0, "F": 0, "J": 0, "P": 0}
+    for response in responses:
+        question = response.get("questions", {})
+        answer = response.get("answer")
+        scoring = question.get("scoring_weights", {})
+        if answer is not None and scoring:
+            for indicator, weight in scoring.items():
+                if indicator in scores:
+                    if isinstance(answer, int):
+                        scores[indicator] += weight * answer
+                    elif isinstance(answer, str) and answer in scoring:
+                        scores[indicator] += scoring[answer]
+    return scores
+
+
+def legacy_disc(responses: list[dict]) -> dict:
+    scores = {"D": 0, "I": 0, "S": 0, "C": 0}
+    for response in responses:
+        question = response.get("questions", {})
+        answer = response.get("answer")
+        scoring = question.get("scoring_weights", {})
+        if answer is not None and scoring:
+            for disc_type, weight in scoring.items():
+                if disc_type in scores:
+                    if isinstance(answer, (int, float)):
+                        scores[disc_type] += weight * answer
+                    elif isinstance(answer, str) and answer in scoring:
+                        scores[disc_type] += scoring[answer]
+    return scores
+
+
+def legacy_enneagram(responses: list[dict]) -> dict:
+    scores = {i: 0 for i in range(1, 10)}
+    for response in responses:
+        question = response.get("questions", {})
+        answer = response.get("answer")
+        scoring = question.get("scoring_weights", {})
+        if answer is not None and scoring:
+            for type_num, weight in scoring.items():
+                type_int = int(type_num) if isinstance(type_num, str) else type_num
+                if type_int in scores:
+                    if isinstance(answer, (int, float)):
+                        scores[type_int] += weight * answer
+                    elif isinstance(answer, str):
+                        scores[type_int] += weight
+    return scores
+
+
+# ---- 합성 데이터 ----
+
+def make_questions(rng: random.Random, keys: list, n: int, options: bool) -> list[dict]:
+    questions = []
+    for i in range(n):
+        scoring = {}
+        for key in rng.sample(keys, rng.randint(1, 3)):
+            scoring[key] = rng.choice([1, -1, 2, 0.5, -1.5, 0])
+        for option in ("A", "B") if options else ():
+            if rng.random() < 0.5:
+                scoring[option] = rng.choice([1, 2, 0.25])
+        if rng.random() < 0.05:
+            scoring = {}
+        questions.append({"id": i + 1, "question_number": i + 1, "scoring_weights": scoring})
+    return questions
+
+
+def make_session(rng: random.Random, questions: list[dict], keys: list) -> list[dict]:
+    responses = []
+    for question in questions:
+        answer = rng.choice([
+            rng.randint(1, 5), rng.randint(1, 5), rng.uniform(1, 5), True,
+            "A", "B", rng.choice(keys) if isinstance(keys[0], str) else "A", "Z", None,
+        ])
+        responses.append({"question_id": question["id"], "answer": answer, "questions": question})
+    return responses
+
+
+def make_likert(rng: random.Random, keys: list, n_questions: int, n_sessions: int):
+    """시드 데이터 형식: 정수 가중치 ±1, 1~5 리커트 정수 응답"""
+    questions = [
+        {"id": i + 1, "question_number": i + 1, "scoring_weights": {k: rng.choice([1, -1]) for k in rng.sample(keys, 2)}}
+        for i in range(n_questions)
+    ]
+    sessions = [
+        [{"question_id": q["id"], "answer": rng.randint(1, 5), "questions": q} for q in questions]
+        for _ in range(n_sessions)
+    ]
+    return questions, sessions
+
+
+def same(a: dict, b: dict) -> bool:
+    return list(a) == list(b) and all(
+        a[k] == b[k] and type(a[k]) is type(b[k]) for k in a
+    )
+
+
+def main(n_sessions: int, n_questions: int) -> None:
+    rng = random.Random(7)
+    cases = [
+        (MBTIEngine(), legacy_mbti, list(MBTIEngine.indicators), True),
+        (DISCEngine(), legacy_disc, list(DISCEngine.indicators), True),
+        # 에니어그램 키는 숫자 문자열만 유효 (기존 루프는 그 외 키에서 예외)
+        (EnneagramEngine(), legacy_enneagram, [str(i) for i in range(1, 10)], False),
+    ]
+
+    for engine, legacy, keys, options in cases:
+        mixed_questions = make_questions(rng, keys, n_questions, options)
+        mixed = (mixed_questions, [make_session(rng, mixed_questions, keys) for _ in range(n_sessions)])
+        likert = make_likert(rng, keys, n_questions, n_sessions)
+
+        for label, (questions, sessions) in (("mixed", mixed), ("likert", likert)):
+            started = time.perf_counter()
+            plan = ScoringPlan(
+                questions,
+                engine.indicators,
+                numeric_answer_types=engine.numeric_answer_types,
+                string_answer_mode=engine.string_answer_mode,
+                indicator_key=engine.indicator_key,
+            )
+            compile_ms = (time.perf_counter() - started) * 1000
+
+            for responses in sessions:
+                expected, actual = legacy(responses), plan.score(responses)
+                assert same(expected, actual), (engine.test_code, expected, actual)
+
+            timings = {}
+            for name, score in (("loop", legacy), ("plan", plan.score)):
+                started = time.perf_counter()
+                for responses in sessions:
+                    score(responses)
+                timings[name] = (time.perf_counter() - started) / n_sessions * 1e6
+
+            print(
+                f"{engine.test_code:<10} {label:<6} identical on {n_sessions} sessions; "
+                f"compile {compile_ms:.1f} ms, loop {timings['loop']:.0f} us/session, "
+                f"plan {timings['plan']:.0f} us/session"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--questions", type=int, default=48)
+    args = parser.parse_args()
+    main(args.sessions, args.questions)
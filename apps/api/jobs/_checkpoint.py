@@ -0,0 +1,22 @@
+"""작업 체크포인트 파일 (청크를 저장할 때마다 마지막 세션 ID 기록)"""
+import json
+import os
+
+
+def load_checkpoint(path: str, scope: str, field: str = "test_code") -> dict:
+    """체크포인트의 field 값이 scope와 다르면 (다른 검사/조건의 작업) 중단"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get(field) != scope:
+        raise SystemExit(f"Checkpoint {path} belongs to {field}='{checkpoint.get(field)}', not '{scope}'")
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    # 임시 파일에 쓴 뒤 교체 (중간에 중단돼도 체크포인트가 깨지지 않음)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,87 @@
+"""
+전체 사용자 능력치 일괄 재계산(백필) 작업.
+
+TEST_ABILITY_MAPPING이나 능력치 변환 공식을 바꾼 뒤, 사용자가 리포트를 다시 열지 않아도
+user_ability_states와 user_abilities가 새 공식으로 갱신되도록 합니다.
+검사 결과가 있는 사용자를 id 순서로 청크 단위로 읽어 compute_ability_states로 한 번에 계산하고,
+저장된 상태와 달라진 사용자만 청크마다 replace_ability_states RPC 한 번으로 교체합니다 (최대 --concurrency개 청크 동시 처리).
+재계산하는 동안 새 검사 결과가 반영된 사용자는 덮어쓰지 않고 다시 읽어 계산합니다.
+청크를 저장할 때마다 체크포인트 파일에 마지막 사용자 ID를 기록하므로,
+중단되면 같은 명령으로 다시 실행해 그 지점부터 이어서 처리합니다.
+
+실행: cd apps/api && python -m jobs.backfill_abilities [--since 2024-06-01T00:00:00Z]
+      [--chunk-size 200] [--concurrency 4] [--checkpoint PATH] [--restart] [--dry-run]
+"""
+import argparse
+import asyncio
+import os
+from typing import Optional
+
+from jobs._checkpoint import load_checkpoint, save_checkpoint
+
+from app.services.ability_backfill_service import BackfillStats, backfill_abilities
+from app.services.supabase_client import close_supabase
+
+
+async def main(
+    since: Optional[str],
+    chunk_size: int,
+    concurrency: int,
+    checkpoint_path: str,
+    restart: bool,
+    dry_run: bool,
+) -> None:
+    scope = since or "all"
+    checkpoint = {} if restart or dry_run else load_checkpoint(checkpoint_path, scope, field="since")
+    after = checkpoint.get("last_user_id")
+    if after:
+        print(f"resuming after user {after} ({checkpoint.get('users', 0)} users done)")
+
+    stats = BackfillStats()
+    try:
+        async for last_user_id, stats in backfill_abilities(
+            chunk_size=chunk_size, concurrency=concurrency, since=since,
+            after=after, dry_run=dry_run, stats=stats,
+        ):
+            if not dry_run:
+                save_checkpoint(checkpoint_path, {
+                    "since": scope,
+                    "last_user_id": last_user_id,
+                    "users": checkpoint.get("users", 0) + stats.users,
+                })
+            print(
+                f"{stats.users} users ({stats.results} results), {stats.updated} updated, "
+                f"{stats.users_per_second:.0f} users/s"
+            )
+    finally:
+        await close_supabase()
+
+    print(
+        f"done: {stats.users} users in this run, {stats.updated} updated"
+        f"{' (dry run, nothing written)' if dry_run else ''}, {stats.unchanged} unchanged, "
+        f"{stats.skipped} skipped (results still arriving); "
+        f"{stats.users_per_second:.0f} users/s"
+    )
+    if not dry_run and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--since", help="이 시각(ISO 8601) 이후에 검사 결과가 생긴 사용자만 재계산")
+    parser.add_argument("--chunk-size", type=int, default=200, help="청크당 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 조회·저장할 청크 수")
+    parser.add_argument("--checkpoint", default=".abilities-backfill.json", help="체크포인트 파일")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 바뀔 사용자 수만 집계")
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    asyncio.run(main(
+        args.since,
+        args.chunk_size,
+        args.concurrency,
+        args.checkpoint,
+        args.restart,
+        args.dry_run,
+    ))
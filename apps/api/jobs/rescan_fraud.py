@@ -0,0 +1,70 @@
+"""
+과거 검사 세션 부정행위 일괄 재검사.
+
+완료된 세션을 id 순서로 청크 단위로 읽어 detect_batch로 한 번에 판정하고
+test_sessions.fraud_score와 fraud_detection_logs를 청크마다 bulk로 갱신합니다.
+(세션의 기존 탐지 로그는 지우고 새 판정으로 다시 기록하므로 여러 번 실행해도 중복되지 않음)
+청크를 저장할 때마다 체크포인트 파일에 마지막 세션 ID를 기록하므로,
+중단되면 같은 명령으로 다시 실행해 그 지점부터 이어서 처리합니다.
+
+실행: cd apps/api && python -m jobs.rescan_fraud --test mbti [--chunk-size 200]
+      [--checkpoint PATH] [--restart] [--dry-run]
+"""
+import argparse
+import asyncio
+import os
+
+from jobs._checkpoint import load_checkpoint, save_checkpoint
+
+from app.services.fraud_service import FraudScanStats, rescan_test
+from app.services.supabase_client import close_supabase
+
+
+async def main(test_code: str, chunk_size: int, checkpoint_path: str, restart: bool, dry_run: bool) -> None:
+    checkpoint = {} if restart or dry_run else load_checkpoint(checkpoint_path, test_code)
+    after = checkpoint.get("last_session_id")
+    if after:
+        print(f"resuming {test_code} after session {after} ({checkpoint.get('sessions', 0)} sessions done)")
+
+    stats = FraudScanStats()
+    try:
+        async for last_session_id, stats in rescan_test(
+            test_code, chunk_size=chunk_size, after=after, dry_run=dry_run, stats=stats
+        ):
+            if not dry_run:
+                save_checkpoint(checkpoint_path, {
+                    "test_code": test_code,
+                    "last_session_id": last_session_id,
+                    "sessions": checkpoint.get("sessions", 0) + stats.sessions,
+                })
+            print(
+                f"{stats.sessions} sessions, {stats.flagged} flagged, "
+                f"{stats.sessions_per_second:.0f} sessions/s"
+            )
+    finally:
+        await close_supabase()
+
+    print(
+        f"done: {stats.sessions} sessions in this run, {stats.flagged} flagged, "
+        f"{stats.detections} detections{' (dry run, nothing written)' if dry_run else ''}; "
+        f"{stats.sessions_per_second:.0f} sessions/s"
+    )
+    if not dry_run and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--test", required=True, help="검사 코드 (예: mbti, disc, enneagram)")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--checkpoint", help="체크포인트 파일 (기본: .fraud-<검사 코드>.json)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 탐지 건수만 집계")
+    args = parser.parse_args()
+    asyncio.run(main(
+        args.test,
+        args.chunk_size,
+        args.checkpoint or f".fraud-{args.test}.json",
+        args.restart,
+        args.dry_run,
+    ))
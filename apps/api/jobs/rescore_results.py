@@ -0,0 +1,75 @@
+"""
+검사 결과 일괄 재채점 작업.
+
+문항의 scoring_weights를 고친 뒤 기존 test_results(raw_scores, result_type)를
+다시 계산합니다. 완료된 세션을 id 순서로 청크 단위로 읽어 채점 계획으로 한 번에
+채점하고, 바뀐 결과만 청크마다 bulk upsert로 저장합니다.
+청크를 저장할 때마다 체크포인트 파일에 마지막 세션 ID를 기록하므로,
+중단되면 같은 명령으로 다시 실행해 그 지점부터 이어서 처리합니다.
+
+실행: cd apps/api && python -m jobs.rescore_results --test mbti [--chunk-size 200]
+      [--checkpoint PATH] [--restart] [--dry-run]
+"""
+import argparse
+import asyncio
+import os
+
+from jobs._checkpoint import load_checkpoint, save_checkpoint
+
+from app.services.rescoring_service import RescoreStats, rescore_test
+from app.services.supabase_client import close_supabase
+
+
+async def main(test_code: str, chunk_size: int, checkpoint_path: str, restart: bool, dry_run: bool) -> None:
+    checkpoint = {} if restart or dry_run else load_checkpoint(checkpoint_path, test_code)
+    after = checkpoint.get("last_session_id")
+    if after:
+        print(f"resuming {test_code} after session {after} ({checkpoint.get('sessions', 0)} sessions done)")
+
+    stats = RescoreStats()
+    try:
+        async for last_session_id, stats in rescore_test(
+            test_code, chunk_size=chunk_size, after=after, dry_run=dry_run, stats=stats
+        ):
+            if not dry_run:
+                save_checkpoint(checkpoint_path, {
+                    "test_code": test_code,
+                    "last_session_id": last_session_id,
+                    "sessions": checkpoint.get("sessions", 0) + stats.sessions,
+                })
+            print(
+                f"{stats.sessions} sessions, {stats.updated} updated, "
+                f"{stats.sessions_per_second:.0f} sessions/s"
+            )
+    finally:
+        await close_supabase()
+
+    print(
+        f"done: {stats.sessions} sessions in this run, {stats.updated} updated"
+        f"{' (dry run, nothing written)' if dry_run else ''}, {stats.unchanged} unchanged, "
+        f"{stats.without_result} without a result row, {len(stats.failed)} failed; "
+        f"{stats.sessions_per_second:.0f} sessions/s"
+    )
+    if stats.failed:
+        print("failed sessions (scores could not be turned into a result):")
+        for session_id in stats.failed:
+            print(f"  {session_id}")
+    if not dry_run and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--test", required=True, help="검사 코드 (예: mbti, disc, enneagram)")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--checkpoint", help="체크포인트 파일 (기본: .rescore-<검사 코드>.json)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 바뀔 결과 수만 집계")
+    args = parser.parse_args()
+    asyncio.run(main(
+        args.test,
+        args.chunk_size,
+        args.checkpoint or f".rescore-{args.test}.json",
+        args.restart,
+        args.dry_run,
+    ))
@@ -0,0 +1,7 @@
+"""테스트용 기본 환경 변수 (실제 .env 가 없어도 app 모듈을 import 할 수 있도록)"""
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+os.environ.setdefault("SUPABASE_KEY", "test.test.test")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test.test.test")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
@@ -0,0 +1,145 @@
+"""적합도 테스트용 데이터 (합성 구직자/공고, 경계 사례, 기존 구현으로 구한 기준 점수)"""
+import random
+
+MBTI_TYPES = [a + b + c + d for a in "EI" for b in "SN" for c in "TF" for d in "JP"]
+DISC_TYPES = ["Di", "Dc", "Id", "Is", "Si", "Sc", "Cd", "Cs"]
+CULTURE_TAGS = ["자율출퇴근", "수평문화", "성과중심", "데이터중심", "팀워크중심", "혁신적", "안정적", "성장지향"]
+REMOTE_PREFS = [None, "remote", "hybrid", "office"]
+LOCATIONS = [None, "서울", "서울 강남", "판교", "부산", "대전"]
+ABILITY_KEYS = ["leadership", "analysis", "analytical", "communication", "execution", "planning", "focus"]
+
+
+def make_seekers(n: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"{i:08d}-0000-0000-0000-000000000000",
+            "abilities_snapshot": [
+                {"key": key, "score": rng.randint(0, 100)} for key in ABILITY_KEYS if rng.random() < 0.9
+            ],
+            "comprehensive_profile": (
+                {"mbti": {"type": rng.choice(MBTI_TYPES)}, "disc": {"type": rng.choice(DISC_TYPES)}}
+                if rng.random() < 0.95
+                else None
+            ),
+            "remote_pref": rng.choice(REMOTE_PREFS),
+            "experience_years": rng.randint(0, 20),
+            "location_pref": rng.choice(LOCATIONS),
+        }
+        for i in range(n)
+    ]
+
+
+def make_jobs(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"{i:08d}-1111-1111-1111-111111111111",
+            "required_abilities": {
+                key: {"min": rng.randint(40, 90)} for key in rng.sample(ABILITY_KEYS, rng.randint(2, 5))
+            },
+            "preferred_culture": rng.sample(CULTURE_TAGS, rng.randint(0, 4)) or None,
+            "conditions": {
+                "remote": rng.choice(REMOTE_PREFS),
+                "experience_min": rng.choice([None, 0, 2, 5]),
+                "experience_max": rng.choice([None, 10, 15]),
+                "location": rng.choice(LOCATIONS),
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def edge_cases(seekers: list[dict], jobs: list[dict], rng: random.Random) -> tuple[list, list]:
+    """공고/기업/팀 프로필 입력에 경계 사례를 섞음 (구직자는 빈 스냅샷·빈 경력 추가)"""
+    for seeker in seekers[::17]:
+        seeker["abilities_snapshot"] = []
+    for seeker in seekers[::23]:
+        seeker["experience_years"] = None
+
+    edge_jobs = [
+        {"required_abilities": {"analysis": {"min": 70}, "analytical": 65, "unknown_key": 50}},
+        {"required_abilities": {"leadership": 85.5}, "conditions": {}},
+        {"required_abilities": None, "conditions": None, "preferred_culture": ["워라밸", "혁신적", "혁신적"]},
+        {"required_abilities": {"focus": {}}, "conditions": {"experience_min": 2.5, "experience_max": 3}},
+        {"conditions": {"remote": "", "location": "서울"}, "preferred_culture": "수평문화"},
+    ]
+    step = max(1, min(7, len(jobs) // len(edge_jobs)))
+    for i, job in enumerate(edge_jobs[:len(jobs)]):
+        jobs[i * step] = {**jobs[i * step], **job}
+
+    companies = [
+        {"culture_tags": rng.sample(CULTURE_TAGS, rng.randint(0, 3))} if rng.random() < 0.3 else None
+        for _ in jobs
+    ]
+    teams = [
+        rng.choice([None, {}, {"current_team_types": {}}, {"current_team_types": {"ENTJ": 2}}])
+        for _ in jobs
+    ]
+    return companies, teams
+
+
+# (구직자, 공고, 기업, 팀 프로필, 점수) — 점수는 배치 계산 도입 전 calculate_fit_score(항목별 루프)로 구한 값
+BASELINE_CASES = [
+    (
+        {"abilities_snapshot": [{"key": "leadership", "score": 60}, {"key": "analysis", "score": 80}],
+         "comprehensive_profile": {"mbti": {"type": "ENTJ"}, "disc": {"type": "Di"}},
+         "remote_pref": "hybrid", "experience_years": 4, "location_pref": "서울 강남"},
+        {"required_abilities": {"leadership": {"min": 75}, "analysis": 70},
+         "preferred_culture": ["혁신적", "안정적"],
+         "conditions": {"remote": "remote", "experience_min": 3, "experience_max": 10, "location": "서울"}},
+        None,
+        None,
+        {"ability": 78.8, "culture": 100.0, "condition": 92.5, "total": 86.1},
+    ),
+    (
+        {"abilities_snapshot": [{"key": "leadership", "score": 30}],
+         "comprehensive_profile": {"mbti": {"type": "ISFP"}, "disc": {"type": "Sc"}},
+         "remote_pref": "office", "experience_years": 1, "location_pref": "부산"},
+        {"required_abilities": {"leadership": 85.5, "focus": {"min": 90}},
+         "conditions": {"remote": "hybrid", "experience_min": 4, "location": "서울"}},
+        {"culture_tags": ["자율출퇴근", "성과중심", "데이터중심"]},
+        {"current_team_types": {"ENTJ": 2}},
+        {"ability": 3.3, "culture": 58.3, "condition": 36.7, "total": 22.0},
+    ),
+    (
+        {"abilities_snapshot": [], "comprehensive_profile": None,
+         "remote_pref": None, "experience_years": None, "location_pref": None},
+        {"required_abilities": {"analysis": {"min": 70}}, "preferred_culture": ["수평문화"],
+         "conditions": {"experience_min": 2.5, "experience_max": 3, "location": "판교"}},
+        None,
+        {"current_team_types": {}},
+        {"ability": 50.0, "culture": 50.0, "condition": 70.0, "total": 53.0},
+    ),
+    (
+        {"abilities_snapshot": [{"key": "analysis", "score": 95}, {"key": "communication", "score": 40}],
+         "comprehensive_profile": {"mbti": {"type": "INTP"}, "disc": {"type": "Cs"}},
+         "remote_pref": "remote", "experience_years": 16, "location_pref": "대전"},
+        {"required_abilities": {"analysis": {"min": 70}, "communication": {"min": 65}, "unknown_key": 50},
+         "preferred_culture": ["데이터중심", "팀워크중심", "워라밸"],
+         "conditions": {"remote": "remote", "experience_max": 12}},
+        {"culture_tags": []},
+        {"current_team_types": {"INTP": 1}},
+        {"ability": 71.1, "culture": 55.0, "condition": 60.0, "total": 65.4},
+    ),
+    (
+        {"abilities_snapshot": [{"key": "leadership", "score": 100}],
+         "comprehensive_profile": {"mbti": {"type": "ESFJ"}},
+         "remote_pref": "hybrid", "experience_years": 0, "location_pref": "서울"},
+        {"required_abilities": None, "preferred_culture": None, "conditions": None},
+        None,
+        None,
+        {"ability": 50.0, "culture": 50.0, "condition": 70.0, "total": 53.0},
+    ),
+    (
+        {"abilities_snapshot": [{"key": "execution", "score": 20}, {"key": "planning", "score": 55}],
+         "comprehensive_profile": {"mbti": {"type": "ESTJ"}, "disc": {"type": "Dc"}},
+         "remote_pref": "office", "experience_years": 7, "location_pref": "판교"},
+        {"required_abilities": {"execution": {"min": 90}, "planning": {"min": 50}},
+         "preferred_culture": ["성과중심", "안정적", "성장지향", "혁신적"],
+         "conditions": {"remote": "", "experience_min": 0, "location": "서울"}},
+        None,
+        {},
+        {"ability": 1.0, "culture": 100.0, "condition": 70.0, "total": 36.1},
+    ),
+]
@@ -0,0 +1,60 @@
+"""calculate_fit_scores(열 단위 배치)가 모든 쌍에서 calculate_fit_score와 같은 점수를 내는지 확인"""
+import random
+
+import pytest
+
+from fit_data import BASELINE_CASES, edge_cases, make_jobs, make_seekers
+
+from app.services.matching_service import (
+    JobColumns,
+    SeekerColumns,
+    calculate_fit_score,
+    calculate_fit_scores,
+)
+
+FIELDS = ("ability", "culture", "condition", "total")
+
+
+def _dataset(n_seekers: int, n_jobs: int):
+    seekers = make_seekers(n_seekers)
+    jobs = make_jobs(n_jobs)
+    companies, teams = edge_cases(seekers, jobs, random.Random(23))
+    return seekers, jobs, companies, teams
+
+
+def _assert_same(batch: dict, expected: list[dict]) -> None:
+    for field in FIELDS:
+        assert batch[field].tolist() == [scores[field] for scores in expected], field
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3, 40])
+def test_one_job_many_seekers(n_jobs):
+    seekers, jobs, companies, teams = _dataset(300, n_jobs)
+    seeker_columns = SeekerColumns.from_profiles(seekers)
+
+    for job, company, team in zip(jobs, companies, teams):
+        batch = calculate_fit_scores(seeker_columns, JobColumns.from_postings([job], [company], [team]))
+        _assert_same(batch, [calculate_fit_score(seeker, job, company, team) for seeker in seekers])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3, 40])
+def test_one_seeker_many_jobs(n_jobs):
+    seekers, jobs, companies, teams = _dataset(60, n_jobs)
+    job_columns = JobColumns.from_postings(jobs, companies, teams)
+
+    for seeker in seekers:
+        batch = calculate_fit_scores(SeekerColumns.from_profiles([seeker]), job_columns)
+        _assert_same(batch, [
+            calculate_fit_score(seeker, job, company, team)
+            for job, company, team in zip(jobs, companies, teams)
+        ])
+
+
+@pytest.mark.parametrize("seeker, job, company, team, expected", BASELINE_CASES)
+def test_baseline_scores(seeker, job, company, team, expected):
+    assert calculate_fit_score(seeker, job, company, team) == expected
+
+    batch = calculate_fit_scores(
+        SeekerColumns.from_profiles([seeker]), JobColumns.from_postings([job], [company], [team])
+    )
+    _assert_same(batch, [expected])
@@ -18,6 +18,8 @@ export default function SeekerMessagesPage() {
   const [selectedMatchId, setSelectedMatchId] = useState<string | null>(null);
   const [messages, setMessages] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!isAuthenticated || !token) {
@@ -26,7 +28,8 @@ export default function SeekerMessagesPage() {
     }
 
     marketplaceApi.messages.getSeekerConversations(token).then((res) => {
-      setConversations(Array.isArray(res.data) ? res.data : []);
+      setConversations((res.data as any)?.conversations || []);
+      setNextCursor((res.data as any)?.next_cursor || null);
       setLoading(false);
     });
   }, [isAuthenticated, token, router]);
@@ -35,25 +38,36 @@ export default function SeekerMessagesPage() {
     if (!selectedMatchId || !token) return;
 
     marketplaceApi.messages.getSeekerMessages(selectedMatchId, token).then((res) => {
-      setMessages(Array.isArray(res.data) ? res.data : []);
+      setMessages((res.data as any)?.messages || []);
     });
 
-    // 5초마다 폴링
-    const interval = setInterval(() => {
-      marketplaceApi.messages.getSeekerMessages(selectedMatchId, token).then((res) => {
-        setMessages(Array.isArray(res.data) ? res.data : []);
-      });
-    }, 5000);
-
-    return () => clearInterval(interval);
+    // 새 메시지는 WebSocket으로 수신
+    return marketplaceApi.messages.subscribe('seeker', selectedMatchId, token, (message) => {
+      setMessages((prev) => (prev.some((m) => m.id === message.id) ? prev : [...prev, message]));
+    });
   }, [selectedMatchId, token]);
 
+  // 대화 목록은 페이지 단위 — 다음 커서로 이어서 조회
+  const loadMoreConversations = async () => {
+    if (!token || !nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    const res = await marketplaceApi.messages.getSeekerConversations(token, nextCursor);
+    const page = (res.data as any)?.conversations || [];
+    setConversations((prev) => [
+      ...prev,
+      ...page.filter((conv: any) => !prev.some((c) => c.match_id === conv.match_id)),
+    ]);
+    setNextCursor((res.data as any)?.next_cursor || null);
+    setLoadingMore(false);
+  };
+
   const handleSend = async (content: string) => {
     if (!token || !selectedMatchId) return;
-    await marketplaceApi.messages.sendSeekerMessage(selectedMatchId, content, token);
-    // 즉시 새로고침
-    const res = await marketplaceApi.messages.getSeekerMessages(selectedMatchId, token);
-    setMessages(Array.isArray(res.data) ? res.data : []);
+    const res = await marketplaceApi.messages.sendSeekerMessage(selectedMatchId, content, token);
+    const message = res.data as any;
+    if (message?.id) {
+      setMessages((prev) => (prev.some((m) => m.id === message.id) ? prev : [...prev, message]));
+    }
   };
 
   const selectedConv = conversations.find((c) => c.match_id === selectedMatchId);
@@ -84,32 +98,47 @@ export default function SeekerMessagesPage() {
                 매칭된 기업이 있어야 메시지를 보낼 수 있습니다
               </div>
             ) : (
-              conversations.map((conv) => (
-                <button
-                  key={conv.match_id}
-                  onClick={() => setSelectedMatchId(conv.match_id)}
-                  className={`w-full text-left px-4 py-3 border-b hover:bg-muted transition-colors ${
-                    selectedMatchId === conv.match_id ? 'bg-muted' : ''
-                  }`}
-                >
-                  <div className="flex items-center justify-between">
-                    <p className="font-medium text-sm">{conv.company?.name || '기업'}</p>
-                    {conv.unread_count > 0 && (
-                      <span className="bg-primary text-primary-foreground text-xs rounded-full w-5 h-5 flex items-center justify-center">
-                        {conv.unread_count}
-                      </span>
+              <>
+                {conversations.map((conv) => (
+                  <button
+                    key={conv.match_id}
+                    onClick={() => setSelectedMatchId(conv.match_id)}
+                    className={`w-full text-left px-4 py-3 border-b hover:bg-muted transition-colors ${
+                      selectedMatchId === conv.match_id ? 'bg-muted' : ''
+                    }`}
+                  >
+                    <div className="flex items-center justify-between">
+                      <p className="font-medium text-sm">{conv.company?.name || '기업'}</p>
+                      {conv.unread_count > 0 && (
+                        <span className="bg-primary text-primary-foreground text-xs rounded-full w-5 h-5 flex items-center justify-center">
+                          {conv.unread_count}
+                        </span>
+                      )}
+                    </div>
+                    {conv.job_title && (
+                      <p className="text-xs text-muted-foreground">{conv.job_title}</p>
+                    )}
+                    {conv.last_message && (
+                      <p className="text-xs text-muted-foreground mt-1 truncate">
+                        {conv.last_message.content}
+                      </p>
                     )}
+                  </button>
+                ))}
+                {nextCursor && (
+                  <div className="p-3">
+                    <Button
+                      variant="outline"
+                      size="sm"
+                      className="w-full"
+                      onClick={loadMoreConversations}
+                      disabled={loadingMore}
+                    >
+                      {loadingMore ? '불러오는 중...' : '더 보기'}
+                    </Button>
                   </div>
-                  {conv.job_title && (
-                    <p className="text-xs text-muted-foreground">{conv.job_title}</p>
-                  )}
-                  {conv.last_message && (
-                    <p className="text-xs text-muted-foreground mt-1 truncate">
-                      {conv.last_message.content}
-                    </p>
-                  )}
-                </button>
-              ))
+                )}
+              </>
             )}
           </div>
 
@@ -59,6 +59,13 @@ export const api = {
         method: 'POST',
         body: JSON.stringify(data),
       }),
+    submitAnswers: (code: string, sessionId: string, answers: unknown[]) =>
+      request(`/api/tests/${code}/sessions/${sessionId}/answers`, {
+        method: 'POST',
+        body: JSON.stringify({ answers }),
+      }),
+    progress: (code: string, sessionId: string) =>
+      request(`/api/tests/${code}/sessions/${sessionId}/progress`),
     complete: (code: string, sessionId: string) =>
       request(`/api/tests/${code}/complete`, {
         method: 'POST',
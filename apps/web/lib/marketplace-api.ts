@@ -148,19 +148,31 @@ export const marketplaceApi = {
 
   // Messages
   messages: {
-    getSeekerConversations: (token: string) =>
-      request('/api/messages/conversations/seeker', {}, token),
+    getSeekerConversations: (token: string, cursor?: string | null) =>
+      request(`/api/messages/conversations/seeker${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`, {}, token),
     getSeekerMessages: (matchId: string, token: string) =>
       request(`/api/messages/conversations/seeker/${matchId}`, {}, token),
     sendSeekerMessage: (matchId: string, content: string, token: string) =>
       request(`/api/messages/conversations/seeker/${matchId}`, { method: 'POST', body: JSON.stringify({ content }) }, token),
-    getCompanyConversations: (token: string) =>
-      request('/api/messages/conversations/company', {}, token),
+    getCompanyConversations: (token: string, cursor?: string | null) =>
+      request(`/api/messages/conversations/company${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`, {}, token),
     getCompanyMessages: (matchId: string, token: string) =>
       request(`/api/messages/conversations/company/${matchId}`, {}, token),
     sendCompanyMessage: (matchId: string, content: string, token: string) =>
       request(`/api/messages/conversations/company/${matchId}`, { method: 'POST', body: JSON.stringify({ content }) }, token),
     markRead: (messageId: string) =>
       request(`/api/messages/${messageId}/read`, { method: 'PUT' }),
+    // 새 메시지 실시간 수신 (폴링 대신 WebSocket)
+    subscribe: (side: 'seeker' | 'company', matchId: string, token: string, onMessage: (message: any) => void) => {
+      const wsBase = API_BASE_URL.replace(/^http/, 'ws');
+      const socket = new WebSocket(`${wsBase}/api/messages/conversations/${side}/${matchId}/ws`);
+      // 토큰은 URL(접근 로그에 남음) 대신 연결 직후 첫 메시지로 전달
+      socket.onopen = () => socket.send(JSON.stringify({ type: 'auth', token }));
+      socket.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        if (data.type === 'message') onMessage(data.message);
+      };
+      return () => socket.close();
+    },
   },
 };
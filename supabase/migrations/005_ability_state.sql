@@ -0,0 +1,18 @@
+-- 사용자별 능력치 누적 상태
+-- 검사 완료 시 새 결과의 기여분(점수 합계·개수·출처 검사)만 더해 갱신하므로
+-- 능력치 조회/리포트 생성 때 전체 검사 결과를 다시 읽어 재계산하지 않음
+
+CREATE TABLE IF NOT EXISTS user_ability_states (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    score_sums JSONB NOT NULL DEFAULT '{}',
+    score_counts JSONB NOT NULL DEFAULT '{}',
+    source_tests JSONB NOT NULL DEFAULT '{}',
+    completed_tests JSONB NOT NULL DEFAULT '[]',
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Updated_at 트리거
+CREATE TRIGGER update_user_ability_states_updated_at
+    BEFORE UPDATE ON user_ability_states
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
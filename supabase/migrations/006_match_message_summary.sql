@@ -0,0 +1,93 @@
+-- 매칭별 대화 요약 (마지막 메시지, 양측 안 읽은 메시지 수)
+-- 메시지 삽입/읽음 처리 시 트리거로 갱신되므로
+-- 대화 목록을 matches 한 번의 조회로 만들 수 있음 (매칭당 추가 쿼리 없음)
+
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS last_message JSONB;
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS last_message_at TIMESTAMPTZ;
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS seeker_unread_count INT NOT NULL DEFAULT 0;
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS company_unread_count INT NOT NULL DEFAULT 0;
+
+-- 대화 목록 keyset 페이지네이션 (matched_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_matches_seeker_matched
+    ON matches(seeker_profile_id, matched_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_matches_company_matched
+    ON matches(company_id, matched_at DESC, id DESC);
+
+-- 새 메시지: 마지막 메시지 갱신 + 받는 쪽 안 읽은 수 증가
+CREATE OR REPLACE FUNCTION update_match_summary_on_message()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE matches SET
+        last_message = jsonb_build_object(
+            'id', NEW.id,
+            'content', NEW.content,
+            'sender_type', NEW.sender_type,
+            'created_at', NEW.created_at,
+            'read_at', NEW.read_at
+        ),
+        last_message_at = NEW.created_at,
+        seeker_unread_count = seeker_unread_count
+            + CASE WHEN NEW.sender_type = 'company' AND NEW.read_at IS NULL THEN 1 ELSE 0 END,
+        company_unread_count = company_unread_count
+            + CASE WHEN NEW.sender_type = 'seeker' AND NEW.read_at IS NULL THEN 1 ELSE 0 END
+    WHERE id = NEW.match_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER update_match_summary_on_message_insert
+    AFTER INSERT ON messages
+    FOR EACH ROW
+    EXECUTE FUNCTION update_match_summary_on_message();
+
+-- 읽음 처리: 받는 쪽 안 읽은 수 감소 (+ 마지막 메시지면 read_at 반영)
+CREATE OR REPLACE FUNCTION update_match_summary_on_read()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE matches SET
+        seeker_unread_count = GREATEST(seeker_unread_count
+            - CASE WHEN NEW.sender_type = 'company' THEN 1 ELSE 0 END, 0),
+        company_unread_count = GREATEST(company_unread_count
+            - CASE WHEN NEW.sender_type = 'seeker' THEN 1 ELSE 0 END, 0),
+        last_message = CASE
+            WHEN last_message->>'id' = NEW.id::text
+            THEN jsonb_set(last_message, '{read_at}', to_jsonb(NEW.read_at))
+            ELSE last_message
+        END
+    WHERE id = NEW.match_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER update_match_summary_on_message_read
+    AFTER UPDATE OF read_at ON messages
+    FOR EACH ROW
+    WHEN (OLD.read_at IS NULL AND NEW.read_at IS NOT NULL)
+    EXECUTE FUNCTION update_match_summary_on_read();
+
+-- 기존 데이터 백필
+UPDATE matches m SET
+    last_message = (
+        SELECT jsonb_build_object(
+            'id', msg.id,
+            'content', msg.content,
+            'sender_type', msg.sender_type,
+            'created_at', msg.created_at,
+            'read_at', msg.read_at
+        )
+        FROM messages msg
+        WHERE msg.match_id = m.id
+        ORDER BY msg.created_at DESC
+        LIMIT 1
+    ),
+    last_message_at = (
+        SELECT MAX(msg.created_at) FROM messages msg WHERE msg.match_id = m.id
+    ),
+    seeker_unread_count = (
+        SELECT COUNT(*) FROM messages msg
+        WHERE msg.match_id = m.id AND msg.sender_type = 'company' AND msg.read_at IS NULL
+    ),
+    company_unread_count = (
+        SELECT COUNT(*) FROM messages msg
+        WHERE msg.match_id = m.id AND msg.sender_type = 'seeker' AND msg.read_at IS NULL
+    );
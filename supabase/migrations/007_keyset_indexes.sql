@@ -0,0 +1,14 @@
+-- 목록 엔드포인트 keyset(커서) 페이지네이션용 인덱스
+-- (정렬 컬럼, id) 순서로 커서 이후 행을 인덱스 범위 스캔으로 바로 찾음
+
+CREATE INDEX IF NOT EXISTS idx_seeker_profiles_listing
+    ON seeker_profiles(created_at DESC, id DESC)
+    WHERE is_active = TRUE AND visibility = 'public';
+CREATE INDEX IF NOT EXISTS idx_job_postings_status_created
+    ON job_postings(status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_job_postings_company_created
+    ON job_postings(company_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_companies_created
+    ON companies(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_messages_match_created
+    ON messages(match_id, created_at, id);
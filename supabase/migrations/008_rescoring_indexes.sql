@@ -0,0 +1,7 @@
+-- 검사 결과 일괄 재채점(jobs/rescore_results.py)용 인덱스
+-- 완료된 세션을 id 순서로 청크 조회하고, 청크의 응답/결과를 session_id로 찾음
+
+CREATE INDEX IF NOT EXISTS idx_test_sessions_test_status_id
+    ON test_sessions(test_id, status, id);
+CREATE INDEX IF NOT EXISTS idx_test_results_session
+    ON test_results(session_id);
@@ -0,0 +1,3 @@
+-- 부정행위 재검사(jobs/rescan_fraud.py)가 세션별 탐지 로그를 지우고 다시 기록할 때 사용
+CREATE INDEX IF NOT EXISTS idx_fraud_detection_logs_session
+    ON fraud_detection_logs(session_id, detection_type);
@@ -0,0 +1,6 @@
+-- 능력치 백필(jobs/backfill_abilities.py)용 인덱스
+-- 결과가 있는 사용자를 user_id 순서로 keyset 조회하고(--since는 created_at 조건),
+-- 청크 사용자들의 결과를 (user_id, created_at) 순서로 읽음
+
+CREATE INDEX IF NOT EXISTS idx_test_results_user_created
+    ON test_results(user_id, created_at);
@@ -0,0 +1,120 @@
+-- 데이터 정리 마이그레이션: 중복 관심/매칭 병합 (행 삭제 포함)
+-- 012_atomic_matching.sql의 유니크 제약을 걸기 전에, 동시 요청으로 생긴 중복을 정리합니다.
+--
+-- 이 마이그레이션은 행을 삭제합니다. 삭제하는 행은 모두 먼저 아래 보관 테이블에 그대로 복사하고,
+-- 단계별 처리 건수를 NOTICE로 남깁니다.
+--   - interests_removed_duplicates: 삭제한 관심 (+ 남긴 관심 ID)
+--   - matches_removed_duplicates:   삭제한 매칭 (+ 지원/메시지를 옮겨 받은 매칭 ID)
+-- 되돌려야 하면 보관 테이블의 행을 다시 넣고 applications/messages의 match_id를 원래 ID로 되돌리면 됩니다.
+-- 확인이 끝난 뒤 보관 테이블은 직접 DROP 하세요.
+
+-- ==========================================
+-- 보관 테이블
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS interests_removed_duplicates (
+    LIKE interests,
+    kept_id UUID NOT NULL,
+    removed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS matches_removed_duplicates (
+    LIKE matches,
+    kept_id UUID NOT NULL,
+    removed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+DO $$
+DECLARE
+    v_count BIGINT;
+BEGIN
+    -- ==========================================
+    -- 관심: 같은 (보낸 쪽, 받는 쪽)은 가장 먼저 만든 것만 남김
+    -- ==========================================
+
+    CREATE TEMP TABLE duplicate_interests ON COMMIT DROP AS
+    SELECT i.id, keep.id AS keep_id
+    FROM interests i
+    JOIN LATERAL (
+        SELECT k.id
+        FROM interests k
+        WHERE k.from_type = i.from_type
+          AND k.from_id = i.from_id
+          AND k.to_id = i.to_id
+        ORDER BY k.created_at, k.id
+        LIMIT 1
+    ) keep ON keep.id <> i.id;
+
+    INSERT INTO interests_removed_duplicates
+    SELECT i.*, d.keep_id, NOW()
+    FROM interests i JOIN duplicate_interests d ON d.id = i.id;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RAISE NOTICE 'interests: archived % duplicate rows to interests_removed_duplicates', v_count;
+
+    DELETE FROM interests i USING duplicate_interests d WHERE i.id = d.id;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RAISE NOTICE 'interests: deleted % duplicate rows', v_count;
+
+    -- ==========================================
+    -- 매칭: 같은 (구직자, 기업, 공고)는 가장 먼저 성사된 것으로 지원/메시지를 옮긴 뒤 나머지 삭제
+    -- ==========================================
+
+    CREATE TEMP TABLE duplicate_matches ON COMMIT DROP AS
+    SELECT m.id, keep.id AS keep_id
+    FROM matches m
+    JOIN LATERAL (
+        SELECT k.id
+        FROM matches k
+        WHERE k.seeker_profile_id = m.seeker_profile_id
+          AND k.company_id = m.company_id
+          AND k.job_posting_id IS NOT DISTINCT FROM m.job_posting_id
+        ORDER BY k.matched_at, k.id
+        LIMIT 1
+    ) keep ON keep.id <> m.id;
+
+    INSERT INTO matches_removed_duplicates
+    SELECT m.*, d.keep_id, NOW()
+    FROM matches m JOIN duplicate_matches d ON d.id = m.id;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RAISE NOTICE 'matches: archived % duplicate rows to matches_removed_duplicates', v_count;
+
+    UPDATE applications a SET match_id = d.keep_id FROM duplicate_matches d WHERE a.match_id = d.id;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RAISE NOTICE 'applications: moved % rows to the kept match', v_count;
+
+    UPDATE messages msg SET match_id = d.keep_id FROM duplicate_matches d WHERE msg.match_id = d.id;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RAISE NOTICE 'messages: moved % rows to the kept match', v_count;
+
+    DELETE FROM matches m USING duplicate_matches d WHERE m.id = d.id;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RAISE NOTICE 'matches: deleted % duplicate rows', v_count;
+
+    -- 메시지를 옮겨 받은 매칭의 대화 요약 재계산 (006과 동일)
+    UPDATE matches m SET
+        last_message = (
+            SELECT jsonb_build_object(
+                'id', msg.id,
+                'content', msg.content,
+                'sender_type', msg.sender_type,
+                'created_at', msg.created_at,
+                'read_at', msg.read_at
+            )
+            FROM messages msg
+            WHERE msg.match_id = m.id
+            ORDER BY msg.created_at DESC
+            LIMIT 1
+        ),
+        last_message_at = (
+            SELECT MAX(msg.created_at) FROM messages msg WHERE msg.match_id = m.id
+        ),
+        seeker_unread_count = (
+            SELECT COUNT(*) FROM messages msg
+            WHERE msg.match_id = m.id AND msg.sender_type = 'company' AND msg.read_at IS NULL
+        ),
+        company_unread_count = (
+            SELECT COUNT(*) FROM messages msg
+            WHERE msg.match_id = m.id AND msg.sender_type = 'seeker' AND msg.read_at IS NULL
+        )
+    WHERE m.id IN (SELECT DISTINCT keep_id FROM duplicate_matches);
+END $$;
@@ -0,0 +1,121 @@
+-- 관심 표시 + 양방향 매칭 성사를 한 번의 서버 측 트랜잭션으로 처리
+-- 중복 확인 → 관심 저장 → 역방향 관심 조회 → 매칭 생성 → 상태 갱신을 create_interest RPC 한 번으로 수행하고,
+-- 유니크 제약으로 동시에 들어온 요청도 관심/매칭이 중복 생성되지 않음
+
+-- 요구 사항: PostgreSQL 15 이상 (UNIQUE NULLS NOT DISTINCT)
+-- 기존 중복 관심/매칭은 이 마이그레이션이 지우지 않습니다. 011_dedupe_matching_data.sql을 먼저 실행하세요.
+
+-- ==========================================
+-- 사전 확인 (조건이 맞지 않으면 아무것도 바꾸지 않고 중단)
+-- ==========================================
+
+DO $$
+DECLARE
+    v_duplicate_interests BIGINT;
+    v_duplicate_matches BIGINT;
+BEGIN
+    IF current_setting('server_version_num')::INT < 150000 THEN
+        RAISE EXCEPTION 'UNIQUE NULLS NOT DISTINCT requires PostgreSQL 15+ (server %)',
+            current_setting('server_version');
+    END IF;
+
+    SELECT COUNT(*) INTO v_duplicate_interests FROM (
+        SELECT 1 FROM interests GROUP BY from_type, from_id, to_id HAVING COUNT(*) > 1
+    ) d;
+    SELECT COUNT(*) INTO v_duplicate_matches FROM (
+        SELECT 1 FROM matches GROUP BY seeker_profile_id, company_id, job_posting_id HAVING COUNT(*) > 1
+    ) d;
+
+    IF v_duplicate_interests > 0 OR v_duplicate_matches > 0 THEN
+        RAISE EXCEPTION
+            'duplicate interests (% groups) / matches (% groups) exist; run 011_dedupe_matching_data.sql first',
+            v_duplicate_interests, v_duplicate_matches;
+    END IF;
+END $$;
+
+-- ==========================================
+-- 유니크 제약
+-- ==========================================
+
+ALTER TABLE interests
+    ADD CONSTRAINT uq_interests_from_to UNIQUE (from_type, from_id, to_id);
+
+-- 공고 없는 매칭(job_posting_id NULL)도 쌍당 하나 (NULLS NOT DISTINCT — PostgreSQL 15+)
+ALTER TABLE matches
+    ADD CONSTRAINT uq_matches_seeker_company_job
+    UNIQUE NULLS NOT DISTINCT (seeker_profile_id, company_id, job_posting_id);
+
+-- 역방향 pending 관심 조회
+CREATE INDEX IF NOT EXISTS idx_interests_reverse_pending
+    ON interests(from_type, from_id, to_id) WHERE status = 'pending';
+
+-- ==========================================
+-- 관심 표시 RPC
+-- ==========================================
+
+-- 반환: {"duplicate": true} 또는 {"duplicate": false, "interest": 저장된 관심, "match": 성사된 매칭 | null}
+-- p_fit_score는 API 서버가 캐시된 구직자/기업/공고 데이터로 미리 계산한 매칭 점수
+CREATE OR REPLACE FUNCTION create_interest(
+    p_from_type TEXT,
+    p_from_id UUID,
+    p_to_type TEXT,
+    p_to_id UUID,
+    p_job_posting_id UUID,
+    p_message TEXT,
+    p_fit_score JSONB
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_seeker_id UUID := CASE WHEN p_from_type = 'seeker' THEN p_from_id ELSE p_to_id END;
+    v_company_id UUID := CASE WHEN p_from_type = 'seeker' THEN p_to_id ELSE p_from_id END;
+    v_interest interests;
+    v_reverse_id UUID;
+    v_match matches;
+BEGIN
+    INSERT INTO interests (from_type, from_id, to_type, to_id, job_posting_id, message)
+    VALUES (p_from_type, p_from_id, p_to_type, p_to_id, p_job_posting_id, p_message)
+    ON CONFLICT ON CONSTRAINT uq_interests_from_to DO NOTHING
+    RETURNING * INTO v_interest;
+
+    IF v_interest.id IS NULL THEN
+        RETURN jsonb_build_object('duplicate', true);
+    END IF;
+
+    -- 같은 (구직자, 기업) 쌍의 요청을 트랜잭션 끝까지 직렬화.
+    -- 잠금을 얻은 뒤의 조회는 먼저 커밋된 반대쪽 관심을 반드시 보므로
+    -- 동시에 서로 관심을 보내도 매칭은 정확히 한 번 성사됨
+    PERFORM pg_advisory_xact_lock(hashtextextended(v_seeker_id::text || ':' || v_company_id::text, 0));
+
+    SELECT id INTO v_reverse_id
+    FROM interests
+    WHERE from_type = p_to_type
+      AND from_id = p_to_id
+      AND to_id = p_from_id
+      AND status = 'pending'
+    LIMIT 1
+    FOR UPDATE;
+
+    IF v_reverse_id IS NOT NULL THEN
+        INSERT INTO matches (seeker_profile_id, company_id, job_posting_id, fit_score)
+        VALUES (v_seeker_id, v_company_id, p_job_posting_id, p_fit_score)
+        ON CONFLICT ON CONSTRAINT uq_matches_seeker_company_job DO NOTHING
+        RETURNING * INTO v_match;
+
+        IF v_match.id IS NULL THEN
+            SELECT * INTO v_match
+            FROM matches
+            WHERE seeker_profile_id = v_seeker_id
+              AND company_id = v_company_id
+              AND job_posting_id IS NOT DISTINCT FROM p_job_posting_id;
+        END IF;
+
+        UPDATE interests SET status = 'accepted' WHERE id IN (v_reverse_id, v_interest.id);
+    END IF;
+
+    RETURN jsonb_build_object(
+        'duplicate', false,
+        'interest', to_jsonb(v_interest),
+        'match', CASE WHEN v_match.id IS NULL THEN NULL ELSE to_jsonb(v_match) END
+    );
+END;
+$$ LANGUAGE plpgsql;
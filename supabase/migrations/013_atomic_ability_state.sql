@@ -0,0 +1,85 @@
+-- 검사 결과 하나의 능력치 기여분을 서버 측에서 한 번에 누적
+-- 읽기 → 파이썬에서 합산 → 전체 덮어쓰기 대신 apply_ability_result RPC가 상태 행을 잠근 채 JSONB를 갱신하므로
+-- 동시에 완료된 검사의 기여분이 유실되지 않고, 같은 결과가 두 번 들어와도 한 번만 반영됨
+
+-- ==========================================
+-- 반영한 검사 결과 ID (결과 단위 멱등성)
+-- ==========================================
+
+ALTER TABLE user_ability_states
+    ADD COLUMN IF NOT EXISTS applied_results UUID[] NOT NULL DEFAULT '{}';
+
+-- 기존 상태는 마지막 갱신 시각까지 저장된 결과를 모두 반영한 것으로 봄
+UPDATE user_ability_states s SET applied_results = ARRAY(
+    SELECT r.id FROM test_results r
+    WHERE r.user_id = s.user_id AND r.created_at <= s.updated_at
+    ORDER BY r.id
+)
+WHERE s.applied_results = '{}';
+
+-- ==========================================
+-- 기여분 누적 RPC
+-- ==========================================
+
+-- p_scores: {능력치 코드: 점수} (이 결과의 유효한 능력치만)
+-- 반환: 갱신된(또는 이미 반영되어 그대로인) 상태, 상태 행이 아직 없으면 NULL (호출자가 전체 재계산)
+CREATE OR REPLACE FUNCTION apply_ability_result(
+    p_user_id UUID,
+    p_result_id UUID,
+    p_test_code TEXT,
+    p_scores JSONB
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_state user_ability_states;
+BEGIN
+    -- 같은 사용자의 동시 완료를 행 잠금으로 직렬화
+    SELECT * INTO v_state FROM user_ability_states WHERE user_id = p_user_id FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    IF p_result_id = ANY(v_state.applied_results) THEN
+        RETURN to_jsonb(v_state);
+    END IF;
+
+    -- 점수 합계는 float8로 더해 파이썬 누적(apply_test_result)과 같은 값을 유지
+    UPDATE user_ability_states s SET
+        score_sums = s.score_sums || COALESCE((
+            SELECT jsonb_object_agg(e.key, COALESCE((s.score_sums ->> e.key)::float8, 0) + e.value::float8)
+            FROM jsonb_each_text(p_scores) e
+        ), '{}'),
+        score_counts = s.score_counts || COALESCE((
+            SELECT jsonb_object_agg(e.key, COALESCE((s.score_counts ->> e.key)::int, 0) + 1)
+            FROM jsonb_each_text(p_scores) e
+        ), '{}'),
+        source_tests = s.source_tests || COALESCE((
+            SELECT jsonb_object_agg(e.key, COALESCE(s.source_tests -> e.key, '[]') || to_jsonb(p_test_code))
+            FROM jsonb_each_text(p_scores) e
+        ), '{}'),
+        completed_tests = s.completed_tests || to_jsonb(p_test_code),
+        applied_results = array_append(s.applied_results, p_result_id)
+    WHERE s.user_id = p_user_id
+    RETURNING s.* INTO v_state;
+
+    -- 이 결과가 기여한 능력치만 user_abilities 갱신 (같은 잠금 안에서 쓰므로 순서가 뒤바뀌지 않음)
+    INSERT INTO user_abilities (user_id, ability_id, score, confidence, source_tests, calculated_at)
+    SELECT
+        p_user_id,
+        a.id,
+        (v_state.score_sums ->> a.code)::float8 / (v_state.score_counts ->> a.code)::int,
+        LEAST((v_state.score_counts ->> a.code)::int / 3.0, 1.0),
+        v_state.source_tests -> a.code,
+        NOW()
+    FROM abilities a
+    WHERE p_scores ? a.code
+    ON CONFLICT (user_id, ability_id) DO UPDATE SET
+        score = EXCLUDED.score,
+        confidence = EXCLUDED.confidence,
+        source_tests = EXCLUDED.source_tests,
+        calculated_at = EXCLUDED.calculated_at;
+
+    RETURN to_jsonb(v_state);
+END;
+$$ LANGUAGE plpgsql;
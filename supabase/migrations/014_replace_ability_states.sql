@@ -0,0 +1,98 @@
+-- 능력치 상태 전체 교체(재계산·백필)를 compare-and-swap으로 처리
+-- 재계산은 검사 결과를 읽고 파이썬에서 상태를 만든 뒤 덮어쓰므로, 그 사이 apply_ability_result(013)가
+-- 누적한 결과가 있으면 덮어쓰면서 유실됨. replace_ability_states RPC는 상태 행을 잠근 채
+-- applied_results가 읽을 때의 스냅샷과 같은 사용자만 교체하고, 나머지는 호출자가 다시 읽어 재시도
+
+-- ==========================================
+-- 상태 교체 RPC
+-- ==========================================
+
+-- p_states: [{user_id, expected_results, score_sums, score_counts, source_tests, completed_tests, applied_results}]
+--   expected_results: 읽을 때 저장돼 있던 applied_results (상태 행이 없었으면 null)
+-- 반환: 스냅샷 이후 상태가 바뀌어 교체하지 않은 사용자 ID
+CREATE OR REPLACE FUNCTION replace_ability_states(p_states JSONB)
+RETURNS UUID[] AS $$
+DECLARE
+    v_item JSONB;
+    v_user_id UUID;
+    v_current UUID[];
+    v_expected UUID[];
+    v_conflicts UUID[] := '{}';
+BEGIN
+    FOR v_item IN SELECT * FROM jsonb_array_elements(p_states) LOOP
+        v_user_id := (v_item ->> 'user_id')::uuid;
+
+        IF jsonb_typeof(v_item -> 'expected_results') = 'array' THEN
+            v_expected := ARRAY(
+                SELECT e::uuid FROM jsonb_array_elements_text(v_item -> 'expected_results') e ORDER BY 1
+            );
+        ELSE
+            v_expected := NULL;
+        END IF;
+
+        -- apply_ability_result와 같은 행 잠금으로 직렬화
+        SELECT applied_results INTO v_current FROM user_ability_states WHERE user_id = v_user_id FOR UPDATE;
+
+        IF FOUND THEN
+            IF v_expected IS NULL
+               OR ARRAY(SELECT r FROM unnest(v_current) r ORDER BY 1) IS DISTINCT FROM v_expected THEN
+                v_conflicts := array_append(v_conflicts, v_user_id);
+                CONTINUE;
+            END IF;
+
+            UPDATE user_ability_states SET
+                score_sums = v_item -> 'score_sums',
+                score_counts = v_item -> 'score_counts',
+                source_tests = v_item -> 'source_tests',
+                completed_tests = v_item -> 'completed_tests',
+                applied_results = ARRAY(SELECT e::uuid FROM jsonb_array_elements_text(v_item -> 'applied_results') e)
+            WHERE user_id = v_user_id;
+        ELSE
+            IF v_expected IS NOT NULL THEN
+                v_conflicts := array_append(v_conflicts, v_user_id);
+                CONTINUE;
+            END IF;
+
+            INSERT INTO user_ability_states (
+                user_id, score_sums, score_counts, source_tests, completed_tests, applied_results
+            ) VALUES (
+                v_user_id,
+                v_item -> 'score_sums',
+                v_item -> 'score_counts',
+                v_item -> 'source_tests',
+                v_item -> 'completed_tests',
+                ARRAY(SELECT e::uuid FROM jsonb_array_elements_text(v_item -> 'applied_results') e)
+            )
+            ON CONFLICT (user_id) DO NOTHING;
+
+            -- 동시에 다른 요청이 먼저 만들었으면 그 상태를 지우지 않음
+            IF NOT FOUND THEN
+                v_conflicts := array_append(v_conflicts, v_user_id);
+                CONTINUE;
+            END IF;
+        END IF;
+
+        -- 능력치별 점수 (ability_service._aggregate와 같은 규칙: 결과가 없는 능력치는 10점, 신뢰도 0)
+        INSERT INTO user_abilities (user_id, ability_id, score, confidence, source_tests, calculated_at)
+        SELECT
+            v_user_id,
+            a.id,
+            COALESCE(
+                (v_item -> 'score_sums' ->> a.code)::float8
+                    / NULLIF((v_item -> 'score_counts' ->> a.code)::int, 0),
+                10
+            ),
+            LEAST(COALESCE((v_item -> 'score_counts' ->> a.code)::int, 0) / 3.0, 1.0),
+            COALESCE(v_item -> 'source_tests' -> a.code, '[]'),
+            NOW()
+        FROM abilities a
+        ON CONFLICT (user_id, ability_id) DO UPDATE SET
+            score = EXCLUDED.score,
+            confidence = EXCLUDED.confidence,
+            source_tests = EXCLUDED.source_tests,
+            calculated_at = EXCLUDED.calculated_at;
+    END LOOP;
+
+    RETURN v_conflicts;
+END;
+$$ LANGUAGE plpgsql;